@@ -0,0 +1,217 @@
+import os
+import sys
+# Add parent directory to Python path to find the controllers module
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+import tkinter as tk
+from tkinter import ttk
+from service.client import admin_controller, RemoteAdminController
+
+try:
+    from .popup import error, centre
+    from .theme import apply_theme_to_window, COLORS, FONTS, create_header
+    from .background import TaskRunner, BusyIndicator, toggle
+except ImportError:
+    from popup import error, centre
+    from theme import apply_theme_to_window, COLORS, FONTS, create_header
+    from background import TaskRunner, BusyIndicator, toggle
+
+ROWS = 18                                   # rows the tree actually holds
+GRADES = ("All", "HD", "D", "C", "P", "Z")
+
+GRADE_COLORS = {
+    "HD": COLORS["success"],
+    "D": COLORS["info"],
+    "C": COLORS["warning"],
+    "P": COLORS["neutral"],
+    "Z": COLORS["danger"],
+}
+
+
+class AdminWindow(tk.Toplevel):
+    """
+    Admin listing of every student, optionally filtered by overall grade.
+
+    The Treeview is virtualised: it only ever holds the ROWS students in
+    view.  Scrolling moves an offset into the admin controller's sorted
+    ID order and re-fills those rows, so 100k+ students scroll as fast
+    as 100.  Loading / refreshing runs on the background worker, and so
+    does every scroll when the rows come from the student service (each
+    one is a socket round-trip).
+    """
+
+    def __init__(self, master, admin=None):
+        super().__init__(master)
+        self.title("GUIUniApp – Admin")
+        centre(self, 720, 600)
+        apply_theme_to_window(self)
+
+        self.admin = admin
+        self.offset = 0
+        self.total = 0
+        self.target = 0                             # latest requested offset
+        self._pending = None                        # (offset, grade) awaiting the worker
+        self.tasks = TaskRunner(self)
+        self.protocol("WM_DELETE_WINDOW", self._close)
+
+        create_header(self, "Students by Grade")
+
+        # ---------- filter bar ----------------------------------
+        bar = tk.Frame(self, bg=COLORS["background"], padx=20, pady=10)
+        bar.pack(fill=tk.X)
+        tk.Label(bar, text="Grade", bg=COLORS["background"], font=FONTS["body"],
+                 fg=COLORS["text"]).pack(side=tk.LEFT)
+        self.grade = tk.StringVar(value="All")
+        self.filter = ttk.Combobox(bar, textvariable=self.grade, values=GRADES,
+                                   state="readonly", width=6)
+        self.filter.pack(side=tk.LEFT, padx=8)
+        self.filter.bind("<<ComboboxSelected>>", lambda _: self._jump(0))
+
+        refresh_btn = ttk.Button(bar, text="Refresh", width=10, command=self._load)
+        refresh_btn.pack(side=tk.RIGHT)
+        self.status = tk.Label(bar, text="", bg=COLORS["background"],
+                               font=FONTS["small"], fg=COLORS["text"])
+        self.status.pack(side=tk.RIGHT, padx=10)
+
+        self.counts = tk.Label(self, text="", bg=COLORS["background"],
+                               font=FONTS["small"], fg=COLORS["text"])
+        self.counts.pack(fill=tk.X, padx=20)
+
+        # ---------- virtual list ---------------------------------
+        content = tk.Frame(self, bg=COLORS["background"], padx=20)
+        content.pack(fill=tk.BOTH, expand=True)
+
+        columns = ("id", "name", "email", "average", "grade")
+        self.tree = ttk.Treeview(content, columns=columns, show="headings",
+                                 height=ROWS, selectmode="browse")
+        for col, text, width in (("id", "Student ID", 90), ("name", "Name", 160),
+                                 ("email", "Email", 230), ("average", "Average", 80),
+                                 ("grade", "Grade", 60)):
+            self.tree.heading(col, text=text)
+            self.tree.column(col, width=width, anchor=tk.W if col in ("name", "email") else tk.CENTER)
+        for grade, color in GRADE_COLORS.items():
+            self.tree.tag_configure(grade, background=color)
+
+        # the scrollbar tracks the position in the WHOLE list, not the tree
+        self.scrollbar = ttk.Scrollbar(content, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        content.grid_columnconfigure(0, weight=1)
+        content.grid_rowconfigure(0, weight=1)
+
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self._on_wheel)
+        self.tree.bind("<Prior>", lambda _: self._jump(self.target - ROWS))
+        self.tree.bind("<Next>", lambda _: self._jump(self.target + ROWS))
+        self.tree.bind("<Home>", lambda _: self._jump(0))
+        self.tree.bind("<End>", lambda _: self._jump(self.total))
+
+        # ---------- footer ---------------------------------------
+        footer = tk.Frame(self, bg=COLORS["background"], pady=10)
+        footer.pack(fill=tk.X)
+        self.busy = BusyIndicator(footer, text="Loading…")
+        self.busy.pack(side=tk.LEFT, padx=20)
+        ttk.Button(footer, text="Close", width=12, command=self._close).pack(side=tk.RIGHT, padx=20)
+
+        self.tasks.on_busy(self.busy.set)
+        self.tasks.on_busy(toggle([refresh_btn, self.filter]))
+        self._load()
+
+    # ---------- data ----------------------------------------------
+    def _selected_grade(self):
+        grade = self.grade.get()
+        return None if grade == "All" else grade
+
+    def _load(self):
+        """(Re)load the population and grade counts on the worker thread."""
+        self.tasks.submit(self._fetch, on_done=self._loaded,
+                          on_error=lambda exc: error(f"Could not load students: {exc}"))
+
+    def _fetch(self):
+        admin = self.admin or admin_controller()
+        admin.count()                               # builds the sorted order
+        return admin, admin.counts()
+
+    def _loaded(self, result):
+        self.admin, counts = result
+        self.counts.configure(text="   ".join(
+            f"{g}: {counts.get(g, 0):,}" for g in GRADES[1:]))
+        self._jump(self.offset)
+
+    # ---------- viewport ------------------------------------------
+    def _jump(self, offset):
+        """Show ROWS students starting at `offset` (clamped)."""
+        if self.admin is None:
+            return
+        grade = self._selected_grade()
+        self.target = max(0, min(offset, self.total - ROWS))
+        if not isinstance(self.admin, RemoteAdminController):
+            self._shown(self._window(self.admin, offset, grade))   # in memory: instant
+            return
+        self._pending = (offset, grade)             # latest request wins
+        self._request()
+
+    def _request(self):
+        if self._pending is None or self.tasks.busy:
+            return                                  # _shown() picks it up next
+        offset, grade = self._pending
+        self._pending = None
+        self.tasks.submit(self._window, self.admin, offset, grade, on_done=self._shown,
+                          on_error=lambda exc: error(f"Could not load students: {exc}"))
+
+    @staticmethod
+    def _window(admin, offset, grade):
+        total = admin.count(grade, check=False)
+        offset = max(0, min(offset, total - ROWS))
+        return offset, total, admin.window(offset, ROWS, grade, check=False)
+
+    def _shown(self, result):
+        self.offset, self.total, students = result
+        if self._pending is None:
+            self.target = self.offset
+        self._render(students)
+        self._request()                             # scrolled again meanwhile?
+
+    def _render(self, students):
+        self.tree.delete(*self.tree.get_children())
+        for s in students:
+            self.tree.insert("", tk.END, values=(s.id, s.name, s.email,
+                                                 f"{s.average_mark:.2f}", s.overall_grade),
+                             tags=(s.overall_grade,))
+        if self.total:
+            self.scrollbar.set(self.offset / self.total,
+                               min(1.0, (self.offset + ROWS) / self.total))
+            last = min(self.offset + ROWS, self.total)
+            self.status.configure(text=f"{self.offset + 1}–{last} of {self.total:,}")
+        else:
+            self.scrollbar.set(0.0, 1.0)
+            self.status.configure(text="No students")
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self._jump(int(float(amount) * self.total))
+        elif action == "scroll":
+            step = ROWS if unit == "pages" else 1
+            self._jump(self.target + int(amount) * step)
+
+    def _on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self._jump(self.target - 3)
+        else:
+            self._jump(self.target + 3)
+        return "break"                              # the tree has nothing to scroll
+
+    def _close(self):
+        self.tasks.close()
+        self.destroy()
+
+
+# For standalone use:  python GUIUniApp/admin_win.py
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.withdraw()
+    win = AdminWindow(root)
+    win.bind("<Destroy>", lambda e: root.destroy() if e.widget is win else None)
+    root.mainloop()
@@ -0,0 +1,125 @@
+"""
+Background work for the GUI windows.
+
+• TaskRunner executes blocking calls (load / login / persist) on ONE
+  worker thread so the Tk main loop never freezes.
+• Results are queued and picked up on the Tk thread by `root.after`
+  polling – Tk widgets are only ever touched from the main thread.
+• One task at a time: `submit()` refuses new work while a task is in
+  flight, which is what protects against double-clicks.
+• BusyIndicator is a small status line + progress bar that windows
+  show while the runner is busy.
+"""
+
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk
+
+try:
+    from .theme import COLORS, FONTS
+except ImportError:
+    from theme import COLORS, FONTS
+
+
+class TaskRunner:
+    """Runs callables on a worker thread; callbacks come back on the Tk thread."""
+
+    def __init__(self, root, poll_ms=50):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._in_flight = False
+        self._listeners = []          # called with True / False on busy changes
+        self._thread = threading.Thread(target=self._work, daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self):
+        return self._in_flight
+
+    def on_busy(self, callback):
+        """Register `callback(busy: bool)` – e.g. to disable buttons."""
+        self._listeners.append(callback)
+        callback(self._in_flight)
+
+    def submit(self, fn, *args, on_done=None, on_error=None):
+        """
+        Run `fn(*args)` in the background.  `on_done(result)` or
+        `on_error(exc)` is then called on the Tk thread.  Returns False
+        (and does nothing) if a task is already running.
+        """
+        if self._in_flight:
+            return False
+        self._set_busy(True)
+        self._jobs.put((fn, args, on_done, on_error))
+        self.root.after(self.poll_ms, self._poll)
+        return True
+
+    def close(self):
+        """Stop the worker once the current task (if any) has finished."""
+        self._jobs.put(None)
+
+    # ---------- internals -----------------------------------
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            fn, args, on_done, on_error = job
+            try:
+                self._results.put((on_done, fn(*args), None, on_error))
+            except Exception as exc:          # delivered to the Tk thread
+                self._results.put((on_done, None, exc, on_error))
+
+    def _poll(self):
+        try:
+            on_done, result, exc, on_error = self._results.get_nowait()
+        except queue.Empty:
+            try:
+                self.root.after(self.poll_ms, self._poll)
+            except tk.TclError:               # window closed meanwhile
+                self.close()
+            return
+
+        self._set_busy(False)
+        if exc is not None:
+            if on_error is None:
+                raise exc
+            on_error(exc)
+        elif on_done is not None:
+            on_done(result)
+
+    def _set_busy(self, busy):
+        self._in_flight = busy
+        for callback in self._listeners:
+            callback(busy)
+
+
+class BusyIndicator(tk.Frame):
+    """'Working…' label with an indeterminate progress bar, hidden when idle."""
+
+    def __init__(self, parent, text="Working…"):
+        super().__init__(parent, bg=COLORS["background"])
+        self._label = tk.Label(self, text=text, font=FONTS["small"],
+                               fg=COLORS["text"], bg=COLORS["background"])
+        self._bar = ttk.Progressbar(self, mode="indeterminate", length=120)
+
+    def set(self, busy):
+        if busy:
+            self._label.pack(side=tk.LEFT, padx=5)
+            self._bar.pack(side=tk.LEFT, padx=5)
+            self._bar.start(15)
+        else:
+            self._bar.stop()
+            self._label.pack_forget()
+            self._bar.pack_forget()
+
+
+def toggle(widgets):
+    """Busy-listener that disables `widgets` while a task runs."""
+    def apply(busy):
+        for w in widgets:
+            w.state(["disabled"] if busy else ["!disabled"])
+    return apply
@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
-from data.database import save
+from utils.profiling import profiled
 
 # Use try-except to handle both module and direct file execution
 try:
@@ -8,11 +8,13 @@ try:
     from .popup import info, error, centre
     from .subject_win import SubjectWindow
     from .theme import apply_theme_to_window, COLORS, FONTS, create_header
+    from .background import TaskRunner, BusyIndicator, toggle
 except ImportError:
     # When running directly
     from popup import info, error, centre
     from subject_win import SubjectWindow
     from theme import apply_theme_to_window, COLORS, FONTS, create_header
+    from background import TaskRunner, BusyIndicator, toggle
 
 
 class EnrolmentWindow:
@@ -22,6 +24,7 @@ class EnrolmentWindow:
         self.root = root
         self.student = student
         self.controller = controller
+        self.tasks = TaskRunner(root)  # saves run off the Tk thread
         self.on_logout = None  # Callback for logout
 
         if isinstance(root, tk.Tk):
@@ -65,20 +68,49 @@ class EnrolmentWindow:
         logout_btn = ttk.Button(content_frame, text="Logout", width=14, command=self._logout)
         logout_btn.pack(pady=10)
 
+        # "Saving…" indicator; buttons stay disabled until the save lands
+        self.busy = BusyIndicator(content_frame, text="Saving…")
+        self.busy.pack()
+        self.tasks.on_busy(self.busy.set)
+        self.tasks.on_busy(toggle([enrol_btn, view_btn, logout_btn]))
+
     # ---------- Call-backs ----------------------------------
     def _enrol(self):
+        self.tasks.submit(self._enrol_and_save, on_done=self._enrolled,
+                          on_error=self._save_failed)
+
+    @profiled("gui-enrol")
+    def _enrol_and_save(self):
+        """Worker thread: enrol, then write the student's new state."""
         ok, res = self.student.enrol()
         if ok:
-            save(self.controller.students)
+            self.controller.persist(self.student)
+        return ok, res
+
+    def _enrolled(self, outcome):
+        ok, res = outcome
+        if ok:
             info(f"Enrolled in subject {res.id} (mark={res.mark})")
         else:
             error(res)      # res already contains "limit reached" msg
 
+    def _persist(self):
+        """Worker thread: write the student's current state."""
+        self.controller.persist(self.student)
+
+    def _save_failed(self, exc):
+        error(f"Could not save your changes: {exc}")
+
+    @profiled("gui-show-subjects")
     def _show_subjects(self):
         SubjectWindow(self.root, self.student)   # modal pop-up
 
     def _logout(self):
-        save(self.controller.students)
+        self.tasks.submit(self._persist, on_done=self._logged_out,
+                          on_error=self._save_failed)
+
+    def _logged_out(self, _):
+        self.tasks.close()
         if self.on_logout:
             self.on_logout()
         else:
@@ -6,17 +6,20 @@ sys.path.append(parent_dir)
 
 import tkinter as tk
 from tkinter import ttk
-from controllers.student_controller import StudentController
+from service.client import student_controller
+from utils.profiling import profiled
 
 # Use try-except to handle both module and direct file execution
 try:
     # When running as a module
     from .popup import error, centre
     from .theme import apply_theme_to_window, COLORS, FONTS, create_header
+    from .background import TaskRunner, BusyIndicator, toggle
 except ImportError:
     # When running directly
     from popup import error, centre
     from theme import apply_theme_to_window, COLORS, FONTS, create_header
+    from background import TaskRunner, BusyIndicator, toggle
 
 class LoginWindow:
     """Main window – students authenticate here."""
@@ -32,7 +35,8 @@ class LoginWindow:
             # If root is a frame
             root.configure(background=COLORS["background"])
             
-        self.ctrl = StudentController()
+        self.ctrl = None                 # built on the worker (it loads the database)
+        self.tasks = TaskRunner(root)
         self.on_successful_login = None  # Callback for successful login
         
         # Create header
@@ -69,13 +73,38 @@ class LoginWindow:
         btn_frame = tk.Frame(content_frame, bg=COLORS["background"])
         btn_frame.grid(row=2, column=1, pady=20, sticky="e")
         
+        admin_btn = ttk.Button(btn_frame, text="Admin View", width=14, command=self._open_admin)
+        admin_btn.pack(side=tk.LEFT, padx=(0, 10))
+
         login_btn = ttk.Button(btn_frame, text="Login", width=14, command=self._attempt_login)
-        login_btn.pack()
-        
+        login_btn.pack(side=tk.LEFT)
+
+        # Busy indicator (loading / checking credentials)
+        self.busy = BusyIndicator(content_frame)
+        self.busy.grid(row=3, column=0, columnspan=2)
+        self.tasks.on_busy(self.busy.set)
+        self.tasks.on_busy(toggle([login_btn]))
+
         # Make the grid expandable
         content_frame.grid_columnconfigure(1, weight=1)
 
+        # Load the student database without blocking the window
+        self.tasks.submit(student_controller, on_done=self._loaded, on_error=self._failed)
+
     # ---------- Call-backs ----------------------------------
+    def _loaded(self, controller):
+        self.ctrl = controller
+
+    def _failed(self, exc):
+        error(f"Could not reach the student database: {exc}")
+
+    def _open_admin(self):
+        try:
+            from .admin_win import AdminWindow
+        except ImportError:
+            from admin_win import AdminWindow
+        AdminWindow(self.root)
+
     def _attempt_login(self):
         email = self.email.get().strip()
         pwd = self.pwd.get()
@@ -83,8 +112,19 @@ class LoginWindow:
         if not email or not pwd:
             error("Both fields are required.")
             return
+        if self.ctrl is None:           # still loading (button is disabled)
+            return
+
+        self.tasks.submit(self._login, email, pwd,
+                          on_done=self._logged_in, on_error=self._failed)
+
+    @profiled("gui-login")
+    def _login(self, email, pwd):
+        """Worker thread: check credentials against the database."""
+        return self.ctrl.login(email, pwd)
 
-        ok, student = self.ctrl.login(email, pwd)
+    def _logged_in(self, outcome):
+        ok, student = outcome
         if not ok:
             error("Incorrect email or password.")
             return
@@ -94,6 +134,7 @@ class LoginWindow:
             self.on_successful_login(student)
         else:
             # Original behavior (not recommended)
+            self.tasks.close()
             self.root.destroy()
             top = tk.Tk()
             
@@ -0,0 +1,44 @@
+"""
+benchmarks/bench_ids.py
+───────────────────────
+Cost of allocating student IDs at high fill ratios of the 6-digit space.
+
+    python -m benchmarks.bench_ids
+"""
+
+import sys
+import time
+import random
+import pathlib
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from utils.id_allocator import IdAllocator
+
+_CAPACITY = 999_999
+_BATCH = 1_000
+
+
+def _filled(ratio: float) -> IdAllocator:
+    ids = IdAllocator(_CAPACITY, 6)
+    for code in random.sample(range(1, _CAPACITY + 1), int(_CAPACITY * ratio)):
+        ids.reserve(f"{code:06d}")
+    return ids
+
+
+def _time_per_id(ids: IdAllocator, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        ids.allocate()
+    return (time.perf_counter() - start) / n
+
+
+def main() -> None:
+    print(f"{'fill':>8}  {'µs/alloc':>9}")
+    for ratio in (0.5, 0.9, 0.99, 0.999, 0.9999):
+        ids = _filled(ratio)
+        n = min(_BATCH, _CAPACITY - int(_CAPACITY * ratio))
+        print(f"{ratio:>8}  {_time_per_id(ids, n) * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
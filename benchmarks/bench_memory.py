@@ -0,0 +1,37 @@
+"""
+benchmarks/bench_memory.py
+──────────────────────────
+Bytes per hydrated Student (4 subjects each), measured with tracemalloc.
+
+Parses a JSON blob exactly like `database.load()` does and counts what
+is still alive once the intermediate dicts are dropped.
+
+    python -m benchmarks.bench_memory [N]
+"""
+
+import sys
+import json
+import pathlib
+import tracemalloc
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from models.student import Student
+from benchmarks.population import make_record
+
+
+def bytes_per_student(n: int = 100_000) -> float:
+    blob = json.dumps([make_record(i) for i in range(n)])
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    raw = json.loads(blob)
+    students = [Student.from_dict(d) for d in raw]
+    del raw
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(students) == n
+    return (used - base) / n
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{n} students: {bytes_per_student(n):.0f} bytes/student")
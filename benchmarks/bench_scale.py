@@ -0,0 +1,72 @@
+"""
+benchmarks/bench_scale.py
+─────────────────────────
+Hot paths at 1k … 1M students (see benchmarks/conftest.py for knobs).
+
+    python -m pytest benchmarks/bench_scale.py -q
+    UNIAPP_BENCH_SIZES=1000,10000,100000,1000000 python -m pytest benchmarks/bench_scale.py -q
+"""
+
+import itertools
+from data import database, snapshot_cache
+from controllers.student_controller import StudentController
+from controllers.admin_controller import AdminController
+from models.student import Student
+
+_fresh = itertools.count()
+
+
+def _new_student() -> Student:
+    i = next(_fresh)
+    return Student(f"New {i}", f"new{i}@university.com", "Abcde123")
+
+
+# ── persistence ---------------------------------------------------
+def test_database_load(population, bench):
+    bench("database.load", database.load)
+
+
+def test_database_save(population, bench):
+    students = database.load()
+    bench("database.save", lambda: database.save(students))
+
+
+# ── student controller --------------------------------------------
+def test_student_login(population, bench):
+    ctrl = StudentController()
+    email = f"student{population - 1}@university.com"
+    bench("StudentController.login", lambda: ctrl.login(email, "Abcde123"))
+
+
+def test_student_register(population, bench):
+    ctrl = StudentController()
+    bench("StudentController.register",
+          lambda stu: ctrl.register(stu.name, stu.email, "Abcde123"),
+          setup=_new_student)
+
+
+def test_student_enrol(population, bench):
+    bench("Student.enrol", lambda stu: stu.enrol(), setup=_new_student)
+
+
+# ── admin controller ----------------------------------------------
+def _admin_cold() -> AdminController:
+    snapshot_cache.invalidate()
+    return AdminController()
+
+
+def test_admin_group_by_grade(population, bench):
+    bench("AdminController.group_by_grade",
+          lambda admin: admin.group_by_grade(), setup=_admin_cold)
+
+
+def test_admin_partition_pass_fail(population, bench):
+    bench("AdminController.partition_pass_fail",
+          lambda admin: admin.partition_pass_fail(), setup=_admin_cold)
+
+
+def test_admin_remove_student(population, bench):
+    ids = iter(f"{i + 1:06d}" for i in range(population))
+    admin = AdminController()
+    bench("AdminController.remove_student",
+          lambda sid: admin.remove_student(sid), setup=lambda: next(ids))
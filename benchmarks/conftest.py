@@ -0,0 +1,102 @@
+"""
+Fixtures for the scale benchmarks (run explicitly, not part of `pytest`):
+
+    python -m pytest benchmarks/bench_scale.py -q
+
+• patch_data_file – same idea as tests/conftest.py: every benchmark
+  works on a throw-away students.data inside tmp_path.
+• population      – a synthetic database of N students, N taken from
+  UNIAPP_BENCH_SIZES (default "1000,10000"; the full matrix is
+  "1000,10000,100000,1000000").
+• bench           – times a callable (best of a few runs) and records
+  its tracemalloc peak.
+
+Results go to benchmarks/results.json and are compared against
+benchmarks/baseline.json; UNIAPP_BENCH_UPDATE=1 rewrites the baseline.
+"""
+
+import os
+import sys
+import json
+import time
+import pathlib
+import tracemalloc
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+import pytest
+from data import database, snapshot_cache
+from benchmarks.population import write_population
+
+_HERE = pathlib.Path(__file__).resolve().parent
+_BASELINE = _HERE / "baseline.json"
+_RESULTS = _HERE / "results.json"
+_SIZES = [int(n) for n in os.environ.get("UNIAPP_BENCH_SIZES", "1000,10000").split(",")]
+_TOLERANCE = 1.25          # slower than baseline × this ⇒ flagged
+
+_results: dict = {}
+
+
+@pytest.fixture(autouse=True)
+def patch_data_file(tmp_path, monkeypatch):
+    """Redirect the global _DB_FILE to a temp file for every benchmark."""
+    fake = tmp_path / "students.data"
+    fake.write_text("[]")
+    monkeypatch.setattr(database, "_DB_FILE", fake)
+    snapshot_cache.invalidate()
+    yield
+
+
+@pytest.fixture(params=_SIZES, ids=lambda n: f"{n}")
+def population(request):
+    """Fill the patched students.data with N synthetic students; returns N."""
+    write_population(database._DB_FILE, request.param)
+    snapshot_cache.invalidate()
+    return request.param
+
+
+@pytest.fixture
+def bench(request):
+    """bench(name, fn, setup=None, repeat=3) → best wall time in seconds."""
+    def run(name, fn, setup=None, repeat=3):
+        best = float("inf")
+        for _ in range(repeat):
+            arg = setup() if setup else None
+            start = time.perf_counter()
+            fn(arg) if setup else fn()
+            best = min(best, time.perf_counter() - start)
+
+        arg = setup() if setup else None
+        tracemalloc.start()
+        fn(arg) if setup else fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        size = request.node.callspec.params.get("population", "")
+        _results[f"{name}[{size}]"] = {"seconds": best, "peak_bytes": peak}
+        return best
+    return run
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _results:
+        return
+    _RESULTS.write_text(json.dumps(_results, indent=2, sort_keys=True))
+    baseline = json.loads(_BASELINE.read_text()) if _BASELINE.exists() else {}
+
+    tr = terminalreporter
+    tr.section("benchmark results")
+    tr.write_line(f"{'benchmark':<42}{'seconds':>12}{'baseline':>12}{'ratio':>8}{'peak MB':>10}")
+    for key in sorted(_results):
+        now = _results[key]
+        base = baseline.get(key)
+        ratio = now["seconds"] / base["seconds"] if base and base["seconds"] else None
+        flag = "  <-- slower" if ratio and ratio > _TOLERANCE else ""
+        tr.write_line(
+            f"{key:<42}{now['seconds']:>12.6f}"
+            f"{base['seconds'] if base else float('nan'):>12.6f}"
+            f"{ratio if ratio else float('nan'):>8.2f}"
+            f"{now['peak_bytes'] / 2**20:>10.2f}{flag}"
+        )
+
+    if os.environ.get("UNIAPP_BENCH_UPDATE") == "1" or not baseline:
+        _BASELINE.write_text(json.dumps({**baseline, **_results}, indent=2, sort_keys=True))
+        tr.write_line(f"baseline written to {_BASELINE}")
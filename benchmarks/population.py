@@ -0,0 +1,35 @@
+"""
+benchmarks/population.py
+────────────────────────
+Deterministic synthetic students for the benchmark scripts.
+"""
+
+import json
+import pathlib
+
+_GRADES = [(85, "HD"), (75, "D"), (65, "C"), (50, "P"), (0, "Z")]
+
+
+def _grade(mark: int) -> str:
+    return next(g for cut, g in _GRADES if mark >= cut)
+
+
+def make_record(i: int, subjects: int = 4) -> dict:
+    """Student *i* as stored in students.data (IDs unique for i < 999 999)."""
+    marks = [25 + (i * 7 + k * 13) % 76 for k in range(subjects)]
+    return {
+        "id": f"{i + 1:06d}",
+        "name": f"Student {i}",
+        "email": f"student{i}@university.com",
+        "password": "Abcde123",
+        "subjects": [
+            {"id": f"{k + 1:03d}", "mark": m, "grade": _grade(m)}
+            for k, m in enumerate(marks)
+        ],
+    }
+
+
+def write_population(path: pathlib.Path, n: int) -> None:
+    """Write *n* students to *path* in the normal students.data layout."""
+    with open(path, "w") as f:
+        json.dump([make_record(i, i % 5) for i in range(n)], f, indent=2)
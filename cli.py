@@ -6,13 +6,36 @@ Text-menu front-end for CLIUniApp.
 • University menu  (Admin / Student / Exit)
 • Student menu    (login / register)
 • Subject menu    (enrol / remove / show / change-pw)
-• Admin menu      (show / group / partition / remove / clear)
+• Admin menu      (show / group / partition / distribution / remove / clear)
 
+Non-interactive:
+• python cli.py --import FILE   bulk-register from CSV / JSONL
+• python cli.py --batch FILE    run a command script / JSONL op stream
+• python cli.py --profile DIR   write a cProfile + tracemalloc capture per menu action
+• python cli.py --export VIEW [--format csv|jsonl] [--output FILE]
+                                stream students / group / partition rows
+• python cli.py --connect ADDR  run the menus as a thin client of the
+                                student service (python -m service.daemon);
+                                --import / --batch / --export write the files
+                                directly, so they refuse to run with it
+• python cli.py --stats         print load/save/latency metrics on exit and
+                                add them to data/metrics.json
 """
 
+import argparse
+import json
+import os
+import sys
+import time
+from controllers.batch_controller import BatchController, parse_ops
 from controllers.student_controller import StudentController
 from controllers.admin_controller import AdminController
-from data.database import save  
+from controllers.write_behind import WriteBehind
+from utils.bulk_import import iter_rows
+from utils.report_export import FORMATS, VIEWS
+from utils.profiling import capture, enable as enable_profiling
+from utils import metrics
+from service import client
 
 
 # ──────────────────────────────────────────────────────────────
@@ -41,7 +64,7 @@ def university_menu() -> None:
 # Student menu (login / register)
 # ──────────────────────────────────────────────────────────────
 def student_menu() -> None:
-    controller = StudentController()
+    controller = client.student_controller()
 
     while True:
         print("\n--- Student System ---")
@@ -55,7 +78,8 @@ def student_menu() -> None:
             name = input("Name: ")
             email = input("Email: ")
             pw = input("Password: ")
-            ok, res = controller.register(name, email, pw)
+            with capture("student-r"):
+                ok, res = controller.register(name, email, pw)
             if ok:
                 print("Email and password formats acceptable")
                 print(f"Enrolling Student {name}")
@@ -66,7 +90,9 @@ def student_menu() -> None:
 
         elif choice == "l":
             print("\nStudent Sign In")
-            ok, stu = controller.login(input("Email: "), input("Password: "))
+            email, pw = input("Email: "), input("Password: ")
+            with capture("student-l"):
+                ok, stu = controller.login(email, pw)
             if ok:
                 subject_menu(stu, controller)
             else:
@@ -83,6 +109,15 @@ def student_menu() -> None:
 # Subject-enrolment menu (authenticated student)
 # ──────────────────────────────────────────────────────────────
 def subject_menu(student, controller) -> None:
+    # changes are written in the background, coalesced, and flushed on logout
+    persister = WriteBehind(controller.persist_many)
+    try:
+        _subject_loop(student, persister)
+    finally:
+        persister.close()                    # final flush (no-op when clean)
+
+
+def _subject_loop(student, persister) -> None:
     while True:
         print(f"\n--- Subject Enrolment System (Student: {student.name}) ---")
         print("(c) change password")
@@ -91,142 +126,292 @@ def subject_menu(student, controller) -> None:
         print("(s) show")
         print("(x) exit")
         ch = input("Select option: ").strip().lower()
-
+        # prompts come first so profiles never include time spent typing
         if ch == "c":
-            if student.change_password(input("Old: "), input("New: ")):
-                print("Password updated successfully.")
-                save(controller.students)  # persist updates
-            else:
-                print("Password change failed.")
+            old, new = input("Old: "), input("New: ")
+        elif ch == "r" and student.subjects:
+            sid = input("Subject ID: ")
 
-        elif ch == "e":
-            ok, msg = student.enrol()
-            print(msg if not ok else f"Enrolled in subject {msg.id}.")
-            if ok:
-                save(controller.students)          # persist
-                print(f"You are now enrolled in {len(student.subjects)} out of 4 subjects")
+        with capture(f"subject-{ch}"):
+            if ch == "c":
+                with persister.lock:
+                    changed = student.change_password(old, new)
+                if changed:
+                    print("Password updated successfully.")
+                    persister.mark(student)
+                else:
+                    print("Password change failed.")
 
-        elif ch == "r":
-            if not student.subjects:
-                print("You have no subjects to remove.")
-            else:
-                sid = input("Subject ID: ")
-                # Check if subject exists
-                subject_exists = any(s.id == sid for s in student.subjects)
+            elif ch == "e":
+                with persister.lock:
+                    ok, msg = student.enrol()
+                print(msg if not ok else f"Enrolled in subject {msg.id}.")
+                if ok:
+                    persister.mark(student)
+                    print(f"You are now enrolled in {len(student.subjects)} out of 4 subjects")
+
+            elif ch == "r":
+                if not student.subjects:
+                    print("You have no subjects to remove.")
+                else:
+                    # Check if subject exists
+                    subject_exists = any(s.id == sid for s in student.subjects)
                 
-                if subject_exists:
-                    print(f"Dropping subject - {sid}")
-                    student.remove_subject(sid)
-                    save(controller.students)  # persist
+                    if subject_exists:
+                        print(f"Dropping subject - {sid}")
+                        with persister.lock:
+                            student.remove_subject(sid)
+                        persister.mark(student)
                     
-                    print("Showing available subjects")
-                    if student.subjects:
-                        for s in student.subjects:
-                            print(f"subject:{s.id} -- mark:{s.mark} -- grade = {s.grade}")
+                        print("Showing available subjects")
+                        if student.subjects:
+                            for s in student.subjects:
+                                print(f"subject:{s.id} -- mark:{s.mark} -- grade = {s.grade}")
+                        else:
+                            print("No subjects remaining.")
                     else:
-                        print("No subjects remaining.")
+                        print("Subject ID not found.")
+
+            elif ch == "s":
+                if not student.subjects:
+                    print("No subjects enrolled.")
                 else:
-                    print("Subject ID not found.")
+                    print(f"Showing {len(student.subjects)} subjects")
+                    for s in student.subjects:
+                        print(f"subject:{s.id} -- mark:{s.mark} -- grade = {s.grade}")
 
-        elif ch == "s":
-            if not student.subjects:
-                print("No subjects enrolled.")
+            elif ch == "x":
+                persister.flush()                # skipped if nothing is dirty
+                print("Logging you out. You have now returned to Student System.")
+                break
             else:
-                print(f"Showing {len(student.subjects)} subjects")
-                for s in student.subjects:
-                    print(f"subject:{s.id} -- mark:{s.mark} -- grade = {s.grade}")
-
-        elif ch == "x":
-            save(controller.students)  # persist updates
-            print("Logging you out. You have now returned to Student System.")
-            break
-        else:
-            print("Invalid option.")
+                print("Invalid option.")
 
 
 # ──────────────────────────────────────────────────────────────
 # Admin menu
 # ──────────────────────────────────────────────────────────────
+_PAGE_SIZE = 20      # students per "show" page
+
+
+def _print_entries(students) -> None:
+    """Print the ", "-separated student entries one at a time (no joined string)."""
+    sep = ""
+    for s in students:
+        print(f"{sep}Student {s.name} :: {s.id} --> Grade - {s.overall_grade} "
+              f"- Avg:{s.average_mark:.2f}", end="")
+        sep = ", "
+
+
+def _show_students(admin) -> None:
+    """Paged listing; only the page fetches are profiled, not the prompt."""
+    with capture("admin-s"):
+        admin.refresh()  # always latest snapshot
+        empty = admin.is_empty()
+        if not empty:
+            total = admin.count()
+            students, cursor = admin.page(None, _PAGE_SIZE)
+    if empty:
+        print("No students in the database.")
+        return
+    print(f"\nStudent List ({total} students)")
+    while True:
+        for s in students:
+            print(f"Student {s.name} :: {s.id} --> Email :: {s.email}")
+        if cursor is None or input("-- more (Enter) / stop (q): ").strip().lower() == "q":
+            break
+        with capture("admin-s-page"):
+            students, cursor = admin.page(cursor, _PAGE_SIZE)
+
+
+def _remove_students(admin) -> None:
+    with capture("admin-r"):
+        admin.refresh()  # always latest snapshot
+        empty = admin.is_empty()
+    if empty:                                       # no data at all
+        print("No students in the database.")
+        return
+    # several IDs (space / comma separated) → one transaction
+    sids = input("Student ID: ").replace(",", " ").split() or [""]
+    with capture("admin-r-remove"):
+        removed = set(admin.remove_students(sids))
+    for sid in sids:
+        if sid in removed:
+            print(f"Student {sid} is removed")
+        else:
+            print(f"Student {sid} is not found")
+
+
 def admin_menu() -> None:
-    admin = AdminController()
+    admin = client.admin_controller()
 
     while True:
         print("\n--- Admin System ---")
         print("(s) show")
         print("(g) group students")
         print("(p) partition PASS/FAIL")
+        print("(d) mark distribution")
         print("(r) remove student")
         print("(c) clear database")
         print("(x) exit")
         ch = input("Select option: ").strip().lower()
-        admin.refresh()  # always latest snapshot
 
-        # ---- show all students --------------------------------
+        # ---- show all students / remove student -------------------
+        # (these prompt mid-action: each step between prompts is its own profile)
         if ch == "s":
-            students = admin.show_students()
-            if not students:
-                print("No students in the database.")
-            else:
-                print("\nStudent List")
-                for s in students:
-                    print(f"Student {s.name} :: {s.id} --> Email :: {s.email}")
-
-        # ---- group by grade -----------------------------------
-        elif ch == "g":
-            grouped = admin.group_by_grade()
-            if not grouped:
-                print("No enrolments available to group.")
-            else:
-                print("\nGrade Grouping")
-                for grade, students in grouped.items():
-                    print(f"{grade} --> [", end="")
-                    student_info = []
-                    for s in students:
-                        student_info.append(f"Student {s.name} :: {s.id} --> Grade - {s.overall_grade} - Avg:{s.average_mark:.2f}")
-                    print(", ".join(student_info), end="]\n")
-
-        # ---- partition pass / fail ----------------------------
-        elif ch == "p":
-            pf = admin.partition_pass_fail()
-            if not any(pf.values()):
-                print("No students to partition.")
-            else:
-                print("\nPass/Fail Partition")
-                for category, students in pf.items():
-                    if students:
-                        print(f"{category}: [", end="")
-                        student_info = []
-                        for s in students:
-                            student_info.append(f"Student {s.name} :: {s.id} --> Grade - {s.overall_grade} - Avg:{s.average_mark:.2f}")
-                        print(", ".join(student_info), end="]\n")
-                    else:
-                        print(f"{category}: []")
-        
-        # ---- remove student -----------------------------------
-        elif ch == "r":
-            if not admin.show_students():               # no data at all
-                print("No students in the database.")
-            else:
-                sid = input("Student ID: ")
-                ok = admin.remove_student(sid)
-                if ok:
-                    print(f"Student {sid} is removed")
+            _show_students(admin)
+            continue
+        if ch == "r":
+            _remove_students(admin)
+            continue
+
+        with capture(f"admin-{ch}"):
+            admin.refresh()  # always latest snapshot
+
+            # ---- group by grade -----------------------------------
+            if ch == "g":
+                grouped = admin.group_by_grade()
+                if not grouped:
+                    print("No enrolments available to group.")
                 else:
-                    print(f"Student {sid} is not found")
+                    print("\nGrade Grouping")
+                    for grade, students in grouped.items():
+                        print(f"{grade} --> [", end="")
+                        _print_entries(students)
+                        print("]")
 
-        # ---- clear database -----------------------------------
-        elif ch == "c":
-            admin.clear_database()
-            print("All student data cleared.")
+            # ---- partition pass / fail ----------------------------
+            elif ch == "p":
+                pf = admin.partition_pass_fail()
+                if not any(pf.values()):
+                    print("No students to partition.")
+                else:
+                    print("\nPass/Fail Partition")
+                    for category, students in pf.items():
+                        if students:
+                            print(f"{category}: [", end="")
+                            _print_entries(students)
+                            print("]")
+                        else:
+                            print(f"{category}: []")
 
-        # ---- exit admin menu ----------------------------------
-        elif ch == "x":
-            print("You have now returned to main menu.")
-            break
-        else:
-            print("Invalid option.")
+            # ---- average-mark distribution ------------------------
+            elif ch == "d":
+                dist = admin.distribution()
+                if not any(dist["histogram"]):
+                    print("No enrolments available.")
+                else:
+                    print("\nAverage-mark Distribution")
+                    edges, peak = dist["bins"], max(dist["histogram"])
+                    for lo, hi, n in zip(edges, edges[1:], dist["histogram"]):
+                        print(f"{lo:>3}-{hi:<3} {n:>7}  {'#' * (40 * n // peak)}")
+                    print("  ".join(f"p{q}={v:.2f}" for q, v in dist["percentiles"].items()))
+
+            # ---- clear database -----------------------------------
+            elif ch == "c":
+                admin.clear_database()
+                print("All student data cleared.")
+
+            # ---- exit admin menu ----------------------------------
+            elif ch == "x":
+                print("You have now returned to main menu.")
+                break
+            else:
+                print("Invalid option.")
 
 
 # ──────────────────────────────────────────────────────────────
+# Bulk import (non-interactive)
+# ──────────────────────────────────────────────────────────────
+def import_students(path: str, chunk_size: int) -> None:
+    start = time.perf_counter()
+    report = StudentController().register_many(iter_rows(path), chunk_size)
+    for line_no, reason in report["errors"]:
+        print(f"line {line_no}: {reason}")
+    print(f"Imported {report['imported']} students "
+          f"({len(report['errors'])} rejected) in {time.perf_counter() - start:.2f}s")
+
+
+# ──────────────────────────────────────────────────────────────
+# Batch / script mode (non-interactive)
+# ──────────────────────────────────────────────────────────────
+def run_batch(path: str) -> None:
+    """Execute ops from *path* ("-" = stdin); one JSON result per line."""
+    src = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        for result in BatchController().run(parse_ops(src)):
+            print(json.dumps(result))
+    finally:
+        if src is not sys.stdin:
+            src.close()
+
+
+# ──────────────────────────────────────────────────────────────
+# Report export (non-interactive)
+# ──────────────────────────────────────────────────────────────
+def export_report(view: str, fmt: str, path: str) -> None:
+    """Stream a listing to *path* ("-" = stdout)."""
+    out = sys.stdout if path == "-" else open(path, "w", newline="", encoding="utf-8")
+    try:
+        n = AdminController.export(view, fmt, out)
+    except BrokenPipeError:                  # e.g. `--export students | head`
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    if out is not sys.stdout:
+        print(f"Exported {n} rows to {path}")
+
+
+# ──────────────────────────────────────────────────────────────
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="CLIUniApp – university enrolment system")
+    parser.add_argument("--import", dest="import_file", metavar="FILE",
+                        help="bulk-register students from a .csv or .jsonl file and exit")
+    parser.add_argument("--chunk-size", type=int, default=5000, metavar="N",
+                        help="students persisted per write during --import (default 5000)")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="run a command script or JSONL op stream ('-' = stdin) and exit")
+    parser.add_argument("--export", choices=list(VIEWS), metavar="VIEW",
+                        help="stream a listing (students | group | partition) and exit")
+    parser.add_argument("--format", choices=FORMATS, default="csv",
+                        help="--export encoding (default csv)")
+    parser.add_argument("--output", default="-", metavar="FILE",
+                        help="--export destination ('-' = stdout, the default)")
+    parser.add_argument("--connect", metavar="ADDR",
+                        help="use the student service at ADDR (socket path or HOST:PORT; "
+                             "also: UNIAPP_SERVER)")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="profile every menu action into DIR (also: UNIAPP_PROFILE_DIR)")
+    parser.add_argument("--stats", action="store_true",
+                        help="print operational metrics on exit and add them to the metrics file")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        enable_profiling(args.profile)
+    if args.connect:
+        client.connect(args.connect)
+    offline = [flag for flag, on in (("--import", args.import_file), ("--batch", args.batch),
+                                     ("--export", args.export)) if on]
+    if offline and client.connected():
+        parser.error(f"{offline[0]} works on the data files directly; stop the student "
+                     "service or drop --connect / UNIAPP_SERVER")
+
+    try:
+        if args.import_file:
+            import_students(args.import_file, args.chunk_size)
+        elif args.batch:
+            run_batch(args.batch)
+        elif args.export:
+            export_report(args.export, args.format, args.output)
+        else:
+            university_menu()
+    finally:
+        if args.stats:
+            print(metrics.report(), file=sys.stderr)
+            print(f"metrics written to {metrics.dump()}", file=sys.stderr)
+
+
 if __name__ == "__main__":
-    university_menu()
+    main()
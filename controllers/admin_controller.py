@@ -3,18 +3,38 @@ controllers/admin_controller.py
 ───────────────────────────────
 Admin-side operations:
 
-• show all students
+• show all students, or one page at a time (cursor = last student ID)
+  from an ID-sorted order kept in step with the admin's own deletes
+• O(1) count() / is_empty(); page / window / count filter by grade
 • group students by overall grade
 • partition students into PASS / FAIL
-• remove a student by ID
+• one-pass summary (grade groups + PASS/FAIL + counts) – vectorised
+  through controllers/analytics.py when NumPy is installed
+• sharded data is never loaded as one list for counts / distribution:
+  shards send back counts or bare averages, not students
+• average-mark distribution (histogram + percentiles)
+• streaming CSV / JSONL export of listings (utils/report_export.py)
+• remove a student by ID, or many in ONE transaction
 • clear the entire database
 """
 
 from __future__ import annotations
-from typing import Dict, List
+import operator
+from typing import Dict, Iterable, List, Optional, Sequence, TextIO, Tuple
 
-from data.database import load, save
+from controllers import analytics
+from controllers.id_order import IdOrder
+from data.database import (save, delete, get, map_reduce, partitioned, signature,
+                           iter_students, transaction, current_transaction,
+                           Transaction)
+from data.snapshot_cache import cached_load
 from models.student import Student
+from utils.utility import release_student_id, reserve_student_id
+from utils.metrics import timed
+from utils import report_export
+
+# below this many students the column build costs more than it saves
+_VECTOR_MIN = 1000
 
 
 class AdminController:
@@ -22,23 +42,190 @@ class AdminController:
 
     # ── initialisation ────────────────────────────────────────
     def __init__(self) -> None:
+        self._summary_of = None      # snapshot the cached summary was built from
+        self._summary: dict = {}
+        self._counts_of = None       # signature the cached sharded counts match
+        self._counts: dict = {}
+        self._order_sig = None       # signature the sorted ID view matches
+        self._view = IdOrder()
         self.refresh()     # prime the cache
 
     # ── cache handling ----------------------------------------
+    @timed("AdminController.refresh")
     def refresh(self) -> None:
-        """Reload the latest snapshot from *students.data* into `self.students`."""
-        self.students: List[Student] = load()
+        """
+        Re-validate the snapshot cache against *students.data*.  Sharded
+        data is not loaded here – each query reads what it needs.
+        """
+        if not partitioned():
+            cached_load()
+
+    @property
+    def students(self) -> List[Student]:
+        """The latest snapshot (materialised on demand)."""
+        return self._snapshot()
 
     @staticmethod
     def _snapshot() -> List[Student]:
-        """Always pull the newest copy straight from disk."""
-        return load()
+        """Newest copy of the data – re-parsed only if the files changed."""
+        return cached_load()
+
+    def _order(self, check: bool = True) -> IdOrder:
+        """
+        ID-sorted view – rebuilt only when someone else changed the data.
+        `check=False` skips the signature test and serves the view as last
+        built (for scroll handlers that must not block on a reload).
+        """
+        if check or self._order_sig is None:
+            sig = signature()
+            if sig != self._order_sig:
+                self._view = IdOrder(self._snapshot())
+                self._order_sig = sig
+        return self._view
+
+    def _wrote(self, before: tuple) -> None:
+        """Keep the maintained order after our own write if nobody else wrote."""
+        if self._order_sig is not None and before == self._order_sig:
+            self._order_sig = signature()
+
+    def _invalidate(self) -> None:
+        """Forget every derived view (after a rolled-back transaction)."""
+        self._order_sig = self._summary_of = self._counts_of = None
+
+    def _join(self) -> None:
+        """Tie the maintained views to the caller's open transaction, if any."""
+        tx = current_transaction()
+        if tx is not None:
+            tx.on_commit(self._committed, tx, self._order_sig)
+            tx.on_rollback(self._invalidate)
+
+    def _committed(self, tx: Transaction, before: tuple) -> None:
+        """
+        Fold EVERY change the commit wrote into the ID order – other
+        controllers may have staged writes in the same transaction.
+        """
+        if tx.replace is not None:
+            self._invalidate()
+            return
+        for sid in tx.deletes:
+            self._view.discard(sid)
+        for stu in tx.upserts.values():
+            self._view.add(stu)
+        self._wrote(before)
 
     # ── read-only queries -------------------------------------
+    @timed("AdminController.show_students")
     def show_students(self) -> List[Student]:
         """Return all students (sorted by ID for nicer CLI output)."""
-        return sorted(self._snapshot(), key=lambda s: s.id)
+        return self._order().students()
+
+    @timed("AdminController.page")
+    def page(self, after: Optional[str] = None, size: int = 20,
+             grade: Optional[str] = None) -> Tuple[List[Student], Optional[str]]:
+        """
+        Up to `size` students with ID > `after` (None = from the start),
+        in ID order, plus the cursor for the next page (None on the last).
+        `grade` restricts the listing to one overall grade.
+        """
+        return self._order().page(after, size, grade)
+
+    @timed("AdminController.window")
+    def window(self, offset: int, size: int, grade: Optional[str] = None,
+               check: bool = True) -> List[Student]:
+        """Students at positions [offset, offset + size) of the ID order."""
+        return self._order(check).window(offset, size, grade)
+
+    @timed("AdminController.count")
+    def count(self, grade: Optional[str] = None, check: bool = True) -> int:
+        """Number of students (O(1) while the data is unchanged)."""
+        if partitioned() and (check or self._order_sig is None):
+            return self.counts().get(grade or "total", 0)
+        return self._order(check).count(grade)
+
+    def is_empty(self) -> bool:
+        return self.count() == 0
+
+    @staticmethod
+    def summarise(students: Iterable[Student]) -> dict:
+        """
+        ONE pass over `students` →
+          { "groups":    { grade : [students] },
+            "pass_fail": { "PASS": [...], "FAIL": [...] },
+            "counts":    { "total": n, "PASS": p, "FAIL": f, <grade>: k, ... } }
+        """
+        if analytics.available():
+            students = students if isinstance(students, list) else list(students)
+            if len(students) >= _VECTOR_MIN:
+                return AdminController._summarise_columns(students)
+
+        groups: Dict[str, List[Student]] = {}
+        buckets: Dict[str, List[Student]] = {"PASS": [], "FAIL": []}
+        for stu in students:
+            groups.setdefault(stu.overall_grade, []).append(stu)
+            buckets["PASS" if stu.average_mark >= 50 else "FAIL"].append(stu)
+
+        counts = {"total": len(buckets["PASS"]) + len(buckets["FAIL"]),
+                  "PASS": len(buckets["PASS"]), "FAIL": len(buckets["FAIL"])}
+        counts.update((g, len(members)) for g, members in groups.items())
+        return {"groups": groups, "pass_fail": buckets, "counts": counts}
 
+    @staticmethod
+    def _summarise_columns(students: List[Student]) -> dict:
+        """`summarise()` computed over NumPy columns (same result shape)."""
+        cols = analytics.GradeColumns(students)
+        groups, pass_fail = cols.groups(), cols.pass_fail()
+        counts = {"total": len(students),
+                  "PASS": len(pass_fail["PASS"]), "FAIL": len(pass_fail["FAIL"])}
+        counts.update((g, len(members)) for g, members in groups.items())
+        return {"groups": groups, "pass_fail": pass_fail, "counts": counts}
+
+    @staticmethod
+    def count_grades(students: Iterable[Student]) -> dict:
+        """Just the `counts` of `summarise()` – no student lists (shard mapper)."""
+        counts = {"total": 0, "PASS": 0, "FAIL": 0}
+        for stu in students:
+            counts["total"] += 1
+            counts["PASS" if stu.average_mark >= 50 else "FAIL"] += 1
+            grade = stu.overall_grade
+            counts[grade] = counts.get(grade, 0) + 1
+        return counts
+
+    @staticmethod
+    def merge_counts(a: dict, b: dict) -> dict:
+        return {k: a.get(k, 0) + b.get(k, 0) for k in {**a, **b}}
+
+    @staticmethod
+    def merge_summaries(a: dict, b: dict) -> dict:
+        """Combine two `summarise()` results (e.g. from different shards)."""
+        groups = {g: list(m) for g, m in a["groups"].items()}
+        for g, members in b["groups"].items():
+            groups.setdefault(g, []).extend(members)
+        counts = dict(a["counts"])
+        for k, v in b["counts"].items():
+            counts[k] = counts.get(k, 0) + v
+        return {"groups": groups,
+                "pass_fail": {k: a["pass_fail"][k] + b["pass_fail"][k]
+                              for k in ("PASS", "FAIL")},
+                "counts": counts}
+
+    @timed("AdminController.summary")
+    def summary(self) -> dict:
+        """`summarise()` of the current snapshot, reused until the data changes."""
+        if partitioned():
+            # map-reduce shard by shard instead of materialising one list
+            key = signature()
+            if key != self._summary_of:
+                self._summary = map_reduce(self.summarise, self.merge_summaries)
+                self._summary_of = key
+            return self._summary
+
+        snapshot = self._snapshot()
+        if snapshot is not self._summary_of:
+            self._summary = self.summarise(snapshot)
+            self._summary_of = snapshot
+        return self._summary
+
+    @timed("AdminController.group_by_grade")
     def group_by_grade(self) -> Dict[str, List[Student]]:
         """
         Return { grade (HD/D/C/P/Z) : [students] }.
@@ -47,11 +234,9 @@ class AdminController:
         so a student appears in *one* group only – exactly as illustrated
         in the sample I/O.
         """
-        grouped: Dict[str, List[Student]] = {}
-        for stu in self._snapshot():
-            grouped.setdefault(stu.overall_grade, []).append(stu)
-        return grouped
+        return self.summary()["groups"]
 
+    @timed("AdminController.partition_pass_fail")
     def partition_pass_fail(self) -> Dict[str, List[Student]]:
         """
         Return two buckets keyed 'PASS' / 'FAIL'.
@@ -59,28 +244,95 @@ class AdminController:
         • PASS  ➜ average mark ≥ 50  
         • FAIL  ➜ average mark < 50  *or* no subjects enrolled
         """
-        buckets = {"PASS": [], "FAIL": []}
-        for stu in self._snapshot():
-            bucket = "PASS" if stu.average_mark >= 50 else "FAIL"
-            buckets[bucket].append(stu)
-        return buckets
+        return self.summary()["pass_fail"]
+
+    def counts(self) -> dict:
+        """Just the `counts` part of `summary()` (total, PASS, FAIL, per grade)."""
+        if partitioned():
+            key = signature()
+            if key != self._counts_of:
+                self._counts = map_reduce(self.count_grades, self.merge_counts)
+                self._counts_of = key
+            return self._counts
+        return self.summary()["counts"]
+
+    @timed("AdminController.distribution")
+    def distribution(self, bins: Sequence[float] = range(0, 101, 10),
+                     qs: Sequence[float] = (25, 50, 75, 90)) -> dict:
+        """
+        Average-mark distribution of students with at least one subject:
+          { "bins": [...], "histogram": [count per bin], "percentiles": {q: value} }
+        """
+        if partitioned():                       # shards send back bare averages
+            avgs = map_reduce(analytics.enrolled_averages, operator.add)
+            bins = list(bins)
+            return {"bins": bins, "histogram": analytics.histogram_of(avgs, bins),
+                    "percentiles": dict(zip(qs, analytics.percentiles_of(avgs, qs)))}
+        return self.distribution_of(self._snapshot(), bins, qs)
+
+    @staticmethod
+    def distribution_of(students: Sequence[Student],
+                        bins: Sequence[float] = range(0, 101, 10),
+                        qs: Sequence[float] = (25, 50, 75, 90)) -> dict:
+        """`distribution()` of an arbitrary student list."""
+        bins = list(bins)
+        return {"bins": bins,
+                "histogram": analytics.histogram(students, bins),
+                "percentiles": dict(zip(qs, analytics.percentiles(students, qs)))}
+
+    @staticmethod
+    @timed("AdminController.export")
+    def export(view: str, fmt: str, out: TextIO) -> int:
+        """
+        Stream the `view` ("students" | "group" | "partition") listing as
+        `fmt` ("csv" | "jsonl") to `out`, one student at a time, straight
+        from storage – usable without an instance, so nothing is preloaded.
+        Returns #rows.
+        """
+        return report_export.export(iter_students(), view, fmt, out)
 
     # ── mutating actions --------------------------------------
+    @timed("AdminController.remove_student")
     def remove_student(self, student_id: str) -> bool:
         """
         Delete a student by ID.
 
         Returns **True** if a record was removed, otherwise **False**.
         """
-        current = self._snapshot()
-        updated = [s for s in current if s.id != student_id]
-
-        if len(updated) == len(current):        # nothing removed
-            return False
+        if partitioned():                       # one shard read, not a full load
+            if get(student_id) is None:
+                return False
+            view = self._view
+        else:
+            view = self._order()
+            if student_id not in view:
+                return False                    # nothing to remove
 
-        save(updated)
+        self._join()
+        before = signature()
+        delete(student_id)
+        view.discard(student_id)
+        self._wrote(before)
+        release_student_id(student_id)
+        tx = current_transaction()
+        if tx is not None:
+            tx.on_rollback(reserve_student_id, student_id)
         return True
 
+    @timed("AdminController.remove_students")
+    def remove_students(self, student_ids: Iterable[str]) -> List[str]:
+        """
+        Delete many students against ONE snapshot with ONE write
+        (all-or-nothing).  Returns the IDs that existed and were removed.
+        """
+        with transaction():
+            return [sid for sid in student_ids if self.remove_student(sid)]
+
+    @timed("AdminController.clear_database")
     def clear_database(self) -> None:
         """Erase *all* student records."""
+        self._join()
+        before = signature()
         save([])        # write empty list
+        self._view = IdOrder()
+        self._wrote(before)
@@ -0,0 +1,130 @@
+"""
+controllers/analytics.py
+────────────────────────
+Columnar grade analytics for admin reporting.
+
+• Marks are packed into an (N × 4) array padded with zeros, next to a
+  per-student subject count, so averages, grade bands, PASS/FAIL,
+  histograms and percentiles are computed in vectorised form.
+• NumPy is optional: `available()` says whether it imported, and
+  every public helper has a pure-Python fallback.
+"""
+
+from __future__ import annotations
+import bisect
+from itertools import chain
+from typing import Dict, List, Sequence
+
+from models.student import Student
+
+try:
+    import numpy as np
+except ImportError:         # optional dependency
+    np = None
+
+MAX_SUBJECTS = 4
+_CUTS = [50, 65, 75, 85]                  # band lower bounds, ascending
+_BANDS = ["Z", "P", "C", "D", "HD"]       # code k ⇔ _CUTS[k-1] ≤ avg < _CUTS[k]
+
+
+def available() -> bool:
+    return np is not None
+
+
+class GradeColumns:
+    """Column store of one snapshot: counts[N], marks[N, 4], averages[N], codes[N]."""
+
+    def __init__(self, students: Sequence[Student]) -> None:
+        self.students = students
+        per_student = [s.marks for s in students]
+        n = len(per_student)
+        self.counts = np.fromiter((len(m) for m in per_student), dtype=np.int8, count=n)
+        flat = np.fromiter(chain.from_iterable(per_student), dtype=np.int16,
+                           count=int(self.counts.sum()))
+
+        # scatter the flat marks into the padded (N × 4) matrix
+        rows = np.repeat(np.arange(n), self.counts)
+        starts = np.repeat(np.cumsum(self.counts) - self.counts, self.counts)
+        self.marks = np.zeros((n, MAX_SUBJECTS), dtype=np.int16)
+        self.marks[rows, np.arange(flat.size) - starts] = flat
+
+        totals = self.marks.sum(axis=1, dtype=np.int64)
+        self.averages = np.divide(totals, self.counts, out=np.zeros(n),
+                                  where=self.counts > 0)
+        self.codes = np.searchsorted(_CUTS, self.averages, side="right")
+
+    # ── grouped views (same shape as AdminController's) --------
+    def groups(self) -> Dict[str, List[Student]]:
+        """{grade: [students]} with grades in order of first appearance."""
+        present, first = np.unique(self.codes, return_index=True)
+        out: Dict[str, List[Student]] = {}
+        for code in present[np.argsort(first)]:
+            out[_BANDS[code]] = [self.students[i] for i in np.flatnonzero(self.codes == code)]
+        return out
+
+    def pass_fail(self) -> Dict[str, List[Student]]:
+        passed = self.averages >= 50
+        return {"PASS": [self.students[i] for i in np.flatnonzero(passed)],
+                "FAIL": [self.students[i] for i in np.flatnonzero(~passed)]}
+
+    # ── distribution ------------------------------------------
+    def histogram(self, bins: Sequence[float]) -> List[int]:
+        enrolled = self.averages[self.counts > 0]
+        return np.histogram(enrolled, bins=bins)[0].tolist()
+
+    def percentiles(self, qs: Sequence[float]) -> List[float]:
+        enrolled = self.averages[self.counts > 0]
+        if not enrolled.size:
+            return [0.0 for _ in qs]
+        return np.percentile(enrolled, qs).tolist()
+
+
+# ── backend-neutral helpers (NumPy when present) ────────────────
+def histogram(students: Sequence[Student], bins: Sequence[float] = range(0, 101, 10)) -> List[int]:
+    """Count enrolled students' averages per [bins[i], bins[i+1]) (last bin closed)."""
+    if np is not None:
+        return GradeColumns(students).histogram(bins)
+    return histogram_of(enrolled_averages(students), bins)
+
+
+def percentiles(students: Sequence[Student], qs: Sequence[float] = (25, 50, 75, 90)) -> List[float]:
+    """Linear-interpolated percentiles of enrolled students' averages."""
+    if np is not None:
+        return GradeColumns(students).percentiles(qs)
+    return percentiles_of(enrolled_averages(students), qs)
+
+
+# ── the same over bare averages (e.g. gathered shard by shard) ──
+def enrolled_averages(students: Sequence[Student]) -> List[float]:
+    """Average mark of every student with at least one subject."""
+    return [s.average_mark for s in students if s.marks]
+
+
+def histogram_of(averages: Sequence[float], bins: Sequence[float] = range(0, 101, 10)) -> List[int]:
+    """`histogram()` of precomputed averages."""
+    if np is not None:
+        return np.histogram(np.asarray(averages, dtype=float), bins=bins)[0].tolist()
+    counts = [0] * (len(bins) - 1)
+    for avg in averages:
+        if bins[0] <= avg <= bins[-1]:
+            i = min(bisect.bisect_right(bins, avg) - 1, len(counts) - 1)
+            counts[i] += 1
+    return counts
+
+
+def percentiles_of(averages: Sequence[float], qs: Sequence[float] = (25, 50, 75, 90)) -> List[float]:
+    """`percentiles()` of precomputed averages."""
+    if np is not None:
+        if not len(averages):
+            return [0.0 for _ in qs]
+        return np.percentile(np.asarray(averages, dtype=float), qs).tolist()
+    avgs = sorted(averages)
+    if not avgs:
+        return [0.0 for _ in qs]
+    out = []
+    for q in qs:
+        pos = (len(avgs) - 1) * q / 100
+        lo = int(pos)
+        hi = min(lo + 1, len(avgs) - 1)
+        out.append(avgs[lo] + (avgs[hi] - avgs[lo]) * (pos - lo))
+    return out
@@ -0,0 +1,243 @@
+"""
+controllers/batch_controller.py
+───────────────────────────────
+Non-interactive driver for automation (`cli.py --batch FILE`).
+
+• Loads the database ONCE into a staging StudentController.
+• Executes one operation per input line – either a JSON object
+  ({"op": "enrol", "email": ...}) or a shell-style command
+  (enrol ann@university.com) – against that in-memory state.
+• Persists only at `checkpoint` and once at the end.
+• Every operation yields one result dict for machine-readable output.
+• The same executor backs the service daemon (service/daemon.py).
+
+Operations:
+  register NAME EMAIL PASSWORD      enrol EMAIL
+  remove_subject EMAIL SUBJECT_ID   change_password EMAIL OLD NEW
+  remove STUDENT_ID                 clear
+  show | group | partition          checkpoint
+  login EMAIL PASSWORD              student EMAIL
+  count [GRADE]                     page [AFTER] [SIZE] [GRADE]
+  window OFFSET SIZE [GRADE]        counts | distribution
+"""
+
+from __future__ import annotations
+import json
+import shlex
+from typing import Callable, Dict, Iterable, Iterator, List
+
+from controllers.student_controller import StudentController
+from controllers.admin_controller import AdminController
+from controllers.id_order import IdOrder
+from models.student import Student
+
+# positional argument names for the command-script syntax
+_ARGS: Dict[str, List[str]] = {
+    "register": ["name", "email", "password"],
+    "enrol": ["email"],
+    "remove_subject": ["email", "subject"],
+    "change_password": ["email", "old", "new"],
+    "remove": ["id"],
+    "clear": [], "show": [], "group": [], "partition": [], "checkpoint": [],
+    "login": ["email", "password"],
+    "student": ["email"],
+    "count": ["grade"],
+    "page": ["after", "size", "grade"],
+    "window": ["offset", "size", "grade"],
+    "counts": [], "distribution": [],
+}
+
+# operations that change the population (the rest are read-only)
+MUTATING = frozenset({"register", "enrol", "remove_subject", "change_password",
+                      "remove", "clear"})
+
+
+def parse_ops(lines: Iterable[str]) -> Iterator[dict]:
+    """Turn script / JSONL lines into op dicts (tagged with their line number)."""
+    for line_no, line in enumerate(lines, 1):
+        text = line.strip()
+        if not text or text.startswith("#"):
+            continue
+        try:
+            if text.startswith("{"):
+                op = json.loads(text)
+            else:
+                name, *values = shlex.split(text)
+                op = {"op": name, **dict(zip(_ARGS.get(name, []), values))}
+        except ValueError as exc:
+            op = {"op": None, "error": f"unparseable line: {exc}"}
+        op["line"] = line_no
+        yield op
+
+
+def _brief(stu: Student) -> dict:
+    return {"id": stu.id, "name": stu.name, "email": stu.email,
+            "average": round(stu.average_mark, 2), "grade": stu.overall_grade}
+
+
+def _full(stu: Student) -> dict:
+    """Everything but the password."""
+    return {**_brief(stu), "subjects": [s.to_dict() for s in stu.subjects]}
+
+
+class BatchController:
+    """Runs a stream of operations against ONE in-memory snapshot."""
+
+    def __init__(self) -> None:
+        self.ctrl = StudentController(autosave=False)
+        self._view: IdOrder | None = None     # ID-sorted, built on first page
+        self._handlers: Dict[str, Callable[[dict], dict]] = {
+            "register": self._register,
+            "enrol": self._enrol,
+            "remove_subject": self._remove_subject,
+            "change_password": self._change_password,
+            "remove": self._remove,
+            "clear": self._clear,
+            "show": self._show,
+            "group": self._group,
+            "partition": self._partition,
+            "checkpoint": self._checkpoint,
+            "login": self._login,
+            "student": self._student,
+            "count": self._count,
+            "page": self._page,
+            "window": self._window,
+            "counts": self._counts,
+            "distribution": self._distribution,
+        }
+
+    # ── driver ---------------------------------------------------
+    def run(self, ops: Iterable[dict]) -> Iterator[dict]:
+        """Execute each op, yield its result, then persist once at the end."""
+        try:
+            for op in ops:
+                yield self.execute(op)
+        finally:
+            self.ctrl.flush()                 # staged ops survive an aborted run
+
+    def execute(self, op: dict) -> dict:
+        name = op.get("op")
+        result = {"line": op.get("line"), "op": name}
+        handler = self._handlers.get(name) if isinstance(name, str) else None
+        if "error" in op:
+            result.update(ok=False, error=op["error"])
+        elif name is not None and not isinstance(name, str):
+            result.update(ok=False, error=f"op must be a string, not {type(name).__name__}")
+        elif handler is None:
+            result.update(ok=False, error=f"unknown op {op.get('op')!r}")
+        else:
+            try:
+                result.update(handler(op))
+            except KeyError as exc:
+                result.update(ok=False, error=f"missing argument {exc}")
+            except (TypeError, ValueError) as exc:
+                result.update(ok=False, error=f"bad argument: {exc}")
+        return result
+
+    def _order(self) -> IdOrder:
+        if self._view is None:
+            self._view = IdOrder(self.ctrl.students)
+        return self._view
+
+    def _regraded(self) -> None:
+        if self._view is not None:
+            self._view.regrade()
+
+    # ── student operations --------------------------------------
+    def _register(self, op: dict) -> dict:
+        ok, res = self.ctrl.register(op["name"], op["email"], op["password"])
+        if not ok:
+            return {"ok": False, "error": res}
+        if self._view is not None:
+            self._view.add(res)
+        return {"ok": True, "id": res.id, "student": _full(res)}
+
+    def _enrol(self, op: dict) -> dict:
+        stu = self.ctrl.find(op["email"])
+        if stu is None:
+            return {"ok": False, "error": "unknown student"}
+        ok, res = stu.enrol()
+        if not ok:
+            return {"ok": False, "error": res}
+        self.ctrl.persist(stu)
+        self._regraded()
+        return {"ok": True, "subject": res.to_dict()}
+
+    def _remove_subject(self, op: dict) -> dict:
+        stu = self.ctrl.find(op["email"])
+        if stu is None:
+            return {"ok": False, "error": "unknown student"}
+        if not stu.remove_subject(str(op["subject"])):
+            return {"ok": False, "error": "subject not found"}
+        self.ctrl.persist(stu)
+        self._regraded()
+        return {"ok": True}
+
+    def _change_password(self, op: dict) -> dict:
+        stu = self.ctrl.find(op["email"])
+        if stu is None or not stu.change_password(op["old"], op["new"]):
+            return {"ok": False, "error": "password change failed"}
+        self.ctrl.persist(stu)
+        return {"ok": True}
+
+    def _login(self, op: dict) -> dict:
+        ok, stu = self.ctrl.login(op["email"], op["password"])
+        return {"ok": True, "student": _full(stu)} if ok else \
+               {"ok": False, "error": "incorrect email or password"}
+
+    def _student(self, op: dict) -> dict:
+        stu = self.ctrl.find(op["email"])
+        if stu is None:
+            return {"ok": False, "error": "unknown student"}
+        return {"ok": True, "student": _full(stu)}
+
+    # ── admin operations ----------------------------------------
+    def _remove(self, op: dict) -> dict:
+        if not self.ctrl.remove(str(op["id"])):
+            return {"ok": False, "error": "student not found"}
+        if self._view is not None:
+            self._view.discard(str(op["id"]))
+        return {"ok": True}
+
+    def _clear(self, op: dict) -> dict:
+        self.ctrl.clear()
+        self._view = None
+        return {"ok": True}
+
+    def _show(self, op: dict) -> dict:
+        students = sorted(self.ctrl.students, key=lambda s: s.id)
+        return {"ok": True, "students": [_brief(s) for s in students]}
+
+    def _group(self, op: dict) -> dict:
+        groups = AdminController.summarise(self.ctrl.students)["groups"]
+        return {"ok": True, "groups": {g: [_brief(s) for s in members]
+                                       for g, members in groups.items()}}
+
+    def _partition(self, op: dict) -> dict:
+        summary = AdminController.summarise(self.ctrl.students)
+        return {"ok": True, "counts": summary["counts"],
+                "pass_fail": {k: [s.id for s in members]
+                              for k, members in summary["pass_fail"].items()}}
+
+    def _count(self, op: dict) -> dict:
+        return {"ok": True, "count": self._order().count(op.get("grade") or None)}
+
+    def _page(self, op: dict) -> dict:
+        students, cursor = self._order().page(op.get("after") or None,
+                                              int(op.get("size", 20)),
+                                              op.get("grade") or None)
+        return {"ok": True, "students": [_brief(s) for s in students], "cursor": cursor}
+
+    def _window(self, op: dict) -> dict:
+        students = self._order().window(int(op["offset"]), int(op["size"]),
+                                        op.get("grade") or None)
+        return {"ok": True, "students": [_brief(s) for s in students]}
+
+    def _counts(self, op: dict) -> dict:
+        return {"ok": True, "counts": AdminController.summarise(self.ctrl.students)["counts"]}
+
+    def _distribution(self, op: dict) -> dict:
+        return {"ok": True, **AdminController.distribution_of(self.ctrl.students)}
+
+    def _checkpoint(self, op: dict) -> dict:
+        return {"ok": True, "written": self.ctrl.flush()}
@@ -0,0 +1,100 @@
+"""
+controllers/id_order.py
+───────────────────────
+Students kept in ascending-ID order for paging.
+
+• `page(after, size)` is cursor-based (cursor = last ID shown);
+  `window(offset, size)` is positional (virtualised lists).
+• Both can be restricted to one overall grade; per-grade ID lists are
+  built on first use and dropped by `regrade()` after marks change.
+• `add` / `discard` keep every list sorted with bisect, so membership
+  changes never trigger a full re-sort.
+"""
+
+from __future__ import annotations
+import bisect
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models.student import Student
+
+
+class IdOrder:
+    """Sorted ID index over a set of students."""
+
+    def __init__(self, students: Iterable[Student] = ()) -> None:
+        self._by_id: Dict[str, Student] = {s.id: s for s in students}
+        self._ids: List[str] = sorted(self._by_id)
+        self._by_grade: Dict[str, List[str]] = {}     # grade → sorted IDs (lazy)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, student_id: str) -> bool:
+        return student_id in self._by_id
+
+    def get(self, student_id: str) -> Optional[Student]:
+        return self._by_id.get(student_id)
+
+    # ── maintenance --------------------------------------------
+    def add(self, student: Student) -> None:
+        """Insert (or replace) one student, keeping the order sorted."""
+        sid = student.id
+        if sid in self._by_id:
+            self._by_id[sid] = student
+            self.regrade()
+            return
+        self._by_id[sid] = student
+        bisect.insort(self._ids, sid)
+        ids = self._by_grade.get(student.overall_grade)
+        if ids is not None:
+            bisect.insort(ids, sid)
+
+    def discard(self, student_id: str) -> bool:
+        """Remove one student; False if it was not there."""
+        if self._by_id.pop(student_id, None) is None:
+            return False
+        for ids in (self._ids, *self._by_grade.values()):
+            i = bisect.bisect_left(ids, student_id)
+            if i < len(ids) and ids[i] == student_id:
+                del ids[i]
+        return True
+
+    def regrade(self) -> None:
+        """Forget the per-grade lists (a student's average changed)."""
+        self._by_grade = {}
+
+    # ── queries ------------------------------------------------
+    def ids(self, grade: Optional[str] = None) -> List[str]:
+        """All IDs in order, or those of one overall grade."""
+        if grade is None:
+            return self._ids
+        ids = self._by_grade.get(grade)
+        if ids is None:
+            by_id = self._by_id
+            ids = self._by_grade[grade] = [i for i in self._ids
+                                           if by_id[i].overall_grade == grade]
+        return ids
+
+    def count(self, grade: Optional[str] = None) -> int:
+        return len(self.ids(grade))
+
+    def students(self) -> List[Student]:
+        return [self._by_id[i] for i in self._ids]
+
+    def page(self, after: Optional[str] = None, size: int = 20,
+             grade: Optional[str] = None) -> Tuple[List[Student], Optional[str]]:
+        """
+        Up to `size` students with ID > `after` (None = from the start),
+        plus the cursor for the next page (None on the last).
+        """
+        ids = self.ids(grade)
+        start = 0 if after is None else bisect.bisect_right(ids, after)
+        chunk = ids[start:start + size]
+        cursor = chunk[-1] if chunk and start + size < len(ids) else None
+        return [self._by_id[i] for i in chunk], cursor
+
+    def window(self, offset: int, size: int,
+               grade: Optional[str] = None) -> List[Student]:
+        """Students at positions [offset, offset + size)."""
+        ids = self.ids(grade)
+        return [self._by_id[i] for i in ids[max(offset, 0):offset + size]]
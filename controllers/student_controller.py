@@ -3,57 +3,274 @@ controllers/student_controller.py
 ─────────────────────────────────
 Student-side use-cases:
 
-• register
+• register / register_many (streamed bulk import)
 • login
-• (persistence delegations)
+• persist / persist_many (journal changed students)
 
+Keeps ID → Student and email → Student indexes so duplicate checks,
+logins and removals are O(1).  When the database signature says the
+files changed, a login fetches just that student through the offset
+index (and the journal's unread tail) instead of reloading all.
+
+With `autosave=False` writes are staged in memory and only reach disk
+on `flush()` – used by batch mode to persist once per checkpoint.
+Inside `database.transaction()` writes join the unit of work; on
+rollback the controller reloads and releases the IDs it handed out.
 ─────────────────────────────────
 """
 
 from __future__ import annotations
-from typing import Tuple
-from utils.utility import validate_email, validate_password
-from data.database import load, save
+from typing import Dict, Iterable, List, Optional, Tuple
+from utils.utility import validate_email, validate_password, release_student_id
+from utils.bulk_import import chunked
+from utils.metrics import timed
+from data.database import (load, save, apply_changes, signature, get_by_email,
+                           current_transaction, rejection, Transaction)
 from models.student import Student
 
 
 class StudentController:
-    def __init__(self) -> None:
+    def __init__(self, autosave: bool = True) -> None:
+        self.autosave = autosave
+        self._pending: Dict[str, Optional[Student]] = {}   # id → student (None = delete)
+        self._cleared = False
         # pull the current snapshot each time the controller is instantiated
-        self.students = load()
+        self._reload()
 
-    # ── registration ────────────────────────────────────────────
-    def register(self, name: str, email: str, password: str) -> Tuple[bool, str | Student]:
+    # ── snapshot / index ────────────────────────────────────────
+    def _reload(self) -> None:
+        """(Re)read the database and rebuild the ID / email indexes."""
+        self._sig = signature()
+        students = load(lazy=True)            # subjects hydrate on first use
+        self._by_id: Dict[str, Student] = {s.id: s for s in students}
+        self._by_email: Dict[str, Student] = {s.email: s for s in students}
+
+    @property
+    def students(self) -> List[Student]:
+        """Every known student, in load / registration order."""
+        return list(self._by_id.values())
+
+    def _wrote(self, before: tuple) -> None:
+        """Adopt the post-write signature if nobody else touched the files."""
+        if before == self._sig:
+            self._sig = signature()
+
+    def _lookup(self, email: str) -> Optional[Student]:
         """
-        Returns (True, Student) if success,
-                (False, reason) otherwise.
+        Current record for *email*: the in-memory one while the files are
+        unchanged, otherwise ONE indexed read spliced into memory.
+        """
+        if not self.autosave or signature() == self._sig:
+            return self._by_email.get(email)
+
+        fresh = get_by_email(email)
+        old = self._by_email.pop(email, None)
+        if old is not None and (fresh is None or fresh.id != old.id):
+            self._by_id.pop(old.id, None)
+        if fresh is not None:
+            prev = self._by_id.get(fresh.id)
+            if prev is not None and prev.email != email:
+                self._by_email.pop(prev.email, None)   # address changed elsewhere
+            self._by_id[fresh.id] = fresh      # replaced in place, or appended
+            self._by_email[email] = fresh
+        return fresh
+
+    def _join(self) -> None:
+        """Tie in-memory state to the caller's open transaction, if any."""
+        tx = current_transaction()
+        if tx is not None and self.autosave:
+            tx.on_commit(self._committed, tx, self._sig)
+            tx.on_rollback(self._reload)      # memory holds uncommitted changes
+
+    def _committed(self, tx: Transaction, before: tuple) -> None:
         """
+        Fold EVERY change the commit wrote into the indexes – other
+        controllers may have staged writes in the same transaction.
+        """
+        if tx.replace is not None:
+            self._reload()
+            return
+        for sid in tx.deletes:
+            old = self._by_id.pop(sid, None)
+            if old is not None and self._by_email.get(old.email) is old:
+                del self._by_email[old.email]
+        for sid, stu in tx.upserts.items():
+            old = self._by_id.get(sid)
+            if old is not None and self._by_email.get(old.email) is old:
+                del self._by_email[old.email]
+            self._by_id[sid] = stu
+            self._by_email[stu.email] = stu
+        self._wrote(before)
+
+    def find(self, email: str) -> Optional[Student]:
+        """Return the student with this e-mail (in-memory view), or None."""
+        return self._by_email.get(email)
+
+    # ── registration ────────────────────────────────────────────
+    def _rejection(self, name: str, email: str, password: str) -> Optional[str]:
+        """Reason a registration is refused, or None if it is acceptable."""
         if not validate_email(email):
-            return False, "Invalid email format (must end with @university.com)."
+            return "Invalid email format (must end with @university.com)."
 
         if not validate_password(password):
-            return False, (
+            return (
                 "Password must start with uppercase, contain ≥5 letters "
                 "and ≥3 digits."
             )
 
-        if any(s.email == email for s in self.students):
-            return False, "A student with this email already exists."
+        too_long = rejection(name, email, password)   # backend field limits
+        if too_long:
+            return too_long[0].upper() + too_long[1:] + "."
+
+        if self._lookup(email) is not None:
+            return "A student with this email already exists."
+        return None
+
+    @timed("StudentController.register")
+    def register(self, name: str, email: str, password: str) -> Tuple[bool, str | Student]:
+        """
+        Returns (True, Student) if success,
+                (False, reason) otherwise.
+        """
+        reason = self._rejection(name, email, password)
+        if reason:
+            return False, reason
 
         stu = Student(name, email, password)
-        self.students.append(stu)
-        save(self.students)
+        self._by_id[stu.id] = stu
+        self._by_email[email] = stu
+        self._unreserve_on_rollback([stu])
+        try:
+            self.persist(stu)
+        except ValueError as exc:             # backend refused the record
+            del self._by_id[stu.id]
+            del self._by_email[email]
+            release_student_id(stu.id)
+            return False, str(exc)
         return True, stu
 
+    @timed("StudentController.register_many")
+    def register_many(self, rows: Iterable[Tuple[int, dict]],
+                      chunk_size: int = 5000) -> dict:
+        """
+        Bulk-register `(line_no, {"name", "email", "password"})` rows;
+        a row that is not a dict (e.g. a `BadRow`) is reported, not fatal.
+
+        Rows are validated and de-duplicated (against the database and
+        each other) as they stream in; accepted students are persisted
+        with ONE write per chunk.  Returns
+            {"imported": n, "errors": [(line_no, reason), ...]}
+        """
+        if self.autosave and signature() != self._sig:
+            self._reload()                    # one full read beats N lookups
+        imported, errors = 0, []
+        for chunk in chunked(rows, chunk_size):
+            accepted = []
+            for line_no, row in chunk:
+                if not isinstance(row, dict):
+                    errors.append((line_no, getattr(row, "reason", "Expected a JSON object.")))
+                    continue
+                name, email, password = (row.get(k) or "" for k in ("name", "email", "password"))
+                if not all(isinstance(v, str) for v in (name, email, password)):
+                    errors.append((line_no, "Name, email and password must be text."))
+                    continue
+                name, email = name.strip(), email.strip()
+                reason = "Missing name." if not name else self._rejection(name, email, password)
+                if reason:
+                    errors.append((line_no, reason))
+                    continue
+                stu = Student(name, email, password)
+                self._by_email[email] = stu
+                accepted.append(stu)
+
+            if accepted:
+                self._by_id.update((s.id, s) for s in accepted)
+                self._unreserve_on_rollback(accepted)
+                self._record(accepted, [])
+                imported += len(accepted)
+        return {"imported": imported, "errors": errors}
+
     # ── login  ──────────────────────────────────────────────────
+    @timed("StudentController.login")
     def login(self, email: str, password: str) -> Tuple[bool, Student | None]:
         """
         Returns (True, Student) if credentials match,
                 (False, None) otherwise.
         """
-        # refresh list in case of external changes
-        self.students = load()
-        for stu in self.students:
-            if stu.check_login(email, password):
-                return True, stu
+        stu = self._lookup(email)
+        if stu is not None and stu.check_login(email, password):
+            return True, stu
         return False, None
+
+    # ── removal ─────────────────────────────────────────────────
+    @timed("StudentController.remove")
+    def remove(self, student_id: str) -> bool:
+        """Delete one student by ID; returns False if unknown."""
+        stu = self._by_id.pop(student_id, None)
+        if stu is None:
+            return False
+        self._by_email.pop(stu.email, None)
+        self._record([], [student_id])
+        release_student_id(student_id)
+        return True
+
+    @timed("StudentController.clear")
+    def clear(self) -> None:
+        """Erase all students (memory + disk)."""
+        self._by_id = {}
+        self._by_email = {}
+        self._pending.clear()
+        if self.autosave:
+            self._join()
+            before = signature()
+            save([])
+            self._wrote(before)
+        else:
+            self._cleared = True
+
+    # ── persistence ─────────────────────────────────────────────
+    def _unreserve_on_rollback(self, students: list) -> None:
+        tx = current_transaction()
+        if tx is not None and self.autosave:
+            for stu in students:
+                tx.on_rollback(release_student_id, stu.id)
+
+    def _record(self, upserts: list, deletes: list) -> None:
+        """Write (autosave) or stage (batch) a set of changes."""
+        if not self.autosave:
+            self._pending.update((s.id, s) for s in upserts)
+            self._pending.update((sid, None) for sid in deletes)
+            return
+        self._join()
+        before = signature()
+        apply_changes(upserts, deletes)
+        self._wrote(before)
+
+    @timed("StudentController.persist")
+    def persist(self, student: Student) -> None:
+        """Write ONE changed student (enrol / remove / password / logout)."""
+        self._record([student], [])
+
+    @timed("StudentController.persist_many")
+    def persist_many(self, students: Iterable[Student]) -> None:
+        """Write a batch of changed students with ONE write (write-behind)."""
+        self._record(list(students), [])
+
+    @timed("StudentController.flush")
+    def flush(self) -> int:
+        """Write everything staged since the last flush; returns #records."""
+        before = signature()
+        if self._cleared:
+            save(self.students)                  # full rewrite covers it all
+            written = len(self._by_id)
+        elif self._pending:
+            upserts = [s for s in self._pending.values() if s is not None]
+            deletes = [sid for sid, s in self._pending.items() if s is None]
+            apply_changes(upserts, deletes)
+            written = len(self._pending)
+        else:
+            return 0
+        self._pending.clear()
+        self._cleared = False
+        self._wrote(before)
+        return written
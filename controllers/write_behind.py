@@ -0,0 +1,112 @@
+"""
+controllers/write_behind.py
+───────────────────────────
+Write-behind persistence for interactive sessions.
+
+• `mark(student)` only records that the student is dirty and (re)arms a
+  short debounce timer – the menu action returns immediately.
+• A background thread waits until no new change has arrived for
+  `delay` seconds, then writes every dirty student in ONE atomic batch.
+• `flush()` writes synchronously (logout / exit) and is a no-op when
+  nothing is dirty; `close()` flushes and stops the thread.
+• `lock` guards the student objects: hold it while mutating one, so the
+  writer never serialises a half-applied change.  Writes themselves run
+  on frozen copies outside the lock, so slow I/O never blocks the UI.
+"""
+
+from __future__ import annotations
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from models.student import Student
+from utils import metrics
+
+
+class WriteBehind:
+    """Coalesces bursts of `mark()` calls into one `write(students)` call."""
+
+    def __init__(self, write: Callable[[List[Student]], None], delay: float = 0.5) -> None:
+        self._write = write
+        self.delay = delay
+        self.lock = threading.RLock()            # held while students are mutated
+        self.error: Optional[BaseException] = None   # last background failure
+        self._cond = threading.Condition()
+        self._io = threading.Lock()              # one write in flight at a time
+        self._dirty: Dict[str, Student] = {}
+        self._deadline: Optional[float] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    @property
+    def dirty(self) -> bool:
+        with self._cond:
+            return bool(self._dirty)
+
+    def mark(self, student: Student) -> None:
+        """Schedule `student` for the next batch write."""
+        with self._cond:
+            self._dirty[student.id] = student
+            self._deadline = time.monotonic() + self.delay
+            self._cond.notify()
+        metrics.incr("write_behind.marks")
+
+    def flush(self) -> int:
+        """Write all dirty students now; returns how many were written."""
+        written = self._drain()
+        if self.error is not None:
+            exc, self.error = self.error, None
+            raise exc
+        return written
+
+    def close(self) -> int:
+        """Final flush, then stop the background thread."""
+        try:
+            return self.flush()
+        finally:
+            with self._cond:
+                self._closed = True
+                self._cond.notify()
+            self._thread.join()
+
+    # ── internals --------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if self._deadline is None:
+                        self._cond.wait()
+                        continue
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._closed:
+                    return
+                self._deadline = None
+            self._drain()
+
+    def _drain(self) -> int:
+        with self._io:
+            with self._cond:
+                batch = list(self._dirty.values())
+                self._dirty.clear()
+                self._deadline = None
+            if not batch:
+                return 0
+            with self.lock:                       # consistent snapshot of each student
+                frozen = [Student.from_dict(s.to_dict()) if isinstance(s, Student) else s
+                          for s in batch]         # (remote students hold no local state)
+            try:
+                self._write(frozen)
+            except Exception as exc:              # keep them dirty; flush() reports it
+                with self._cond:
+                    for s in batch:
+                        self._dirty.setdefault(s.id, s)
+                self.error = exc
+                return 0
+            self.error = None
+            metrics.incr("write_behind.writes")
+            metrics.incr("write_behind.students_written", len(frozen))
+            return len(frozen)
@@ -6,18 +6,132 @@ Light-weight persistence layer.
 • Ensures `students.data` exists.
 • Uses JSON so the file is human-readable for markers.
 • All model <--> dict (de)serialisation is handled by Student / Subject.
+• Single-record changes go to an append-only journal
+  (`students.data.log`) instead of rewriting the whole file; `load()`
+  replays snapshot + journal and `compact()` folds the journal back
+  into a fresh snapshot once it grows past `_JOURNAL_LIMIT` bytes.
+  The parsed journal is kept between calls, so later reads only parse
+  lines appended since (by this or another process).
+• Backend is chosen by `UNIAPP_BACKEND` ("json" | "sqlite" | "sharded" | "records")
+  or `configure()`; every public function below dispatches on it.
+• Loads / saves / bytes / entries parsed are counted in utils.metrics.
+• Every snapshot write also writes an offset index sidecar
+  (`students.data.idx`, see data/offset_index.py) so `get()` /
+  `get_by_email()` decode one record instead of the whole file.
+• `iter_students()` streams the population one record at a time for
+  exports, so memory stays flat however large the file is.
+• `with transaction():` stages every write made by this thread inside
+  the block and commits them as ONE atomic write on exit – or drops
+  them all if the block raises.
+• `save()` splices in each student's cached snapshot fragment and only
+  re-encodes students that are `dirty` (changed since their last save).
+• `set_compression()` / `UNIAPP_COMPRESSION` writes the snapshot gzip /
+  zlib / lzma compressed, streamed record by record; `load()` detects
+  the format from the header.  Compressed snapshots have no offset
+  index, so `get()` / `get_by_email()` fall back to a streaming scan.
 """
 
 import os
 import json
 import pathlib
-from typing import List
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 from models.student import Student
+from utils import metrics
+from data import offset_index, snapshot_codec
+
+T = TypeVar("T")
 
 _DB_FILE = pathlib.Path(__file__).with_name("students.data")
 
+# journal size (bytes) after which it is folded into the snapshot
+_JOURNAL_LIMIT = 4 * 1024 * 1024
+
+# storage backend: "json" (students.data + journal), "sqlite", "sharded" or "records"
+_BACKENDS = ("json", "sqlite", "sharded", "records")
+_BACKEND = os.environ.get("UNIAPP_BACKEND", "json")
+_SHARDS = int(os.environ.get("UNIAPP_SHARDS", "8"))
+_stores: Dict[tuple, object] = {}
+
+# characters read per step when streaming the snapshot
+_STREAM_CHUNK = 64 * 1024
+
+# snapshot compression for writes ("gzip" | "zlib" | "lzma" | None);
+# reads always detect the format from the file header
+_CODEC = snapshot_codec.check(os.environ.get("UNIAPP_COMPRESSION"))
+
+# bumped on every write from this process (guards against coarse mtimes)
+_generation = 0
+
+# the calling thread's open transaction, if any
+_local = threading.local()
+
+
+class Transaction:
+    """
+    Writes staged by `transaction()`: upserts and deletes keyed by student
+    ID (last one wins), or a full replacement if `save()` was called.
+    """
+
+    def __init__(self) -> None:
+        self.upserts: Dict[str, Student] = {}
+        self.deletes: Dict[str, None] = {}       # ordered set
+        self.replace: Optional[List[Student]] = None
+        self._undo: List[tuple] = []             # (fn, args) run on rollback
+        self._done: List[tuple] = []             # (fn, args) run after commit
+
+    def stage(self, upserts: List[Student] = (), deletes: List[str] = ()) -> None:
+        for s in upserts:
+            self.deletes.pop(s.id, None)
+            self.upserts[s.id] = s
+        for sid in deletes:
+            self.upserts.pop(sid, None)
+            self.deletes[sid] = None
+
+    def stage_save(self, students: List[Student]) -> None:
+        self.replace = list(students)
+        self.upserts.clear()
+        self.deletes.clear()
+
+    def on_rollback(self, fn: Callable, *args) -> None:
+        """Run `fn(*args)` if the transaction is rolled back (once per distinct call)."""
+        if (fn, args) not in self._undo:
+            self._undo.append((fn, args))
+
+    def on_commit(self, fn: Callable, *args) -> None:
+        """Run `fn(*args)` after the commit write (once per distinct call)."""
+        if (fn, args) not in self._done:
+            self._done.append((fn, args))
+
+    def overlay(self, students: List[Student]) -> List[Student]:
+        """`students` as they will be after commit (read-your-writes)."""
+        base = self.replace if self.replace is not None else students
+        if not (self.upserts or self.deletes):
+            return list(base)
+        merged = {s.id: s for s in base}
+        for sid in self.deletes:
+            merged.pop(sid, None)
+        merged.update(self.upserts)
+        return list(merged.values())
+
+    def staged(self, student_id: str) -> Tuple[bool, Optional[Student]]:
+        """(known, student) – whether this transaction decides the record."""
+        if student_id in self.upserts:
+            return True, self.upserts[student_id]
+        if student_id in self.deletes:
+            return True, None
+        if self.replace is not None:
+            return True, next((s for s in self.replace if s.id == student_id), None)
+        return False, None
 
-# ── internal helper ───────────────────────────────────────────
+
+def current_transaction() -> Optional[Transaction]:
+    """The calling thread's open transaction, or None."""
+    return getattr(_local, "tx", None)
+
+
+# ── internal helpers ─────────────────────────────────────────
 def _ensure_file() -> None:
     """Create an empty JSON array file if it does not exist."""
     if not os.path.exists(_DB_FILE):
@@ -25,17 +139,605 @@ def _ensure_file() -> None:
             json.dump([], f)
 
 
-# ── public API ------------------------------------------------
-def load() -> List[Student]:
-    """Read students.data → list[Student]."""
+def _journal_path() -> pathlib.Path:
+    """Journal lives next to the snapshot: students.data → students.data.log"""
+    return _DB_FILE.with_name(_DB_FILE.name + ".log")
+
+
+def _compressed() -> bool:
+    return snapshot_codec.codec_of(_DB_FILE) is not None
+
+
+def _read_snapshot() -> List[dict]:
     _ensure_file()
+    if _compressed():
+        return list(_iter_snapshot())
     with open(_DB_FILE) as f:
-        raw = json.load(f)
-    return [Student.from_dict(d) for d in raw]
+        records = json.load(f)
+        metrics.incr("database.bytes_read", os.fstat(f.fileno()).st_size)
+    metrics.incr("database.entries_parsed", len(records))
+    return records
+
+
+class _JournalState:
+    """
+    The journal parsed so far.  Appends only add whole lines, so a later
+    read parses just the bytes after `offset` instead of the whole file.
+    """
+
+    __slots__ = ("key", "offset", "overrides", "emails")
+
+    def __init__(self, key: tuple) -> None:
+        self.key = key
+        self.offset = 0
+        self.overrides: Dict[str, Optional[dict]] = {}
+        self.emails: Dict[str, str] = {}       # e-mail → ID of its latest "put"
+
+
+_journal: Optional[_JournalState] = None
+_journal_lock = threading.Lock()
+
+
+def _journal_state() -> _JournalState:
+    """Bring the parsed journal up to date with the file (tail only)."""
+    global _journal
+    path = _journal_path()
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+    # a compaction rewrites the snapshot and drops the journal → start over
+    key = (path, _stat(_DB_FILE), st.st_ino if st else None)
+    with _journal_lock:
+        state = _journal
+        if state is None or state.key != key or (st and st.st_size < state.offset):
+            state = _JournalState(key)
+        if st is None or st.st_size == state.offset:
+            _journal = state
+            return state
+        with open(path, "rb") as f:
+            f.seek(state.offset)
+            data = f.read()
+        metrics.incr("database.bytes_read", len(data))
+        end = data.rfind(b"\n") + 1               # a torn tail waits for its newline
+        for line in data[:end].splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:          # torn line from an interrupted append
+                metrics.incr("database.journal_lines_skipped")
+                continue
+            if entry["op"] == "put":
+                state.overrides[entry["student"]["id"]] = entry["student"]
+                state.emails[entry["student"]["email"]] = entry["student"]["id"]
+            elif entry["op"] == "del":
+                state.overrides[entry["id"]] = None
+            metrics.incr("database.journal_entries_replayed")
+        state.offset += end
+        _journal = state
+        return state
+
+
+def _journal_overrides() -> Dict[str, Optional[dict]]:
+    """Latest journal state per student ID (None = deleted) – shared, do not mutate."""
+    return _journal_state().overrides
+
+
+def _iter_snapshot() -> Iterator[dict]:
+    """Decode students.data record by record, holding ~one chunk in memory."""
+    _ensure_file()
+    decoder = json.JSONDecoder()
+    with snapshot_codec.open_text(_DB_FILE) as f:
+        buf, pos, eof = f.read(_STREAM_CHUNK), 0, False
+        pos = buf.index("[") + 1
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(buf) and buf[pos] == "]":
+                break
+            try:
+                d, end = decoder.raw_decode(buf, pos)
+            except ValueError:
+                if eof:
+                    raise
+                more = f.read(_STREAM_CHUNK)
+                buf, pos, eof = buf[pos:] + more, 0, not more
+                continue
+            metrics.incr("database.entries_parsed")
+            yield d
+            pos = end
+            if pos > _STREAM_CHUNK:              # drop what has been consumed
+                buf, pos = buf[pos:], 0
+        metrics.incr("database.bytes_read", os.fstat(f.fileno()).st_size)
+
+
+def _iter_replayed() -> Iterator[dict]:
+    """`_replay()` as a stream: snapshot records with the journal applied."""
+    overrides = dict(_journal_overrides())
+    for d in _iter_snapshot():
+        if d["id"] in overrides:                 # journal has the newer copy
+            d = overrides.pop(d["id"])
+            if d is None:
+                continue
+        yield d
+    for d in overrides.values():                 # added since the snapshot
+        if d is not None:
+            yield d
+
+
+def _replay(records: List[dict]) -> List[dict]:
+    """Apply every journal entry on top of the snapshot records."""
+    overrides = _journal_overrides()
+    if not overrides:
+        return records
+
+    merged: Dict[str, dict] = {d["id"]: d for d in records}
+    for sid, d in overrides.items():
+        if d is None:
+            merged.pop(sid, None)
+        else:
+            merged[sid] = d
+    return list(merged.values())
+
+
+def _write_snapshot(records: Iterable[dict]) -> None:
+    """Atomically replace students.data (+ offset index), then drop the journal."""
+    if _CODEC is not None:
+        _write_compressed((d["id"], d["email"], offset_index.fragment(d)) for d in records)
+    else:
+        _write_encoded(*offset_index.encode(list(records)))
+
+
+def _fragments(students: Iterable[Student]) -> Iterator[Tuple[str, str, bytes]]:
+    """
+    (id, email, fragment) per student, yielded one at a time – only dirty
+    ones are re-encoded.  Metrics are recorded once the stream is drained.
+    """
+    encoded = reused = 0
+    for s in students:
+        frag = s.fragment
+        if frag is None:
+            frag = offset_index.fragment(s.to_dict())
+            s.cache_fragment(frag)
+            encoded += 1
+        else:
+            reused += 1
+        yield s.id, s.email, frag
+    metrics.incr("database.records_encoded", encoded)
+    metrics.incr("database.fragments_reused", reused)
+
+
+def _write_encoded(data: bytes, entries: List[offset_index.Entry]) -> None:
+    tmp = _DB_FILE.with_name(_DB_FILE.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    metrics.incr("database.bytes_written", len(data))
+    os.replace(tmp, _DB_FILE)
+    offset_index.write(_DB_FILE, entries)
+    _journal_path().unlink(missing_ok=True)
+    _bump()
+
+
+def _write_compressed(items: Iterable[Tuple[str, str, bytes]]) -> None:
+    """
+    Same bytes as `_write_encoded()` but streamed through `_CODEC`, one
+    record at a time.  Byte offsets mean nothing inside a compressed
+    stream, so the offset index is removed instead of rewritten.
+    """
+    tmp = _DB_FILE.with_name(_DB_FILE.name + ".tmp")
+    with snapshot_codec.open_writer(tmp, _CODEC) as out:
+        sep = b"[\n  "
+        for _, _, frag in items:
+            out.write(sep)
+            out.write(frag)
+            sep = b",\n  "
+        out.write(b"[]" if sep == b"[\n  " else b"\n]")
+    metrics.incr("database.bytes_written", tmp.stat().st_size)
+    os.replace(tmp, _DB_FILE)
+    offset_index.index_path(_DB_FILE).unlink(missing_ok=True)
+    _journal_path().unlink(missing_ok=True)
+    _bump()
+
+
+def _bump() -> None:
+    global _generation
+    _generation += 1
+
+
+def _stat(path: pathlib.Path) -> Tuple[int, int, int]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return (0, 0, -1)
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _sqlite_path() -> pathlib.Path:
+    """SQLite file lives next to the JSON one: students.data → students.sqlite"""
+    return _DB_FILE.with_suffix(".sqlite")
+
+
+def _record_path() -> pathlib.Path:
+    """Record file lives next to the JSON one: students.data → students.rec"""
+    return _DB_FILE.with_suffix(".rec")
+
 
+def _shard_count() -> int:
+    return _SHARDS
 
+
+def _open(backend: str):
+    """One store object per backend + file per process (lazy imports keep JSON lean)."""
+    if backend == "sqlite":
+        key = (backend, _sqlite_path())
+        if key not in _stores:
+            from data.sqlite_store import SQLiteStore
+            _stores[key] = SQLiteStore(_sqlite_path())
+    elif backend == "records":
+        key = (backend, _record_path())
+        if key not in _stores:
+            from data.record_store import RecordStore
+            _stores[key] = RecordStore(_record_path())
+    else:
+        key = (backend, _DB_FILE, _SHARDS)
+        if key not in _stores:
+            from data.shard_store import ShardedStore
+            _stores[key] = ShardedStore(_DB_FILE, _SHARDS)
+    return _stores[key]
+
+
+def _store():
+    """Return the active non-JSON backend object, or None for the JSON store."""
+    if _BACKEND == "json":
+        return None
+    return _open(_BACKEND)
+
+
+def _trim_torn_tail(journal: pathlib.Path) -> None:
+    """Cut an interrupted append (bytes after the last newline) off the journal."""
+    try:
+        f = open(journal, "r+b")
+    except FileNotFoundError:
+        return
+    with f:
+        pos = f.seek(0, os.SEEK_END)
+        if pos == 0:
+            return
+        f.seek(pos - 1)
+        if f.read(1) == b"\n":
+            return
+        while pos > 0:
+            step = min(pos, 4096)
+            pos -= step
+            f.seek(pos)
+            nl = f.read(step).rfind(b"\n")
+            if nl >= 0:
+                pos += nl + 1
+                break
+        f.truncate(pos)
+        metrics.incr("database.journal_tails_trimmed")
+
+
+def _append(entries: List[dict]) -> None:
+    """Append journal lines in ONE write; compact once the journal is too large."""
+    _ensure_file()
+    journal = _journal_path()
+    _trim_torn_tail(journal)                 # never glue a record onto a torn line
+    text = "".join(json.dumps(e, separators=(",", ":")) + "\n" for e in entries)
+    with open(journal, "a") as f:
+        f.write(text)
+    metrics.incr("database.journal_appends")
+    metrics.incr("database.bytes_written", len(text.encode()))
+    _bump()
+    if journal.stat().st_size > _JOURNAL_LIMIT:
+        compact()
+
+
+# ── public API ------------------------------------------------
+def configure(backend: str, shards: Optional[int] = None) -> None:
+    """Switch the storage backend for this process ("json", "sqlite", "sharded", "records")."""
+    global _BACKEND, _SHARDS
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}; expected one of {_BACKENDS}")
+    _BACKEND = backend
+    if shards is not None:
+        _SHARDS = shards
+    _bump()
+
+
+def set_compression(codec: Optional[str]) -> None:
+    """Compress future JSON snapshot writes with "gzip" / "zlib" / "lzma" (None = plain)."""
+    global _CODEC
+    _CODEC = snapshot_codec.check(codec)
+
+
+def rejection(name: str, email: str, password: str) -> Optional[str]:
+    """Why the active backend cannot store these fields (None = it can)."""
+    check = getattr(_store(), "rejection", None)
+    return check("000000", name, email, password) if check is not None else None
+
+
+@metrics.timed("database.load")
+def load(lazy: bool = False, committed: bool = False) -> List[Student]:
+    """
+    Read students.data (+ journal) → list[Student].
+
+    `lazy=True` returns students whose Subject objects are only built
+    when `subjects` is first accessed.  Inside a transaction the staged
+    changes are applied on top unless `committed=True`.
+    """
+    metrics.incr("database.loads")
+    store = _store()
+    if store is not None:
+        students = store.load()
+        metrics.incr("database.entries_parsed", len(students))
+    elif _compressed():                          # decode while decompressing
+        _ensure_file()
+        students = [Student.from_dict(d, lazy) for d in _iter_replayed()]
+    else:
+        students = [Student.from_dict(d, lazy) for d in _replay(_read_snapshot())]
+    tx = None if committed else current_transaction()
+    return students if tx is None else tx.overlay(students)
+
+
+def iter_students() -> Iterator[Student]:
+    """
+    Yield every student (lazily hydrated) in `load()` order without
+    materialising the population – for exports and other one-pass readers.
+    """
+    metrics.incr("database.streams")
+    store = _store()
+    if store is not None:
+        yield from (store.iter_students() if hasattr(store, "iter_students")
+                    else store.load())
+        return
+    for d in _iter_replayed():
+        yield Student.from_dict(d, lazy=True)
+
+
+@metrics.timed("database.save")
 def save(students: List[Student]) -> None:
-    """Write list[Student] → students.data (pretty-printed)."""
+    """Write list[Student] → students.data (pretty-printed), resetting the journal."""
+    tx = current_transaction()
+    if tx is not None:
+        tx.stage_save(students)
+        return
+    metrics.incr("database.saves")
+    store = _store()
+    if store is not None:
+        store.save(students)
+        _bump()
+        return
+    _ensure_file()
+    if _CODEC is not None:
+        _write_compressed(_fragments(students))
+    else:
+        _write_encoded(*offset_index.assemble(list(_fragments(students))))
+
+
+@metrics.timed("database.get")
+def get(student_id: str) -> Optional[Student]:
+    """Return ONE student by ID (None if absent) – decodes only that record."""
+    tx = current_transaction()
+    if tx is not None:
+        known, stu = tx.staged(student_id)
+        if known:
+            return stu
+    store = _store()
+    if store is not None:
+        return store.get(student_id)
+    overrides = _journal_overrides()
+    if student_id in overrides:
+        d = overrides[student_id]
+    elif _compressed():
+        return _scan(lambda d: d["id"] == student_id)
+    else:
+        _ensure_file()
+        d = offset_index.read(_DB_FILE, offset_index.load(_DB_FILE), student_id)
+    metrics.incr("database.indexed_lookups")
+    return Student.from_dict(d) if d is not None else None
+
+
+@metrics.timed("database.get_by_email")
+def get_by_email(email: str) -> Optional[Student]:
+    """Return ONE student by e-mail (None if absent) – decodes only that record."""
+    tx = current_transaction()
+    if tx is not None:
+        if tx.replace is not None:
+            return next((s for s in tx.overlay([]) if s.email == email), None)
+        staged = next((s for s in tx.upserts.values() if s.email == email), None)
+        if staged is not None:
+            return staged
+        found = _get_by_email(email)
+        return None if found is not None and found.id in tx.deletes else found
+    return _get_by_email(email)
+
+
+def _get_by_email(email: str) -> Optional[Student]:
+    store = _store()
+    if store is not None:
+        return store.get_by_email(email)
+    journal = _journal_state()
+    overrides = journal.overrides
+    d = overrides.get(journal.emails.get(email))
+    if d is not None and d["email"] == email:   # still that student's address
+        return Student.from_dict(d)
     _ensure_file()
-    with open(_DB_FILE, "w") as f:
-        json.dump([s.to_dict() for s in students], f, indent=2)
+    if _compressed():
+        found = _scan(lambda d: d["email"] == email)
+        return None if found is None or found.id in overrides else found
+    idx = offset_index.load(_DB_FILE)
+    sid = idx["emails"].get(email)
+    if sid is None or sid in overrides:       # changed / deleted since the snapshot
+        return None
+    metrics.incr("database.indexed_lookups")
+    return Student.from_dict(offset_index.read(_DB_FILE, idx, sid))
+
+
+def _scan(match: Callable[[dict], bool]) -> Optional[Student]:
+    """First snapshot record matching `match`, decoded while decompressing."""
+    metrics.incr("database.scanned_lookups")
+    d = next((d for d in _iter_snapshot() if match(d)), None)
+    return Student.from_dict(d) if d is not None else None
+
+
+@metrics.timed("database.upsert")
+def upsert(student: Student) -> None:
+    """Persist ONE new or changed student by appending it to the journal."""
+    tx = current_transaction()
+    if tx is not None:
+        tx.stage([student])
+        return
+    store = _store()
+    if store is not None:
+        store.upsert(student)
+        _bump()
+        return
+    _append([{"op": "put", "student": student.to_dict()}])
+
+
+@metrics.timed("database.upsert_many")
+def upsert_many(students: List[Student]) -> None:
+    """Persist a batch of new / changed students with ONE write."""
+    tx = current_transaction()
+    if tx is not None:
+        tx.stage(students)
+        return
+    store = _store()
+    if store is not None:
+        store.upsert_many(students)
+        _bump()
+        return
+    _append([{"op": "put", "student": s.to_dict()} for s in students])
+
+
+@metrics.timed("database.apply_changes")
+def apply_changes(upserts: List[Student], deletes: List[str]) -> None:
+    """Persist a mixed batch of upserts and deletions with ONE write."""
+    tx = current_transaction()
+    if tx is not None:
+        tx.stage(upserts, deletes)
+        return
+    store = _store()
+    if store is not None:
+        store.apply_changes(upserts, deletes)
+        _bump()
+        return
+    _append([{"op": "put", "student": s.to_dict()} for s in upserts]
+            + [{"op": "del", "id": sid} for sid in deletes])
+
+
+@metrics.timed("database.delete")
+def delete(student_id: str) -> None:
+    """Persist the removal of ONE student by appending it to the journal."""
+    tx = current_transaction()
+    if tx is not None:
+        tx.stage((), [student_id])
+        return
+    store = _store()
+    if store is not None:
+        store.delete(student_id)
+        _bump()
+        return
+    _append([{"op": "del", "id": student_id}])
+
+
+@contextmanager
+def transaction() -> Iterator[Transaction]:
+    """
+    Unit of work for the calling thread:
+
+        with database.transaction():
+            ...  # save / upsert / delete / apply_changes are only staged
+
+    `load` / `get` / `get_by_email` inside the block see the staged
+    changes.  On normal exit all of them are committed with ONE write
+    (`apply_changes`, or `save` if the block replaced everything); if
+    the block raises, nothing is written and the registered rollback
+    hooks run.  A nested block joins the outer transaction.
+    """
+    outer = current_transaction()
+    if outer is not None:
+        yield outer
+        return
+    tx = _local.tx = Transaction()
+    try:
+        yield tx
+    except BaseException:
+        _local.tx = None
+        _rollback(tx)
+        raise
+    _local.tx = None
+    try:
+        if tx.replace is not None:
+            save(tx.overlay([]))
+        elif tx.upserts or tx.deletes:
+            apply_changes(list(tx.upserts.values()), list(tx.deletes))
+    except BaseException:
+        _rollback(tx)                         # the single write failed: nothing landed
+        raise
+    metrics.incr("database.transactions")
+    for fn, args in tx._done:
+        fn(*args)
+
+
+def _rollback(tx: Transaction) -> None:
+    metrics.incr("database.rollbacks")
+    for fn, args in reversed(tx._undo):
+        fn(*args)
+
+
+def signature() -> tuple:
+    """
+    Cheap change-detector for the on-disk state: (inode, mtime_ns, size)
+    of snapshot and journal plus this process's write generation.
+    Equal signatures ⇒ `load()` would return the same data.
+    """
+    store = _store()
+    if store is not None:
+        return (_BACKEND, store.signature(), _generation)
+    return (_stat(_DB_FILE), _stat(_journal_path()), _generation)
+
+
+@metrics.timed("database.compact")
+def compact() -> None:
+    """Fold the journal into a fresh snapshot and truncate it."""
+    if _store() is not None:
+        return                           # only the JSON store has a journal
+    if _CODEC is not None:                # stream: never the whole list in memory
+        _write_snapshot(_iter_replayed())
+    else:
+        _write_snapshot(_replay(_read_snapshot()))
+
+
+def map_reduce(mapper: Callable[[List[Student]], T],
+               combine: Callable[[T, T], T]) -> T:
+    """
+    Run `mapper` over partitions of the population and `combine` the
+    results – per shard (in parallel) for the sharded backend, over one
+    full load otherwise.
+    """
+    store = _store()
+    if store is not None and hasattr(store, "map_reduce"):
+        return store.map_reduce(mapper, combine)
+    return mapper(load())
+
+
+def partitioned() -> bool:
+    """True when `map_reduce()` avoids materialising the whole population."""
+    return hasattr(_store(), "map_reduce")
+
+
+def migrate(backend: str) -> int:
+    """
+    One-shot migration: copy students.data (+ journal) into the given
+    backend's files.  Returns the number of students written.
+    """
+    records = _replay(_read_snapshot())
+    _open(backend).save_records(records)
+    _bump()
+    return len(records)
+
+
+def migrate_to_sqlite() -> int:
+    """Copy students.data (+ journal) into students.sqlite."""
+    return migrate("sqlite")
@@ -0,0 +1,126 @@
+"""
+data/offset_index.py
+────────────────────
+Sidecar index for the JSON snapshot: student ID / e-mail → byte range.
+
+• `students.data.idx` maps every ID to (offset, length) of its record
+  in `students.data` and every e-mail to its ID.
+• The index remembers the (mtime_ns, size) of the snapshot it was built
+  for; a mismatch means someone else rewrote the file, and the index is
+  rebuilt with one scan.
+• A lookup then reads and decodes only that slice of the file.
+"""
+
+from __future__ import annotations
+import os
+import json
+import pathlib
+from typing import Dict, List, Optional, Tuple
+
+# (student_id, email, offset, length)
+Entry = Tuple[str, str, int, int]
+
+_WS = " \t\r\n"
+
+# parsed indexes, keyed by (index path, snapshot stat)
+_cache: Dict[tuple, dict] = {}
+
+
+def index_path(snapshot: pathlib.Path) -> pathlib.Path:
+    return snapshot.with_name(snapshot.name + ".idx")
+
+
+def _stamp(snapshot: pathlib.Path) -> List[int]:
+    st = os.stat(snapshot)
+    return [st.st_mtime_ns, st.st_size]
+
+
+# ── encoding -------------------------------------------------
+def fragment(d: dict) -> bytes:
+    """One record as it appears inside the snapshot (without the indent)."""
+    return json.dumps(d, indent=2).replace("\n", "\n  ").encode()
+
+
+def encode(records: List[dict]) -> Tuple[bytes, List[Entry]]:
+    """
+    Byte-for-byte what `json.dump(records, f, indent=2)` writes, plus
+    the offset of every record inside it.
+    """
+    return assemble([(d["id"], d["email"], fragment(d)) for d in records])
+
+
+def assemble(items: List[Tuple[str, str, bytes]]) -> Tuple[bytes, List[Entry]]:
+    """`encode()` from ready-made (id, email, fragment) triples."""
+    if not items:
+        return b"[]", []
+    parts, entries, pos = [b"[\n"], [], 2
+    last = len(items) - 1
+    for i, (sid, email, frag) in enumerate(items):
+        entries.append((sid, email, pos + 2, len(frag)))        # skip indent
+        sep = b",\n" if i < last else b"\n]"
+        parts += [b"  ", frag, sep]
+        pos += 2 + len(frag) + len(sep)
+    return b"".join(parts), entries
+
+
+def scan(data: bytes) -> List[Entry]:
+    """Recover record offsets from an existing snapshot (one parse)."""
+    text = data.decode("latin-1")          # 1 char per byte ⇒ char offset = byte offset
+    decoder, entries = json.JSONDecoder(), []
+    pos = text.index("[") + 1
+    while True:
+        while pos < len(text) and text[pos] in _WS + ",":
+            pos += 1
+        if pos >= len(text) or text[pos] == "]":
+            return entries
+        d, end = decoder.raw_decode(text, pos)
+        entries.append((d["id"], d["email"], pos, end - pos))
+        pos = end
+
+
+# ── persistence ----------------------------------------------
+def write(snapshot: pathlib.Path, entries: List[Entry]) -> None:
+    idx = {
+        "snapshot": _stamp(snapshot),
+        "ids": {sid: [off, length] for sid, _, off, length in entries},
+        "emails": {email: sid for sid, email, _, _ in entries},
+    }
+    path = index_path(snapshot)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(idx, separators=(",", ":")))
+    os.replace(tmp, path)
+    _cache[(path, tuple(idx["snapshot"]))] = idx
+
+
+def load(snapshot: pathlib.Path) -> Optional[dict]:
+    """Current index for *snapshot*, rebuilding it if missing or stale."""
+    try:
+        stamp = _stamp(snapshot)
+    except FileNotFoundError:
+        return None
+    path = index_path(snapshot)
+    key = (path, tuple(stamp))
+    if key in _cache:
+        return _cache[key]
+
+    idx = None
+    if path.exists():
+        try:
+            idx = json.loads(path.read_text())
+        except ValueError:
+            idx = None
+    if idx is None or idx.get("snapshot") != stamp:
+        write(snapshot, scan(snapshot.read_bytes()))
+        return _cache.get((path, tuple(_stamp(snapshot))))
+    _cache[key] = idx
+    return idx
+
+
+def read(snapshot: pathlib.Path, idx: dict, student_id: str) -> Optional[dict]:
+    """Decode only the record for *student_id* (None if not indexed)."""
+    loc = idx["ids"].get(student_id)
+    if loc is None:
+        return None
+    with open(snapshot, "rb") as f:
+        f.seek(loc[0])
+        return json.loads(f.read(loc[1]))
@@ -0,0 +1,327 @@
+"""
+data/record_store.py
+────────────────────
+Fixed-width binary storage backend on a memory-mapped file.
+
+• `students.rec` = a 32-byte header + one fixed-width slot per student
+  (ID, name, e-mail, password and up to 4 subjects – see `_HEAD` /
+  `_BODY`); fields are NUL-padded UTF-8 with hard maximum widths.
+• Deleted slots are chained into a free list (head in the header) and
+  reused by the next insert; the file only grows when the list is empty.
+• `upsert` of a known student rewrites just the password + subjects
+  part of its slot in place – an enrolment touches ~70 bytes.
+• `read(slot)` unpacks one slot straight out of the mapping; nothing
+  else in the file is read or parsed.  ID / e-mail → slot maps are
+  built once by scanning the slot heads.
+• Every write bumps a generation counter in the header, so other
+  processes mapping the same file notice and rebuild their maps.
+• Selected with `UNIAPP_BACKEND=records` or `database.configure("records")`;
+  `python -m data.record_store` migrates the JSON file once.
+"""
+
+from __future__ import annotations
+import os
+import mmap
+import struct
+import pathlib
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from models.student import Student
+
+_MAGIC = b"UNIREC01"
+_HEADER = struct.Struct("<8sIIiIQ")     # magic, slot size, capacity, free head, live, generation
+
+# slot = head (identity, written once) + body (updated in place)
+_HEAD = struct.Struct("<Bi8s64s96s")    # live flag, next free slot, id, name, email
+_BODY = struct.Struct("<64sB" + "4sB2s" * 4)   # password, #subjects, 4 × (id, mark, grade)
+_SLOT = _HEAD.size + _BODY.size
+
+_FREE, _LIVE = 0, 1
+_MIN_CAPACITY = 64
+
+
+def _misfit(text: str, width: int, field: str) -> Optional[str]:
+    data = text.encode()
+    if len(data) > width or b"\0" in data:
+        return f"{field} {text!r} does not fit the {width}-byte record field"
+    return None
+
+
+def _pack(text: str, width: int, field: str) -> bytes:
+    reason = _misfit(text, width, field)
+    if reason:
+        raise ValueError(reason)
+    return text.encode()
+
+
+def _text(raw: bytes) -> str:
+    return raw.rstrip(b"\0").decode()
+
+
+def _body(d: dict) -> tuple:
+    subjects = d.get("subjects", [])
+    if len(subjects) > 4:
+        raise ValueError(f"student {d['id']} has more than 4 subjects")
+    fields = [_pack(d["password"], 64, "password"), len(subjects)]
+    for s in subjects:
+        fields += [_pack(s["id"], 4, "subject id"), s["mark"], _pack(s["grade"], 2, "grade")]
+    fields += [b"", 0, b""] * (4 - len(subjects))
+    return tuple(fields)
+
+
+def _head(d: dict) -> tuple:
+    return (_LIVE, -1, _pack(d["id"], 8, "student id"),
+            _pack(d["name"], 64, "name"), _pack(d["email"], 96, "email"))
+
+
+def _empty_file(capacity: int) -> bytearray:
+    buf = bytearray(_HEADER.size + capacity * _SLOT)
+    _HEADER.pack_into(buf, 0, _MAGIC, _SLOT, capacity, -1, 0, 0)
+    return buf
+
+
+class RecordStore:
+    """Slot file + in-memory ID / e-mail → slot maps; one lock per process."""
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = pathlib.Path(path)
+        self._lock = threading.Lock()
+        self._mm: Optional[mmap.mmap] = None
+        self._ino = -1
+        self._gen = -1
+        self._slots: Dict[str, int] = {}        # student id → slot
+        self._emails: Dict[str, str] = {}       # e-mail → student id
+        if not self.path.exists():
+            self._replace([])
+        self._map()
+
+    # ── mapping / header -------------------------------------
+    def _map(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+        with open(self.path, "r+b") as f:
+            self._mm = mmap.mmap(f.fileno(), 0)
+            self._ino = os.fstat(f.fileno()).st_ino
+        magic, slot, *_ = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or slot != _SLOT:
+            raise ValueError(f"{self.path} is not a UniApp record file")
+        self._gen = -1
+
+    def _header(self) -> Tuple[int, int, int, int]:
+        """(capacity, free head, live count, generation)"""
+        return _HEADER.unpack_from(self._mm, 0)[2:]
+
+    def _set_header(self, capacity: int, free: int, live: int) -> None:
+        gen = self._header()[3] + 1
+        _HEADER.pack_into(self._mm, 0, _MAGIC, _SLOT, capacity, free, live, gen)
+        self._gen = gen
+
+    def _sync(self) -> None:
+        """Re-map / re-index if another process replaced or changed the file."""
+        try:
+            if os.stat(self.path).st_ino != self._ino:
+                self._map()
+        except FileNotFoundError:
+            self._replace([])
+            self._map()
+        capacity, _, _, gen = self._header()
+        if gen == self._gen:
+            return
+        if _HEADER.size + capacity * _SLOT > len(self._mm):   # grown elsewhere
+            self._map()
+            capacity, _, _, gen = self._header()
+        slots, emails = {}, {}
+        for slot in range(capacity):
+            live, _, sid, _, email = _HEAD.unpack_from(self._mm, self._offset(slot))
+            if live == _LIVE:
+                sid = _text(sid)
+                slots[sid] = slot
+                emails[_text(email)] = sid
+        self._slots, self._emails, self._gen = slots, emails, gen
+
+    @staticmethod
+    def _offset(slot: int) -> int:
+        return _HEADER.size + slot * _SLOT
+
+    # ── slot access ------------------------------------------
+    def read(self, slot: int) -> Optional[Student]:
+        """Decode ONE slot from the mapping (None if it is free)."""
+        off = self._offset(slot)
+        live, _, sid, name, email = _HEAD.unpack_from(self._mm, off)
+        if live != _LIVE:
+            return None
+        body = _BODY.unpack_from(self._mm, off + _HEAD.size)
+        subjects = [{"id": _text(body[i]), "mark": body[i + 1], "grade": _text(body[i + 2])}
+                    for i in range(2, 2 + 3 * body[1], 3)]
+        return Student.from_dict({"id": _text(sid), "name": _text(name), "email": _text(email),
+                                  "password": _text(body[0]), "subjects": subjects})
+
+    def slot_of(self, student_id: str) -> Optional[int]:
+        with self._lock:
+            self._sync()
+            return self._slots.get(student_id)
+
+    def _grow(self, capacity: int) -> None:
+        new = max(_MIN_CAPACITY, capacity * 2)
+        self._mm.flush()
+        self._mm.close()
+        self._mm = None
+        with open(self.path, "r+b") as f:
+            f.truncate(_HEADER.size + new * _SLOT)
+        self._map()
+        _, free, live, gen = self._header()
+        # chain the new slots onto the free list, lowest first
+        for slot in range(new - 1, capacity - 1, -1):
+            _HEAD.pack_into(self._mm, self._offset(slot), _FREE, free, b"", b"", b"")
+            free = slot
+        self._gen = gen
+        self._set_header(new, free, live)
+
+    def _put(self, d: dict) -> None:
+        head, body = _head(d), _body(d)          # validate before touching a slot
+        slot = self._slots.get(d["id"])
+        if slot is not None:                     # in place: password + subjects only
+            off = self._offset(slot)
+            _BODY.pack_into(self._mm, off + _HEAD.size, *body)
+            ident = _HEAD.pack(*head)[5:]        # id / name / e-mail (normally unchanged)
+            if self._mm[off + 5:off + _HEAD.size] != ident:
+                old = _text(_HEAD.unpack_from(self._mm, off)[4])
+                self._emails.pop(old, None)
+                self._mm[off + 5:off + _HEAD.size] = ident
+                self._emails[d["email"]] = d["id"]
+            return
+        capacity, free, live, _ = self._header()
+        if free < 0:
+            self._grow(capacity)
+            capacity, free, live, _ = self._header()
+        off = self._offset(free)
+        nxt = _HEAD.unpack_from(self._mm, off)[1]
+        _HEAD.pack_into(self._mm, off, *head)
+        _BODY.pack_into(self._mm, off + _HEAD.size, *body)
+        self._slots[d["id"]] = free
+        self._emails[d["email"]] = d["id"]
+        self._set_header(capacity, nxt, live + 1)
+
+    def _drop(self, student_id: str) -> None:
+        slot = self._slots.pop(student_id, None)
+        if slot is None:
+            return
+        capacity, free, live, _ = self._header()
+        off = self._offset(slot)
+        email = _text(_HEAD.unpack_from(self._mm, off)[4])
+        self._emails.pop(email, None)
+        _HEAD.pack_into(self._mm, off, _FREE, free, b"", b"", b"")
+        self._set_header(capacity, slot, live - 1)
+
+    def _replace(self, records: Iterable[dict]) -> int:
+        """Write a fresh file holding `records` and swap it in atomically."""
+        packed = [(_head(d), _body(d)) for d in records]
+        capacity = max(_MIN_CAPACITY, len(packed))
+        buf = _empty_file(capacity)
+        for slot, (head, body) in enumerate(packed):
+            _HEAD.pack_into(buf, self._offset(slot), *head)
+            _BODY.pack_into(buf, self._offset(slot) + _HEAD.size, *body)
+        for slot in range(len(packed), capacity):
+            nxt = slot + 1 if slot + 1 < capacity else -1
+            _HEAD.pack_into(buf, self._offset(slot), _FREE, nxt, b"", b"", b"")
+        free = len(packed) if len(packed) < capacity else -1
+        gen = self._header()[3] + 1 if self._mm is not None else 0
+        _HEADER.pack_into(buf, 0, _MAGIC, _SLOT, capacity, free, len(packed), gen)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_bytes(buf)
+        os.replace(tmp, self.path)
+        return len(packed)
+
+    # ── bulk API (load / save) --------------------------------
+    def load(self) -> List[Student]:
+        with self._lock:
+            self._sync()
+            return [self.read(slot) for slot in sorted(self._slots.values())]
+
+    def iter_students(self, page: int = 1000) -> Iterator[Student]:
+        """Every student in slot order, `page` slots decoded per lock hold."""
+        with self._lock:
+            self._sync()
+            slots = sorted(self._slots.values())
+        for i in range(0, len(slots), page):
+            with self._lock:
+                self._sync()
+                chunk = [self.read(s) for s in slots[i:i + page]]
+            yield from (s for s in chunk if s is not None)
+
+    def save(self, students: List[Student]) -> None:
+        self.save_records(s.to_dict() for s in students)
+
+    def save_records(self, records: Iterable[dict]) -> int:
+        """Replace the whole population with `records`."""
+        with self._lock:
+            n = self._replace(records)
+            self._map()
+            self._sync()
+            return n
+
+    # ── record-level API --------------------------------------
+    @staticmethod
+    def rejection(student_id: str, name: str, email: str, password: str) -> Optional[str]:
+        """Why these fields cannot be stored in a slot, or None if they fit."""
+        return (_misfit(student_id, 8, "student id") or _misfit(name, 64, "name")
+                or _misfit(email, 96, "email") or _misfit(password, 64, "password"))
+
+    def get(self, student_id: str) -> Optional[Student]:
+        with self._lock:
+            self._sync()
+            slot = self._slots.get(student_id)
+            return None if slot is None else self.read(slot)
+
+    def get_by_email(self, email: str) -> Optional[Student]:
+        with self._lock:
+            self._sync()
+            sid = self._emails.get(email)
+            return None if sid is None else self.read(self._slots[sid])
+
+    def upsert(self, student: Student) -> None:
+        self.upsert_many([student])
+
+    def upsert_many(self, students: Iterable[Student]) -> None:
+        self.apply_changes(students, [])
+
+    def delete(self, student_id: str) -> None:
+        self.apply_changes([], [student_id])
+
+    def apply_changes(self, upserts: Iterable[Student], deletes: Iterable[str]) -> None:
+        records = [s.to_dict() for s in upserts]
+        for d in records:                        # all-or-nothing on bad input
+            _head(d), _body(d)
+        with self._lock:
+            self._sync()
+            for d in records:
+                self._put(d)
+            for sid in deletes:
+                self._drop(sid)
+            capacity, free, live, _ = self._header()
+            self._set_header(capacity, free, live)
+
+    def signature(self) -> tuple:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return (0, -1, -1)
+        with self._lock:
+            gen = self._header()[3] if st.st_ino == self._ino else -1
+        return (st.st_ino, st.st_size, gen)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._mm is not None:
+                self._mm.flush()
+                self._mm.close()
+                self._mm = None
+
+
+if __name__ == "__main__":
+    import sys
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from data import database
+    print(f"Migrated {database.migrate('records')} students "
+          f"→ {database._record_path()}")
@@ -0,0 +1,202 @@
+"""
+data/shard_store.py
+───────────────────
+Sharded JSON backend: the population is split over N files
+(`students.data.shard-00` …) by student-ID hash.
+
+• `load()` parses shards in parallel on a ProcessPoolExecutor once the
+  data is big enough to pay for the worker start-up.
+• `save()` re-encodes every shard but only rewrites the files whose
+  bytes actually changed (tracked by digest since the last load/save).
+• Record-level calls touch one shard; `map_reduce()` runs a function
+  per shard in the pool so admin queries never build one giant list.
+• Selected with `UNIAPP_BACKEND=sharded` (`UNIAPP_SHARDS`, default 8).
+"""
+
+from __future__ import annotations
+import os
+import json
+import zlib
+import hashlib
+import pathlib
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from models.student import Student
+
+T = TypeVar("T")
+
+# below this many bytes on disk a serial load beats starting workers
+_PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+
+# ── worker-side helpers (top level so they pickle) ────────────
+def _read(path: pathlib.Path) -> List[dict]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _load_shard(path: pathlib.Path) -> Tuple[Optional[bytes], List[Student]]:
+    """(digest of the file bytes, hydrated students) for one shard."""
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None, []
+    return _digest(data), [Student.from_dict(d) for d in json.loads(data)]
+
+
+def _map_shard(job) -> object:
+    path, mapper = job
+    return mapper([Student.from_dict(d) for d in _read(path)])
+
+
+def _encode(records: List[dict]) -> bytes:
+    return json.dumps(records, separators=(",", ":")).encode()
+
+
+class ShardedStore:
+    """N JSON shard files addressed by `shard_of(student_id)`."""
+
+    def __init__(self, base: pathlib.Path, shards: int) -> None:
+        self.base = pathlib.Path(base)
+        self.shards = shards
+        self.paths = [self.base.with_name(f"{self.base.name}.shard-{i:02d}")
+                      for i in range(shards)]
+        self._digests: Dict[int, bytes] = {}
+        self._lock = threading.Lock()
+
+    # ── addressing ------------------------------------------
+    def shard_of(self, student_id: str) -> int:
+        key = int(student_id) if student_id.isdigit() else zlib.crc32(student_id.encode())
+        return key % self.shards
+
+    def _parallel(self) -> bool:
+        if self.shards < 2 or (os.cpu_count() or 1) < 2:
+            return False
+        size = sum(p.stat().st_size for p in self.paths if p.exists())
+        return size >= _PARALLEL_MIN_BYTES
+
+    def _map(self, fn: Callable, jobs: list) -> list:
+        if not self._parallel():
+            return [fn(j) for j in jobs]
+        with ProcessPoolExecutor(max_workers=min(self.shards, os.cpu_count())) as pool:
+            return list(pool.map(fn, jobs))
+
+    # ── shard I/O -------------------------------------------
+    def _write_shard(self, i: int, data: bytes) -> bool:
+        """Write shard *i* atomically unless it already holds *data*."""
+        digest = _digest(data)
+        if self._digests.get(i) == digest and self.paths[i].exists():
+            return False
+        tmp = self.paths[i].with_name(self.paths[i].name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, self.paths[i])
+        self._digests[i] = digest
+        return True
+
+    def _partition(self, records: Iterable[dict]) -> List[List[dict]]:
+        parts: List[List[dict]] = [[] for _ in range(self.shards)]
+        for d in records:
+            parts[self.shard_of(d["id"])].append(d)
+        return parts
+
+    # ── bulk API ---------------------------------------------
+    def load(self) -> List[Student]:
+        """Every student, shard by shard (order is shard order, not insertion)."""
+        with self._lock:
+            parts = self._map(_load_shard, self.paths)
+            for i, (digest, _) in enumerate(parts):
+                if digest is not None:
+                    self._digests[i] = digest
+        return [s for _, part in parts for s in part]
+
+    def iter_students(self) -> Iterator[Student]:
+        """Every student, one shard in memory at a time."""
+        for path in self.paths:
+            for d in _read(path):
+                yield Student.from_dict(d, lazy=True)
+
+    def save(self, students: List[Student]) -> int:
+        """Rewrite only the shards whose content changed; returns #files written."""
+        return self.save_records(s.to_dict() for s in students)
+
+    def save_records(self, records: Iterable[dict]) -> int:
+        with self._lock:
+            parts = self._partition(records)
+            return sum(self._write_shard(i, _encode(p)) for i, p in enumerate(parts))
+
+    def map_reduce(self, mapper: Callable[[List[Student]], T],
+                   combine: Callable[[T, T], T]) -> T:
+        """`combine` the per-shard results of `mapper(students_in_shard)`."""
+        return reduce(combine, self._map(_map_shard, [(p, mapper) for p in self.paths]))
+
+    # ── record-level API ---------------------------------------
+    def get(self, student_id: str) -> Optional[Student]:
+        for d in _read(self.paths[self.shard_of(student_id)]):
+            if d["id"] == student_id:
+                return Student.from_dict(d)
+        return None
+
+    def get_by_email(self, email: str) -> Optional[Student]:
+        for path in self.paths:
+            for d in _read(path):
+                if d["email"] == email:
+                    return Student.from_dict(d)
+        return None
+
+    def upsert(self, student: Student) -> None:
+        self.apply_changes([student], [])
+
+    def upsert_many(self, students: Iterable[Student]) -> None:
+        self.apply_changes(students, [])
+
+    def delete(self, student_id: str) -> None:
+        self.apply_changes([], [student_id])
+
+    def apply_changes(self, upserts: Iterable[Student], deletes: Iterable[str]) -> None:
+        """Read-modify-write only the shards the changes fall into."""
+        touched: Dict[int, Dict[str, Optional[dict]]] = {}
+        for s in upserts:
+            touched.setdefault(self.shard_of(s.id), {})[s.id] = s.to_dict()
+        for sid in deletes:
+            touched.setdefault(self.shard_of(sid), {})[sid] = None
+
+        with self._lock:
+            for i, changes in touched.items():
+                merged = {d["id"]: d for d in _read(self.paths[i])}
+                for sid, d in changes.items():
+                    if d is None:
+                        merged.pop(sid, None)
+                    else:
+                        merged[sid] = d
+                self._write_shard(i, _encode(list(merged.values())))
+
+    def signature(self) -> tuple:
+        out = []
+        for p in self.paths:
+            try:
+                st = os.stat(p)
+                out.append((st.st_ino, st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                out.append(None)
+        return tuple(out)
+
+    def close(self) -> None:
+        """Nothing held open between calls (API parity with SQLiteStore)."""
+
+
+if __name__ == "__main__":
+    import sys
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from data import database
+    print(f"Migrated {database.migrate('sharded')} students into "
+          f"{database._shard_count()} shards next to {database._DB_FILE}")
@@ -0,0 +1,70 @@
+"""
+data/snapshot_cache.py
+──────────────────────
+Process-wide cache of the hydrated student list.
+
+• Keyed on `database.signature()` – inode, mtime_ns and size of the
+  snapshot and journal (plus this process's write generation).
+• Re-parses only when the files actually changed; otherwise hands back
+  the same `List[Student]`, so callers must treat it as read-only.
+• Only committed data is cached; inside `database.transaction()` the
+  staged changes are laid over the cached copy for that caller.
+• Hit / miss counters are exposed through `stats()`.
+"""
+
+from __future__ import annotations
+from typing import List, Optional
+
+from data import database
+from models.student import Student
+from utils import metrics
+
+
+class SnapshotCache:
+    """One cached snapshot + the signature it was loaded under."""
+
+    def __init__(self) -> None:
+        self._sig: Optional[tuple] = None
+        self._students: Optional[List[Student]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self) -> List[Student]:
+        sig = database.signature()
+        if self._students is None or sig != self._sig:
+            self.misses += 1
+            metrics.incr("snapshot_cache.misses")
+            self._students = database.load(committed=True)
+            self._sig = sig
+        else:
+            self.hits += 1
+            metrics.incr("snapshot_cache.hits")
+        tx = database.current_transaction()
+        if tx is not None and (tx.upserts or tx.deletes or tx.replace is not None):
+            return tx.overlay(self._students)
+        return self._students
+
+    def invalidate(self) -> None:
+        self._sig = self._students = None
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+_CACHE = SnapshotCache()
+
+
+# ── public API ------------------------------------------------
+def cached_load() -> List[Student]:
+    """`database.load()` – but free when nothing changed on disk."""
+    return _CACHE.get()
+
+
+def stats() -> dict:
+    """Return {'hits': n, 'misses': m} for the process-wide cache."""
+    return _CACHE.stats()
+
+
+def invalidate() -> None:
+    """Drop the cached snapshot (next `cached_load()` re-parses)."""
+    _CACHE.invalidate()
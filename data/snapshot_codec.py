@@ -0,0 +1,133 @@
+"""
+data/snapshot_codec.py
+──────────────────────
+Optional compression of the JSON snapshot (stdlib gzip / zlib / lzma).
+
+• `detect(head)` tells the codec from the first bytes of the file –
+  plain JSON starts with "[" or whitespace, so no flag is stored.
+• `open_text(path)` returns a text stream that decompresses on the fly;
+  `open_writer(path, codec)` a binary stream that compresses on the fly.
+  Neither ever holds the whole (de)compressed file in memory.
+"""
+
+from __future__ import annotations
+import io
+import gzip
+import lzma
+import zlib
+import pathlib
+from typing import BinaryIO, Optional, TextIO
+
+CODECS = ("gzip", "zlib", "lzma")
+
+_CHUNK = 64 * 1024
+_MAGIC = ((b"\x1f\x8b", "gzip"), (b"\xfd7zXZ\x00", "lzma"))
+
+
+def detect(head: bytes) -> Optional[str]:
+    """Codec name for a file starting with `head`, or None for plain JSON."""
+    for magic, codec in _MAGIC:
+        if head.startswith(magic):
+            return codec
+    # zlib: CMF 0x78 (deflate, 32K window) and a header checksum
+    if len(head) >= 2 and head[0] == 0x78 and (head[0] << 8 | head[1]) % 31 == 0:
+        return "zlib"
+    return None
+
+
+def codec_of(path: pathlib.Path) -> Optional[str]:
+    """Sniff the codec of an existing file (None if plain or missing)."""
+    try:
+        with open(path, "rb") as f:
+            return detect(f.read(6))
+    except FileNotFoundError:
+        return None
+
+
+def check(codec: Optional[str]) -> Optional[str]:
+    """Validate a codec name ("" / None = uncompressed)."""
+    if codec and codec not in CODECS:
+        raise ValueError(f"Unknown compression {codec!r}; expected one of {CODECS}")
+    return codec or None
+
+
+class _ZlibReader(io.RawIOBase):
+    """Raw stream that inflates a zlib file chunk by chunk."""
+
+    def __init__(self, f: BinaryIO) -> None:
+        self._f = f
+        self._z = zlib.decompressobj()
+        self._buf = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def fileno(self) -> int:
+        return self._f.fileno()
+
+    def readinto(self, b) -> int:
+        while not self._buf:
+            if self._z.eof:
+                return 0
+            chunk = self._f.read(_CHUNK)
+            if not chunk:
+                self._buf = self._z.flush()
+                if not self._buf:
+                    raise EOFError("truncated zlib snapshot")
+                break
+            self._buf = self._z.decompress(chunk)
+        n = min(len(b), len(self._buf))
+        b[:n] = self._buf[:n]
+        self._buf = self._buf[n:]
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._f.close()
+        super().close()
+
+
+class _ZlibWriter(io.RawIOBase):
+    """Raw stream that deflates everything written to it into a file."""
+
+    def __init__(self, f: BinaryIO) -> None:
+        self._f = f
+        self._z = zlib.compressobj(6)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._f.write(self._z.compress(data))
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._f.write(self._z.flush())
+            self._f.close()
+        super().close()
+
+
+def open_text(path: pathlib.Path) -> TextIO:
+    """UTF-8 text stream over a plain or compressed snapshot."""
+    codec = codec_of(path)
+    if codec is None:
+        return open(path, encoding="utf-8")
+    if codec == "gzip":
+        raw = gzip.open(path, "rb")
+    elif codec == "lzma":
+        raw = lzma.open(path, "rb")
+    else:
+        raw = io.BufferedReader(_ZlibReader(open(path, "rb")), _CHUNK)
+    return io.TextIOWrapper(raw, encoding="utf-8")
+
+
+def open_writer(path: pathlib.Path, codec: str) -> BinaryIO:
+    """Binary stream that writes `codec`-compressed bytes to `path`."""
+    if codec == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    if codec == "lzma":
+        return lzma.open(path, "wb")
+    if codec == "zlib":
+        return _ZlibWriter(open(path, "wb"))
+    raise ValueError(f"Unknown compression {codec!r}; expected one of {CODECS}")
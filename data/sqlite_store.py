@@ -0,0 +1,186 @@
+"""
+data/sqlite_store.py
+────────────────────
+SQLite storage backend (stdlib `sqlite3`).
+
+• `students` / `subjects` tables, indexed on `email` and `id`.
+• Same `load()` / `save()` contract as the JSON store, plus
+  record-level `get` / `get_by_email` / `upsert` / `delete` so one
+  enrolment touches one row set instead of the whole population.
+• `iter_students()` pages through the table by ID for streaming readers.
+• Selected with `UNIAPP_BACKEND=sqlite` or `database.configure("sqlite")`;
+  `python -m data.sqlite_store` migrates the JSON file once.
+"""
+
+from __future__ import annotations
+import os
+import sqlite3
+import pathlib
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from models.student import Student
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    id       TEXT PRIMARY KEY,
+    name     TEXT NOT NULL,
+    email    TEXT NOT NULL,
+    password TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_students_email ON students(email);
+CREATE TABLE IF NOT EXISTS subjects (
+    student_id TEXT    NOT NULL REFERENCES students(id) ON DELETE CASCADE,
+    seq        INTEGER NOT NULL,
+    id         TEXT    NOT NULL,
+    mark       INTEGER NOT NULL,
+    grade      TEXT    NOT NULL,
+    PRIMARY KEY (student_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_subjects_id ON subjects(id);
+"""
+
+_UPSERT_STUDENT = (
+    "INSERT INTO students (id, name, email, password) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(id) DO UPDATE SET name=excluded.name, "
+    "email=excluded.email, password=excluded.password"
+)
+_INSERT_SUBJECT = (
+    "INSERT INTO subjects (student_id, seq, id, mark, grade) VALUES (?, ?, ?, ?, ?)"
+)
+
+
+class SQLiteStore:
+    """One connection per database file; all writes are single transactions."""
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = pathlib.Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(_SCHEMA)
+
+    # ── hydration helpers ------------------------------------
+    @staticmethod
+    def _student(row, subjects: List[dict]) -> Student:
+        sid, name, email, password = row
+        return Student.from_dict({
+            "id": sid, "name": name, "email": email,
+            "password": password, "subjects": subjects,
+        })
+
+    def _subjects_of(self, student_id: str) -> List[dict]:
+        cur = self._conn.execute(
+            "SELECT id, mark, grade FROM subjects WHERE student_id = ? ORDER BY seq",
+            (student_id,),
+        )
+        return [{"id": i, "mark": m, "grade": g} for i, m, g in cur]
+
+    def _one(self, where: str, value: str) -> Optional[Student]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT id, name, email, password FROM students WHERE {where} = ?",
+                (value,),
+            ).fetchone()
+            if row is None:
+                return None
+            return self._student(row, self._subjects_of(row[0]))
+
+    @staticmethod
+    def _write(cur: sqlite3.Cursor, records: Iterable[dict]) -> int:
+        n = 0
+        for d in records:
+            cur.execute(_UPSERT_STUDENT, (d["id"], d["name"], d["email"], d["password"]))
+            cur.execute("DELETE FROM subjects WHERE student_id = ?", (d["id"],))
+            cur.executemany(_INSERT_SUBJECT, [
+                (d["id"], seq, s["id"], s["mark"], s["grade"])
+                for seq, s in enumerate(d.get("subjects", []))
+            ])
+            n += 1
+        return n
+
+    # ── bulk API (load / save) --------------------------------
+    def load(self) -> List[Student]:
+        with self._lock:
+            subjects: Dict[str, List[dict]] = {}
+            for sid, i, m, g in self._conn.execute(
+                "SELECT student_id, id, mark, grade FROM subjects ORDER BY student_id, seq"
+            ):
+                subjects.setdefault(sid, []).append({"id": i, "mark": m, "grade": g})
+            rows = self._conn.execute(
+                "SELECT id, name, email, password FROM students ORDER BY rowid"
+            ).fetchall()
+        return [self._student(r, subjects.get(r[0], [])) for r in rows]
+
+    def iter_students(self, page: int = 1000) -> Iterator[Student]:
+        """Every student in ID order, fetched `page` rows at a time."""
+        last = ""
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT id, name, email, password FROM students "
+                    "WHERE id > ? ORDER BY id LIMIT ?", (last, page),
+                ).fetchall()
+                if not rows:
+                    return
+                subjects: Dict[str, List[dict]] = {}
+                for sid, i, m, g in self._conn.execute(
+                    "SELECT student_id, id, mark, grade FROM subjects "
+                    "WHERE student_id BETWEEN ? AND ? ORDER BY student_id, seq",
+                    (rows[0][0], rows[-1][0]),
+                ):
+                    subjects.setdefault(sid, []).append({"id": i, "mark": m, "grade": g})
+            for r in rows:                       # yield outside the lock
+                yield self._student(r, subjects.get(r[0], []))
+            last = rows[-1][0]
+
+    def save(self, students: List[Student]) -> None:
+        self.save_records(s.to_dict() for s in students)
+
+    def save_records(self, records: Iterable[dict]) -> int:
+        """Replace the whole population with `records` in ONE transaction."""
+        with self._lock, self._conn:
+            cur = self._conn.cursor()
+            cur.execute("DELETE FROM subjects")
+            cur.execute("DELETE FROM students")
+            return self._write(cur, records)
+
+    # ── record-level API --------------------------------------
+    def get(self, student_id: str) -> Optional[Student]:
+        return self._one("id", student_id)
+
+    def get_by_email(self, email: str) -> Optional[Student]:
+        return self._one("email", email)
+
+    def upsert(self, student: Student) -> None:
+        self.upsert_many([student])
+
+    def upsert_many(self, students: Iterable[Student]) -> None:
+        self.apply_changes(students, [])
+
+    def delete(self, student_id: str) -> None:
+        self.apply_changes([], [student_id])
+
+    def apply_changes(self, upserts: Iterable[Student], deletes: Iterable[str]) -> None:
+        with self._lock, self._conn:
+            cur = self._conn.cursor()
+            self._write(cur, (s.to_dict() for s in upserts))
+            cur.executemany("DELETE FROM students WHERE id = ?", [(i,) for i in deletes])
+
+    def signature(self) -> tuple:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return (0, 0, -1)
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+if __name__ == "__main__":
+    import sys
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from data import database
+    print(f"Migrated {database.migrate_to_sqlite()} students "
+          f"→ {database._sqlite_path()}")
@@ -5,11 +5,19 @@ models/student.py
 • Registration-time validation handled by StudentController
 • Up to 4 subjects; auto-grade mark on enrol
 • JSON (de)serialise helpers for Database layer
+• average / grade computed once and cached until enrol / remove_subject
+  (or an in-place mark / grade change of one of its subjects)
+• `__slots__` (no per-instance dict) to keep large populations small
+• `from_dict(..., lazy=True)` keeps the raw subject dicts and only builds
+  Subject objects the first time `subjects` is touched
+• The encoded snapshot fragment is cached per student and dropped by
+  enrol / remove_subject / change_password (`dirty`), so a save only
+  re-encodes the students that changed
 """
 
 from __future__ import annotations
-from typing import List
-from utils.utility import validate_password, generate_student_id
+from typing import List, Optional, Tuple
+from utils.utility import validate_password, generate_student_id, reserve_student_id
 from models.subject import Subject
 
 # ── Grade cut-offs (spec) ────────────────────────────────
@@ -25,6 +33,9 @@ _GRADE_BANDS = [
 class Student:
     """Domain model representing ONE student."""
 
+    __slots__ = ("__id", "__name", "__email", "__password", "__subjects",
+                 "__raw", "__stats", "__frag")
+
     # ---------- construction ----------------------------------
     def __init__(self, name: str, email: str, password: str) -> None:
         self.__id: str = generate_student_id()
@@ -32,6 +43,9 @@ class Student:
         self.__email: str = email
         self.__password: str = password
         self.__subjects: List[Subject] = []
+        self.__raw: Optional[List[dict]] = None     # un-hydrated subjects (lazy load)
+        self.__stats: Optional[Tuple[tuple, float, str]] = None
+        self.__frag: Optional[Tuple[tuple, bytes]] = None   # (state key, bytes)
 
     # ---------- read-only / controlled attributes -------------
     @property
@@ -49,21 +63,55 @@ class Student:
     @property
     def subjects(self) -> List[Subject]:
         """Exposes the list for iteration; list itself remains private."""
+        if self.__raw is not None:                  # first touch after lazy load
+            self.__subjects = [Subject.from_dict(x) for x in self.__raw]
+            self.__raw = None
         return self.__subjects
 
+    @property
+    def marks(self) -> List[int]:
+        """Subject marks in enrolment order (never forces lazy hydration)."""
+        if self.__raw is not None:
+            return [x["mark"] for x in self.__raw]
+        return [s.mark for s in self.__subjects]
+
     # ---------- derived academic info -------------------------
+    def _key(self) -> tuple:
+        """
+        Validity key for the cached stats / fragment: subject count plus
+        the sum of the subjects' versions.  enrol / remove_subject clear
+        the caches outright; the key also catches direct appends to
+        `subjects` and in-place mark / grade changes.
+        """
+        raw = self.__raw
+        if raw is not None:                         # not hydrated → never edited
+            return (len(raw), 0)
+        subjects = self.__subjects
+        return (len(subjects), sum(s.version for s in subjects))
+
+    def _stats(self) -> Tuple[tuple, float, str]:
+        """(validity key, average, grade) in ONE pass, cached."""
+        stats = self.__stats
+        key = self._key()
+        if stats is None or stats[0] != key:
+            n = key[0]
+            raw = self.__raw
+            if raw is not None:                     # no need to hydrate for marks
+                total = sum(x["mark"] for x in raw)
+            else:
+                total = sum(s.mark for s in self.__subjects)
+            avg = total / n if n else 0.0
+            grade = next((g for cut, g in _GRADE_BANDS if avg >= cut), "Z")
+            stats = self.__stats = (key, avg, grade)
+        return stats
+
     @property
     def average_mark(self) -> float:
-        if not self.__subjects:
-            return 0.0
-        return sum(s.mark for s in self.__subjects) / len(self.__subjects)
+        return self._stats()[1]
 
     @property
     def overall_grade(self) -> str:
-        for cut, g in _GRADE_BANDS:
-            if self.average_mark >= cut:
-                return g
-        return "Z"
+        return self._stats()[2]
 
     # ---------- authentication --------------------------------
     def check_login(self, email: str, pwd: str) -> bool:
@@ -73,23 +121,45 @@ class Student:
     def change_password(self, old: str, new: str) -> bool:
         if self.__password == old and validate_password(new):
             self.__password = new
+            self.__frag = None
             return True
         return False
 
     # ---------- subject enrolment -----------------------------
     def enrol(self):
         """Add a subject (auto-generated) if under the 4-subject limit."""
-        if len(self.__subjects) >= 4:
+        subjects = self.subjects
+        if len(subjects) >= 4:
             return False, "Subject limit (4) reached."
-        sub = Subject.auto_create()
-        self.__subjects.append(sub)
+        sub = Subject.auto_create(s.id for s in subjects)
+        subjects.append(sub)
+        self.__stats = self.__frag = None
         return True, sub
 
     def remove_subject(self, sub_id: str) -> bool:
-        before = len(self.__subjects)
+        before = len(self.subjects)
         self.__subjects = [s for s in self.__subjects if s.id != sub_id]
+        self.__stats = self.__frag = None
         return len(self.__subjects) < before
 
+    # ---------- dirty tracking / fragment cache ---------------
+    @property
+    def dirty(self) -> bool:
+        """True until the current state has been encoded (see `fragment`)."""
+        return self.fragment is None
+
+    @property
+    def fragment(self) -> Optional[bytes]:
+        """Cached encoding of this record, or None if it changed since (see `_key`)."""
+        frag = self.__frag
+        if frag is None or frag[0] != self._key():
+            return None
+        return frag[1]
+
+    def cache_fragment(self, data: bytes) -> None:
+        """Remember `data` as the encoding of the current state."""
+        self.__frag = (self._key(), data)
+
     # ---------- (de)serialise helpers -------------------------
     def to_dict(self) -> dict:
         return {
@@ -97,17 +167,25 @@ class Student:
             "name": self.__name,
             "email": self.__email,
             "password": self.__password,
-            "subjects": [s.to_dict() for s in self.__subjects],
+            "subjects": ([dict(x) for x in self.__raw] if self.__raw is not None
+                         else [s.to_dict() for s in self.__subjects]),
         }
 
     @staticmethod
-    def from_dict(d: dict) -> "Student":
+    def from_dict(d: dict, lazy: bool = False) -> "Student":
         obj = Student.__new__(Student)        # bypass __init__
         obj.__id = d["id"]
+        reserve_student_id(obj.__id)
         obj.__name = d["name"]
         obj.__email = d["email"]
         obj.__password = d["password"]
-        obj.__subjects = [Subject.from_dict(x) for x in d.get("subjects", [])]
+        if lazy:
+            obj.__subjects = None
+            obj.__raw = d.get("subjects", [])
+        else:
+            obj.__subjects = [Subject.from_dict(x) for x in d.get("subjects", [])]
+            obj.__raw = None
+        obj.__stats = obj.__frag = None
         return obj
 
     # ---------- identity / equality ---------------------------
@@ -123,6 +201,6 @@ class Student:
     def __str__(self) -> str:
         return (
             f"{self.__id}  {self.__name:<20}  "
-            f"subjects:{len(self.__subjects)}  "
+            f"subjects:{self._stats()[0][0]}  "
             f"AVG:{self.average_mark:5.2f}  GRADE:{self.overall_grade}"
         )
@@ -6,10 +6,16 @@ Represents a single subject enrolment.
 • Auto-generates a 3-digit ID (001-999).
 • Auto-assigns a random mark (25-100) and calculates grade
   using the UTS band rules defined in the spec.
+• `__slots__` object; the ID is held as a small int and the grade
+  string is interned, so 4 subjects × many students stay compact.
+• Every in-place change of `mark` / `grade` bumps the subject's own
+  `version`; Student compares it to drop its cached stats / fragment.
 """
 
 from __future__ import annotations
+import sys
 import random
+from typing import Iterable
 from utils.utility import generate_subject_id
 
 # ── Grade cut-offs (spec) ───────────────────────────────
@@ -38,22 +44,55 @@ def _grade_from_mark(mark: int) -> str:
 class Subject:
     """Immutable data object for a single subject enrolment."""
 
+    __slots__ = ("_code", "_mark", "_grade", "version")
+
     # ---------- construction -----------------------------------
     def __init__(self, sub_id: str, mark: int, grade: str) -> None:
-        self.id: str = sub_id
-        self.mark: int = mark
-        self.grade: str = grade
+        self.id = sub_id
+        self._mark: int = int(mark)
+        self._grade: str = sys.intern(grade)
+        self.version = 0                # in-place mark / grade changes
+
+    # ---------- mark / grade (writes invalidate Student caches) --
+    @property
+    def mark(self) -> int:
+        return self._mark
+
+    @mark.setter
+    def mark(self, mark: int) -> None:
+        self._mark = int(mark)
+        self.version += 1
+
+    @property
+    def grade(self) -> str:
+        return self._grade
+
+    @grade.setter
+    def grade(self, grade: str) -> None:
+        self._grade = sys.intern(grade)
+        self.version += 1
+
+    # ---------- ID (stored as int, exposed as 3-digit string) ---
+    @property
+    def id(self) -> str:
+        code = self._code
+        return f"{code:03d}" if isinstance(code, int) else code
+
+    @id.setter
+    def id(self, sub_id: str) -> None:
+        # keep non-canonical IDs verbatim so they round-trip unchanged
+        self._code = int(sub_id) if len(sub_id) == 3 and sub_id.isdigit() else sub_id
 
     # ---------- factory helper ---------------------------------
     @classmethod
-    def auto_create(cls) -> "Subject":
+    def auto_create(cls, taken: Iterable[str] = ()) -> "Subject":
         """
         Convenience constructor:
-        • id    : random 3-digit string
+        • id    : random 3-digit string (not in *taken*)
         • mark  : random 25-100
         • grade : derived from mark
         """
-        sub_id = generate_subject_id()
+        sub_id = generate_subject_id(taken)
         mark = random.randint(25, 100)
         return cls(sub_id, mark, _grade_from_mark(mark))
 
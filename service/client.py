@@ -0,0 +1,256 @@
+"""
+service/client.py
+─────────────────
+Thin clients for the student service (service/daemon.py).
+
+• `Connection` – blocking JSON-lines client, safe to share between the
+  Tk thread and a worker thread.
+• `RemoteStudentController` / `RemoteAdminController` / `RemoteStudent`
+  mirror the parts of StudentController / AdminController / Student that
+  cli.py and GUIUniApp use, so the front-ends run unchanged on top.
+• `student_controller()` / `admin_controller()` return the remote
+  flavour once `connect()` has been called (or `UNIAPP_SERVER` is set),
+  the local one otherwise.
+
+Addresses: a Unix socket path, `unix:PATH`, or `HOST:PORT`.
+"""
+
+from __future__ import annotations
+import json
+import os
+import socket
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from models.subject import Subject
+
+_ADDRESS: Optional[str] = os.environ.get("UNIAPP_SERVER") or None
+_CONN: Optional["Connection"] = None
+
+
+class ServiceError(RuntimeError):
+    """The daemon could not be reached or broke the protocol."""
+
+
+class Connection:
+    """One socket to the daemon; requests are strictly request → response."""
+
+    def __init__(self, address: str, timeout: float = 30.0) -> None:
+        self.address = address
+        self._lock = threading.Lock()
+        self._next_id = 0
+        try:
+            if address.startswith("unix:") or ":" not in address:
+                self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._sock.settimeout(timeout)
+                self._sock.connect(address[5:] if address.startswith("unix:") else address)
+            else:
+                host, port = address.rsplit(":", 1)
+                self._sock = socket.create_connection((host, int(port)), timeout)
+        except OSError as exc:
+            raise ServiceError(f"cannot reach student service at {address}: {exc}") from exc
+        self._file = self._sock.makefile("rb")
+
+    def call(self, op: str, **args) -> dict:
+        """Send one operation and return the daemon's result dict."""
+        with self._lock:
+            self._next_id += 1
+            request = {**args, "op": op, "req": self._next_id}
+            try:
+                self._sock.sendall(json.dumps(request).encode() + b"\n")
+                line = self._file.readline()
+            except OSError as exc:
+                raise ServiceError(f"student service connection lost: {exc}") from exc
+            if not line:
+                raise ServiceError("student service closed the connection")
+            response = json.loads(line)
+            if response.get("req") != request["req"]:
+                raise ServiceError("out-of-order response from student service")
+            return response
+
+    def close(self) -> None:
+        self._file.close()
+        self._sock.close()
+
+
+# ── remote models ───────────────────────────────────────────────
+class RemoteStudent:
+    """Student as seen through the service; mutations go to the daemon."""
+
+    def __init__(self, conn: Connection, d: dict) -> None:
+        self._conn = conn
+        self.id: str = d["id"]
+        self.name: str = d["name"]
+        self.email: str = d["email"]
+        self._average: float = d.get("average", 0.0)
+        self._grade: str = d.get("grade", "Z")
+        self._subjects: Optional[List[Subject]] = (
+            [Subject.from_dict(x) for x in d["subjects"]] if "subjects" in d else None)
+
+    @property
+    def subjects(self) -> List[Subject]:
+        if self._subjects is None:                   # listing rows carry no subjects
+            self._reload()
+        return self._subjects or []
+
+    @property
+    def average_mark(self) -> float:
+        return self._average
+
+    @property
+    def overall_grade(self) -> str:
+        return self._grade
+
+    def _refresh(self, d: dict) -> None:
+        self._average, self._grade = d["average"], d["grade"]
+        self._subjects = [Subject.from_dict(x) for x in d["subjects"]]
+
+    def _reload(self) -> None:
+        res = self._conn.call("student", email=self.email)
+        if res["ok"]:
+            self._refresh(res["student"])
+
+    def enrol(self):
+        res = self._conn.call("enrol", email=self.email)
+        if not res["ok"]:
+            return False, res["error"]
+        self._reload()
+        return True, Subject.from_dict(res["subject"])
+
+    def remove_subject(self, sub_id: str) -> bool:
+        ok = self._conn.call("remove_subject", email=self.email, subject=sub_id)["ok"]
+        if ok:
+            self._reload()
+        return ok
+
+    def change_password(self, old: str, new: str) -> bool:
+        return self._conn.call("change_password", email=self.email, old=old, new=new)["ok"]
+
+    def __eq__(self, other: object) -> bool:
+        return getattr(other, "id", None) == self.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+
+class RemoteStudentController:
+    """StudentController API over the service."""
+
+    def __init__(self, conn: Connection) -> None:
+        self._conn = conn
+
+    def register(self, name: str, email: str, password: str):
+        res = self._conn.call("register", name=name, email=email, password=password)
+        if not res["ok"]:
+            return False, res["error"]
+        return True, RemoteStudent(self._conn, res["student"])
+
+    def login(self, email: str, password: str):
+        res = self._conn.call("login", email=email, password=password)
+        if not res["ok"]:
+            return False, None
+        return True, RemoteStudent(self._conn, res["student"])
+
+    def persist(self, student) -> None:
+        """No-op: the daemon already holds the change and persists it in batches."""
+
+    def persist_many(self, students) -> None:
+        """No-op, as `persist`."""
+
+    def flush(self) -> int:
+        return self._conn.call("checkpoint")["written"]
+
+
+class RemoteAdminController:
+    """AdminController API over the service."""
+
+    def __init__(self, conn: Connection) -> None:
+        self._conn = conn
+
+    def _students(self, rows: List[dict]) -> List[RemoteStudent]:
+        return [RemoteStudent(self._conn, d) for d in rows]
+
+    def refresh(self) -> None:
+        """No-op: every call already sees the daemon's live state."""
+
+    def show_students(self) -> List[RemoteStudent]:
+        return self._students(self._conn.call("show")["students"])
+
+    def page(self, after: Optional[str] = None, size: int = 20,
+             grade: Optional[str] = None) -> Tuple[List[RemoteStudent], Optional[str]]:
+        res = self._conn.call("page", after=after, size=size, grade=grade)
+        return self._students(res["students"]), res["cursor"]
+
+    def window(self, offset: int, size: int, grade: Optional[str] = None,
+               check: bool = True) -> List[RemoteStudent]:
+        res = self._conn.call("window", offset=offset, size=size, grade=grade)
+        return self._students(res["students"])
+
+    def count(self, grade: Optional[str] = None, check: bool = True) -> int:
+        return self._conn.call("count", grade=grade)["count"]
+
+    def is_empty(self) -> bool:
+        return self.count() == 0
+
+    def counts(self) -> dict:
+        return self._conn.call("counts")["counts"]
+
+    def group_by_grade(self) -> Dict[str, List[RemoteStudent]]:
+        groups = self._conn.call("group")["groups"]
+        return {g: self._students(rows) for g, rows in groups.items()}
+
+    def partition_pass_fail(self) -> Dict[str, List[RemoteStudent]]:
+        # PASS ⇔ average ≥ 50 ⇔ overall grade above Z, so one "group" call suffices
+        out: Dict[str, List[RemoteStudent]] = {"PASS": [], "FAIL": []}
+        for grade, members in self.group_by_grade().items():
+            out["FAIL" if grade == "Z" else "PASS"].extend(members)
+        return out
+
+    def distribution(self) -> dict:
+        res = self._conn.call("distribution")
+        return {"bins": res["bins"], "histogram": res["histogram"],
+                "percentiles": {int(q): v for q, v in res["percentiles"].items()}}
+
+    def remove_student(self, student_id: str) -> bool:
+        return self._conn.call("remove", id=student_id)["ok"]
+
+    def remove_students(self, student_ids) -> List[str]:
+        """One request per ID (the daemon serialises them; not all-or-nothing)."""
+        return [sid for sid in student_ids if self.remove_student(sid)]
+
+    def clear_database(self) -> None:
+        self._conn.call("clear")
+
+
+# ── factories used by the front-ends ────────────────────────────
+def connect(address: str) -> None:
+    """Route `student_controller()` / `admin_controller()` to the daemon at *address*."""
+    global _ADDRESS, _CONN
+    _ADDRESS, _CONN = address, None
+
+
+def connected() -> bool:
+    return _ADDRESS is not None
+
+
+def _connection() -> Connection:
+    global _CONN
+    if _CONN is None:
+        _CONN = Connection(_ADDRESS)
+    return _CONN
+
+
+def student_controller():
+    """StudentController – remote when connected to the service."""
+    if _ADDRESS is None:
+        from controllers.student_controller import StudentController
+        return StudentController()
+    return RemoteStudentController(_connection())
+
+
+def admin_controller():
+    """AdminController – remote when connected to the service."""
+    if _ADDRESS is None:
+        from controllers.admin_controller import AdminController
+        return AdminController()
+    return RemoteAdminController(_connection())
@@ -0,0 +1,165 @@
+"""
+service/daemon.py
+─────────────────
+Local student service: ONE process owns the data, clients talk to it.
+
+• Listens on a Unix socket (default `data/uniapp.sock`, mode 0600) or on
+  a localhost TCP port, speaking JSON lines: one request object per
+  line in (`{"op": "enrol", "email": ...}` plus an optional envelope
+  key "req" that is echoed back), one result object per line out.
+• A request that makes a handler raise gets an `ok: false` reply; the
+  connection stays open.
+• Requests are executed one at a time on the event loop against a
+  single in-memory BatchController, so mutations from concurrent
+  clients are serialised and never overwrite each other.
+• Mutations are staged and persisted in batches: every
+  `flush_interval` seconds, after `flush_every` staged changes, on an
+  explicit `checkpoint`, and on shutdown.
+
+Run:  python -m service.daemon [--socket PATH | --port N]
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+import pathlib
+import signal
+import threading
+from typing import Optional
+
+from controllers.batch_controller import BatchController, MUTATING
+from utils import metrics
+
+DEFAULT_SOCKET = pathlib.Path(__file__).resolve().parents[1] / "data" / "uniapp.sock"
+
+
+class Daemon:
+    """Owns the in-memory state and the batching persister."""
+
+    def __init__(self, flush_interval: float = 1.0, flush_every: int = 500) -> None:
+        self.batch = BatchController()        # loads the database once
+        self.flush_interval = flush_interval
+        self.flush_every = flush_every
+        self._dirty = 0
+
+    # ── request handling -----------------------------------------
+    def execute(self, request: dict) -> dict:
+        """Run ONE request; staged mutations are flushed in batches."""
+        request = dict(request)
+        req = request.pop("req", None)        # envelope, not an operation argument
+        try:
+            result = self._run(request)
+        except Exception as exc:              # never let one request drop the client
+            metrics.incr("daemon.errors")
+            result = {"op": request.get("op"), "ok": False,
+                      "error": f"internal error: {exc!r}"}
+        if req is not None:
+            result["req"] = req
+        return result
+
+    def _run(self, request: dict) -> dict:
+        result = self.batch.execute(request)
+        op = request.get("op")
+        if not isinstance(op, str):
+            return result
+        if op in MUTATING and result.get("ok"):
+            self._dirty += 1
+            metrics.incr("daemon.mutations")
+            if self._dirty >= self.flush_every:
+                self.flush()
+        elif op == "checkpoint":
+            self._dirty = 0
+        return result
+
+    def flush(self) -> int:
+        """Persist everything staged since the last flush; returns #records."""
+        self._dirty = 0
+        written = self.batch.ctrl.flush()
+        if written:
+            metrics.incr("daemon.flushes")
+        return written
+
+    async def _client(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be a JSON object")
+                except ValueError as exc:
+                    request = {"op": None, "error": f"unparseable request: {exc}"}
+                response = self.execute(request)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+        finally:
+            writer.close()
+
+    async def _flusher(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if self._dirty:
+                self.flush()
+
+    # ── lifecycle ------------------------------------------------
+    async def serve(self, socket_path: Optional[pathlib.Path] = None,
+                    port: Optional[int] = None,
+                    ready: Optional[threading.Event] = None,
+                    stop: Optional[asyncio.Event] = None) -> None:
+        """Serve until `stop` is set (or SIGINT / SIGTERM), then flush."""
+        path = None if port is not None else pathlib.Path(socket_path or DEFAULT_SOCKET)
+        if path is None:
+            server = await asyncio.start_server(self._client, "127.0.0.1", port)
+        else:
+            path.unlink(missing_ok=True)             # stale socket from a crash
+            server = await asyncio.start_unix_server(self._client, str(path))
+            os.chmod(path, 0o600)                    # local user only
+
+        stop = stop or asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except (NotImplementedError, RuntimeError):   # not main thread / Windows
+                pass
+
+        flusher = asyncio.create_task(self._flusher())
+        try:
+            async with server:
+                if ready is not None:
+                    ready.set()
+                await stop.wait()
+        finally:
+            flusher.cancel()
+            self.flush()
+            if path is not None:
+                path.unlink(missing_ok=True)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="CLIUniApp local student service")
+    where = parser.add_mutually_exclusive_group()
+    where.add_argument("--socket", metavar="PATH",
+                       help=f"Unix socket to listen on (default {DEFAULT_SOCKET})")
+    where.add_argument("--port", type=int, metavar="N",
+                       help="listen on 127.0.0.1:N instead of a Unix socket")
+    parser.add_argument("--flush-interval", type=float, default=1.0, metavar="SECONDS",
+                        help="persist staged changes at most this often (default 1.0)")
+    parser.add_argument("--flush-every", type=int, default=500, metavar="N",
+                        help="persist once this many changes are staged (default 500)")
+    args = parser.parse_args(argv)
+
+    daemon = Daemon(args.flush_interval, args.flush_every)
+    where = f"127.0.0.1:{args.port}" if args.port else (args.socket or DEFAULT_SOCKET)
+    print(f"Serving {len(daemon.batch.ctrl.students)} students on {where}")
+    asyncio.run(daemon.serve(args.socket, args.port))
+
+
+if __name__ == "__main__":
+    main()
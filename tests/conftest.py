@@ -11,7 +11,7 @@ import sys, pathlib
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 import pytest
 from pathlib import Path
-from data import database
+from data import database, snapshot_cache
 from models.student import Student
 
 
@@ -27,6 +27,7 @@ def patch_data_file(tmp_path, monkeypatch):
     """Redirect the global _DB_FILE to a temp file for the whole test run."""
     fake = _fake_file(tmp_path)
     monkeypatch.setattr(database, "_DB_FILE", fake)
+    snapshot_cache.invalidate()    # never serve another test's snapshot
     yield    # run tests
     # nothing to clean up – tmp_path is auto-deleted
 
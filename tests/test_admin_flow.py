@@ -41,3 +41,88 @@ def test_group_and_partition():
     # clear DB
     admin.clear_database()
     assert not admin.show_students()
+
+
+def test_snapshot_cache_hits_until_file_changes():
+    from data import snapshot_cache
+
+    save([_make_student("Dan", 80)])
+    admin = AdminController()                 # miss: first parse
+    before = snapshot_cache.stats()
+
+    admin.refresh()
+    admin.show_students()
+    admin.group_by_grade()
+    after = snapshot_cache.stats()
+    assert after["misses"] == before["misses"]
+    assert after["hits"] == before["hits"] + 3
+
+    save([])                                  # file changed → re-parse
+    assert admin.show_students() == []
+    assert snapshot_cache.stats()["misses"] == before["misses"] + 1
+
+
+def test_summary_single_pass_and_grade_cache():
+    s1 = _make_student("Eve", 90)
+    s2 = _make_student("Fay", 30)
+    save([s1, s2])
+
+    admin = AdminController()
+    summary = admin.summary()
+    assert summary["counts"] == {"total": 2, "PASS": 1, "FAIL": 1, "HD": 1, "Z": 1}
+    assert admin.group_by_grade() is summary["groups"]      # no second scan
+    assert admin.partition_pass_fail() is summary["pass_fail"]
+
+    # cached grade is invalidated by enrol / remove_subject
+    stu = Student("Gus", "gus@university.com", "Abcde123")
+    assert stu.overall_grade == "Z"
+    ok, sub = stu.enrol()
+    assert stu.average_mark == sub.mark
+    stu.remove_subject(sub.id)
+    assert stu.average_mark == 0.0
+
+
+def test_paging_count_and_maintained_order(monkeypatch):
+    students = [_make_student(f"P{i}", 40 + i) for i in range(7)]
+    save(students)
+    admin = AdminController()
+    ids = sorted(s.id for s in students)
+    assert admin.count() == 7 and not admin.is_empty()
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = admin.page(cursor, size=3)
+        seen += [s.id for s in page]
+        if cursor is None:
+            break
+    assert seen == ids
+
+    # own delete keeps the sorted order without re-reading the snapshot
+    from data import snapshot_cache
+    misses = snapshot_cache.stats()["misses"]
+    assert admin.remove_student(ids[1])
+    assert admin.count() == 6
+    assert admin.page(ids[0], size=2)[0][0].id == ids[2]
+    assert snapshot_cache.stats()["misses"] == misses
+
+    # a write from elsewhere is picked up
+    save(students[:2])
+    assert admin.count() == 2
+    admin.clear_database()
+    assert admin.is_empty() and admin.page() == ([], None)
+
+
+def test_grade_filtered_window_and_count():
+    marks = [92, 30, 88, 55, 95, 20]
+    students = [_make_student(f"W{i}", m) for i, m in enumerate(marks)]
+    save(students)
+    admin = AdminController()
+    hd = sorted(s.id for s, m in zip(students, marks) if m >= 85)
+
+    assert admin.count("HD") == 3 and admin.count("Z") == 2
+    assert [s.id for s in admin.window(1, 5, "HD")] == hd[1:]
+    assert [s.id for s in admin.page(hd[0], 1, grade="HD")[0]] == [hd[1]]
+
+    assert admin.remove_student(hd[0])
+    assert admin.count("HD", check=False) == 2
+    assert [s.id for s in admin.window(0, 10, "HD")] == hd[1:]
@@ -0,0 +1,51 @@
+# tests/test_analytics.py
+import random
+
+import pytest
+
+from controllers import analytics
+from controllers.admin_controller import AdminController
+from models.student import Student
+
+
+def _population(n, seed=7):
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        d = {"id": f"{i:06d}", "name": f"S{i}", "email": f"s{i}@university.com",
+             "password": "Abcde123",
+             "subjects": [{"id": f"{j:03d}", "mark": rng.randint(25, 100), "grade": "P"}
+                          for j in range(rng.randint(0, 4))]}
+        out.append(Student.from_dict(d, lazy=i % 2 == 0))
+    return out
+
+
+def test_columns_match_pure_python_summary(monkeypatch):
+    np = pytest.importorskip("numpy")
+    students = _population(3000)
+    vector = AdminController.summarise(students)
+
+    monkeypatch.setattr(analytics, "np", None)
+    pure = AdminController.summarise(students)
+
+    assert list(vector["groups"]) == list(pure["groups"])     # same group order
+    assert vector == pure
+    monkeypatch.setattr(analytics, "np", np)
+
+
+def test_histogram_and_percentiles_agree_without_numpy(monkeypatch):
+    pytest.importorskip("numpy")
+    students = _population(500)
+    bins = list(range(0, 101, 10))
+    hist, pct = analytics.histogram(students, bins), analytics.percentiles(students, (10, 50, 90))
+
+    monkeypatch.setattr(analytics, "np", None)
+    assert analytics.histogram(students, bins) == hist
+    assert analytics.percentiles(students, (10, 50, 90)) == pytest.approx(pct)
+    assert sum(hist) == sum(1 for s in students if s.marks)
+
+
+def test_distribution_on_empty_database():
+    dist = AdminController().distribution()
+    assert sum(dist["histogram"]) == 0
+    assert set(dist["percentiles"].values()) == {0.0}
@@ -0,0 +1,52 @@
+from controllers import student_controller
+from controllers.batch_controller import BatchController, parse_ops
+from data.database import load
+
+_SCRIPT = """
+# comment lines and blanks are skipped
+register "Ann Lee" ann@university.com Abcde123
+{"op": "register", "name": "Ben", "email": "ben@university.com", "password": "Abcde123"}
+enrol ann@university.com
+enrol nobody@university.com
+checkpoint
+remove_subject ann@university.com 999
+partition
+frobnicate
+"""
+
+
+def test_batch_runs_in_memory_and_persists_at_checkpoints(monkeypatch):
+    writes = []
+    real = student_controller.apply_changes
+    monkeypatch.setattr(student_controller, "apply_changes",
+                        lambda ups, dels: writes.append(len(ups)) or real(ups, dels))
+
+    results = list(BatchController().run(parse_ops(_SCRIPT.splitlines())))
+
+    assert [r["ok"] for r in results] == [True, True, True, False, True, False, True, False]
+    assert results[0]["line"] == 3
+    assert results[4]["written"] == 2           # ann + ben, staged until checkpoint
+    assert results[6]["counts"]["total"] == 2
+    assert "unknown op" in results[7]["error"]
+    assert writes == [2]                         # nothing dirty after checkpoint
+
+    ann = next(s for s in load() if s.email == "ann@university.com")
+    assert len(ann.subjects) == 1
+
+
+def test_malformed_ops_are_reported_and_staged_work_still_lands():
+    lines = ['register Cat cat@university.com Abcde123',
+             '{"op": ["x"]}',
+             '{"op": 7}']
+    results = list(BatchController().run(parse_ops(lines)))
+    assert [r["ok"] for r in results] == [True, False, False]
+    assert all("must be a string" in r["error"] for r in results[1:])
+    assert [s.email for s in load()] == ["cat@university.com"]
+
+
+def test_aborted_run_still_flushes_staged_ops():
+    batch = BatchController()
+    run = batch.run(parse_ops(["register Dee dee@university.com Abcde123"] * 2))
+    assert next(run)["ok"]
+    run.close()                                  # consumer stopped early
+    assert [s.email for s in load()] == ["dee@university.com"]
@@ -0,0 +1,296 @@
+import pytest
+from data import database
+from data.database import load, save, get, upsert, delete, compact
+from models.student import Student
+
+
+def test_upsert_appends_to_journal_not_snapshot(fresh_student):
+    save([])
+    snapshot_before = database._DB_FILE.read_text()
+
+    fresh_student.enrol()
+    upsert(fresh_student)
+
+    # snapshot untouched – the change lives in the journal only
+    assert database._DB_FILE.read_text() == snapshot_before
+    assert database._journal_path().read_text().count("\n") == 1
+
+    [reloaded] = load()
+    assert reloaded == fresh_student
+    assert len(reloaded.subjects) == 1
+
+
+def test_delete_and_replay_order():
+    a = Student("Ann", "ann@university.com", "Abcde123")
+    b = Student("Ben", "ben@university.com", "Abcde123")
+    save([a, b])
+
+    a.enrol()
+    upsert(a)                  # update in place – keeps snapshot order
+    delete(b.id)
+    c = Student("Cat", "cat@university.com", "Abcde123")
+    upsert(c)                  # new record goes to the end
+
+    assert [s.id for s in load()] == [a.id, c.id]
+
+
+def test_compaction_folds_journal(monkeypatch, fresh_student):
+    save([])
+    monkeypatch.setattr(database, "_JOURNAL_LIMIT", 1)   # compact on every append
+
+    upsert(fresh_student)
+
+    assert not database._journal_path().exists()
+    [reloaded] = load()
+    assert reloaded == fresh_student
+
+
+def test_torn_journal_tail_is_ignored(fresh_student):
+    save([])
+    upsert(fresh_student)
+    with open(database._journal_path(), "a") as f:
+        f.write('{"op":"put","stud')          # interrupted write
+
+    assert load() == [fresh_student]
+    compact()
+    assert load() == [fresh_student]
+
+
+def test_append_after_torn_tail_keeps_later_entries(fresh_student):
+    save([])
+    upsert(fresh_student)
+    with open(database._journal_path(), "a") as f:
+        f.write('{"op":"put","stud')          # interrupted write
+    b = Student("Bea", "bea@university.com", "Abcde123")
+    c = Student("Cal", "cal@university.com", "Abcde123")
+    upsert(b)
+    upsert(c)
+    assert load() == [fresh_student, b, c]
+    compact()
+    assert load() == [fresh_student, b, c]
+
+
+def test_bad_journal_line_is_skipped_not_fatal(fresh_student):
+    save([])
+    other = Student("Bea", "bea@university.com", "Abcde123")
+    with open(database._journal_path(), "a") as f:
+        f.write('garbage\n')
+    upsert(fresh_student)
+    with open(database._journal_path(), "a") as f:
+        f.write('{"op":"put"\n')
+    upsert(other)
+    assert load() == [fresh_student, other]
+
+
+def test_offset_index_lookups_read_one_record(monkeypatch):
+    from data import offset_index
+    students = [Student(f"S{i}", f"s{i}@university.com", "Abcde123") for i in range(5)]
+    for s in students:
+        s.enrol()
+    save(students)
+    assert offset_index.index_path(database._DB_FILE).exists()
+
+    # a lookup must not parse the whole snapshot
+    monkeypatch.setattr(database, "_read_snapshot", lambda: 1 / 0)
+    got = database.get(students[3].id)
+    assert got == students[3] and len(got.subjects) == 1
+    assert database.get_by_email("s1@university.com") == students[1]
+    assert database.get("999999") is None
+
+    # journal entries win over the indexed snapshot
+    delete(students[1].id)
+    students[2].enrol()
+    upsert(students[2])
+    assert database.get_by_email("s1@university.com") is None
+    assert len(database.get(students[2].id).subjects) == 2
+
+
+def test_stale_offset_index_is_rebuilt(fresh_student):
+    import json
+    save([])
+    # someone else rewrites the snapshot without updating the sidecar
+    database._DB_FILE.write_text(json.dumps([fresh_student.to_dict()]))
+    assert database.get_by_email(fresh_student.email) == fresh_student
+
+
+def test_lazy_load_hydrates_subjects_on_first_access(fresh_student):
+    fresh_student.enrol()
+    fresh_student.enrol()
+    save([fresh_student])
+
+    [lazy] = load(lazy=True)
+    assert lazy.average_mark == fresh_student.average_mark    # from raw marks
+    assert lazy.to_dict() == fresh_student.to_dict()
+    assert [s.id for s in lazy.subjects] == [s.id for s in fresh_student.subjects]
+    ok, _ = lazy.enrol()
+    assert ok and len(lazy.subjects) == 3
+
+
+def test_transaction_commits_once_and_rolls_back(monkeypatch, fresh_student):
+    from controllers.admin_controller import AdminController
+    from controllers.student_controller import StudentController
+
+    students = [Student(f"T{i}", f"t{i}@university.com", "Abcde123") for i in range(5)]
+    save(students)
+    writes = []
+    real = database._append
+    monkeypatch.setattr(database, "_append", lambda e: writes.append(len(e)) or real(e))
+
+    admin = AdminController()
+    removed = admin.remove_students([students[0].id, "nope", students[1].id])
+    assert removed == [students[0].id, students[1].id]
+    assert writes == [2]                                     # ONE journal write
+    assert admin.count() == 3 and len(load()) == 3
+
+    ctrl = StudentController()
+    with pytest.raises(RuntimeError):
+        with database.transaction():
+            ok, stu = ctrl.register("Rolled", "rolled@university.com", "Abcde123")
+            ctrl.persist(stu)
+            assert database.get(stu.id) is not None          # read-your-writes
+            admin.remove_student(students[2].id)
+            raise RuntimeError("boom")
+    assert writes == [2]                                     # nothing written
+    assert {s.id for s in load()} == {s.id for s in students[2:]}
+    assert ctrl.find("rolled@university.com") is None        # memory reloaded
+    assert admin.count() == 3
+
+    with database.transaction():
+        ok, stu = ctrl.register("Kept", "kept@university.com", "Abcde123")
+        stu.enrol()
+        ctrl.persist(stu)
+    assert writes == [2, 1]
+    assert len(database.get(stu.id).subjects) == 1
+
+
+def test_transaction_shared_by_two_controllers_updates_both():
+    from controllers.admin_controller import AdminController
+    from controllers.student_controller import StudentController
+
+    a = Student("Ann", "ann@university.com", "Abcde123")
+    save([a])
+    admin, ctrl = AdminController(), StudentController()
+    assert admin.count() == 1 and ctrl.login("ann@university.com", "Abcde123")[0]
+
+    with database.transaction():
+        assert admin.remove_student(a.id)
+        ok, y = ctrl.register("Yan", "yan@university.com", "Abcde123")
+    assert [s.id for s in load()] == [y.id]
+    assert ctrl.login("ann@university.com", "Abcde123") == (False, None)
+    assert ctrl.login("yan@university.com", "Abcde123") == (True, y)
+    assert admin.count() == 1
+    assert [s.id for s in admin.show_students()] == [y.id]
+
+
+def test_save_reencodes_only_dirty_students(monkeypatch):
+    from utils import metrics
+    students = [Student(f"F{i}", f"f{i}@university.com", "Abcde123") for i in range(6)]
+    save(students)
+    assert not any(s.dirty for s in students)
+    first = database._DB_FILE.read_bytes()
+
+    encoded = []
+    real = database.offset_index.fragment
+    monkeypatch.setattr(database.offset_index, "fragment",
+                        lambda d: encoded.append(d["id"]) or real(d))
+    save(students)
+    assert encoded == [] and database._DB_FILE.read_bytes() == first
+
+    students[1].enrol()
+    students[4].change_password("Abcde123", "Xyzab999")
+    students[2].subjects.append(students[1].subjects[0])      # direct append
+    assert students[1].dirty and students[2].dirty
+    save(students)
+    assert sorted(encoded) == sorted(s.id for s in (students[1], students[2], students[4]))
+
+    # byte-identical to a from-scratch encode, index still correct
+    assert database._DB_FILE.read_bytes() == database.offset_index.encode(
+        [s.to_dict() for s in students])[0]
+    got = database.get(students[4].id)
+    assert got.check_login(students[4].email, "Xyzab999")
+    assert len(database.get(students[2].id).subjects) == 1
+    assert metrics.snapshot()["counters"]["database.fragments_reused"] >= 9
+
+
+def test_in_place_subject_edit_is_saved(fresh_student):
+    from utils import metrics
+    others = [Student(f"E{i}", f"e{i}@university.com", "Abcde123") for i in range(5)]
+    fresh_student.enrol()
+    for s in others:
+        s.enrol()
+    save([fresh_student, *others])
+    sub = fresh_student.subjects[0]
+    sub.mark = 99
+    sub.recalculate_grade()
+    assert fresh_student.dirty and not any(s.dirty for s in others)
+    before = metrics.snapshot()["counters"]["database.records_encoded"]
+    save([fresh_student, *others])
+    assert metrics.snapshot()["counters"]["database.records_encoded"] - before == 1
+    got = database.get(fresh_student.id)
+    assert (got.subjects[0].mark, got.subjects[0].grade) == (99, "HD")
+
+
+@pytest.mark.parametrize("codec", ["gzip", "zlib", "lzma"])
+def test_compressed_snapshot_roundtrip(monkeypatch, codec):
+    from data import snapshot_codec
+    students = [Student(f"Z{i}", f"z{i}@university.com", "Abcde123") for i in range(40)]
+    for s in students[::3]:
+        s.enrol()
+    save(students)
+    plain = database._DB_FILE.read_bytes()
+
+    monkeypatch.setattr(database, "_CODEC", codec)
+    save(students)
+    packed = database._DB_FILE.read_bytes()
+    assert snapshot_codec.detect(packed[:6]) == codec
+    assert len(packed) < len(plain) / 3
+    assert not database.offset_index.index_path(database._DB_FILE).exists()
+
+    assert [s.to_dict() for s in load()] == [s.to_dict() for s in students]
+    assert get(students[9].id).to_dict() == students[9].to_dict()
+    assert database.get_by_email("z5@university.com") == students[5]
+    assert get("nope") is None
+
+    database.upsert(Student("New", "new@university.com", "Abcde123"))
+    database.delete(students[0].id)
+    assert [s.email for s in database.iter_students()][-1] == "new@university.com"
+    database.compact()
+    assert snapshot_codec.codec_of(database._DB_FILE) == codec
+    assert len(load()) == 40 and get(students[0].id) is None
+
+    # back to plain JSON: auto-detected on read, index rebuilt on write
+    monkeypatch.setattr(database, "_CODEC", None)
+    database.compact()
+    assert database._DB_FILE.read_bytes().startswith(b"[")
+    assert database.get_by_email("new@university.com").name == "New"
+
+
+def test_compressed_save_streams_one_student_at_a_time(monkeypatch):
+    from data import snapshot_codec
+    students = [Student(f"W{i}", f"w{i}@university.com", "Abcde123") for i in range(4)]
+    events = []
+    real_fragment, real_writer = database.offset_index.fragment, snapshot_codec.open_writer
+
+    class Recorder:
+        def __init__(self, inner):
+            self.inner = inner
+
+        def write(self, data):
+            events.append("write")
+            return self.inner.write(data)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self.inner.close()
+
+    monkeypatch.setattr(database.offset_index, "fragment",
+                        lambda d: events.append("encode") or real_fragment(d))
+    monkeypatch.setattr(snapshot_codec, "open_writer",
+                        lambda path, codec: Recorder(real_writer(path, codec)))
+    monkeypatch.setattr(database, "_CODEC", "gzip")
+    save(students)
+    # each record is written before the next one is encoded
+    assert events[:4] == ["encode", "write", "write", "encode"]
+    assert [s.to_dict() for s in load()] == [s.to_dict() for s in students]
@@ -0,0 +1,94 @@
+# tests/test_gui_background.py
+import threading
+
+import pytest
+
+pytest.importorskip("tkinter")
+from GUIUniApp.background import TaskRunner
+
+
+class FakeRoot:
+    """Stands in for Tk: `after` callbacks are run by `pump()`."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, fn):
+        self.scheduled.append(fn)
+
+    def pump(self, limit=10_000):
+        while self.scheduled and limit:
+            self.scheduled.pop(0)()
+            limit -= 1
+
+
+def test_runner_delivers_results_on_polling_thread_and_blocks_double_submit():
+    root, release = FakeRoot(), threading.Event()
+    runner = TaskRunner(root, poll_ms=0)
+    states, results = [], []
+    runner.on_busy(states.append)
+
+    main = threading.get_ident()
+    assert runner.submit(lambda: (release.wait(5), threading.get_ident())[1],
+                         on_done=results.append)
+    assert runner.busy
+    assert not runner.submit(lambda: None)          # second click ignored
+
+    release.set()
+    root.pump()
+    assert results and results[0] != main           # ran on the worker…
+    assert states == [False, True, False]           # …and busy was cleared
+    runner.close()
+
+
+def test_runner_routes_exceptions_to_on_error():
+    root = FakeRoot()
+    runner = TaskRunner(root, poll_ms=0)
+    errors = []
+    runner.submit(lambda: 1 / 0, on_error=errors.append)
+    root.pump()
+    assert isinstance(errors[0], ZeroDivisionError) and not runner.busy
+    runner.close()
+
+
+def test_admin_window_scrolls_remote_rows_on_the_worker():
+    from GUIUniApp.admin_win import AdminWindow, ROWS
+    from service.client import RemoteAdminController
+
+    main = threading.get_ident()
+    calls = []
+
+    class SlowRemote(RemoteAdminController):
+        def __init__(self):
+            pass
+
+        def count(self, grade=None, check=True):
+            calls.append(threading.get_ident())
+            return 1000
+
+        def window(self, offset, size, grade=None, check=True):
+            calls.append(threading.get_ident())
+            return [offset]
+
+    root = FakeRoot()
+    win = AdminWindow.__new__(AdminWindow)          # no display needed
+    win.admin, win.tasks = SlowRemote(), TaskRunner(root, poll_ms=0)
+    win.offset = win.total = win.target = 0
+    win._pending = None
+    win._selected_grade = lambda: None
+    rendered = []
+    win._render = rendered.append
+
+    win._jump(0)
+    assert win.tasks.busy                           # fetch handed to the worker
+    root.pump()
+    for _ in range(5):                              # wheel while a fetch is in flight
+        win._on_wheel(type("E", (), {"num": 5, "delta": -1})())
+    root.pump()
+    assert main not in calls
+    assert rendered == [[0], [3], [15]]             # intermediate requests coalesced
+    assert (win.offset, win.target) == (15, 15)
+    win._jump(10_000)
+    root.pump()
+    assert win.offset == 1000 - ROWS
+    win.tasks.close()
@@ -0,0 +1,34 @@
+import pytest
+from models.student import Student
+from utils.id_allocator import IdAllocator, IdSpaceExhausted
+
+
+def test_allocator_is_unique_until_exhausted():
+    ids = IdAllocator(50, 2)
+    ids.reserve("07")
+    issued = {ids.allocate() for _ in range(49)}
+
+    assert len(issued) == 49 and "07" not in issued
+    assert ids.fill_ratio == 1.0
+    with pytest.raises(IdSpaceExhausted):
+        ids.allocate()
+
+    ids.release("13")
+    assert ids.allocate() == "13"
+
+
+def test_loaded_student_ids_are_never_reissued(monkeypatch):
+    from utils import utility
+    monkeypatch.setattr(utility, "_STUDENT_IDS", IdAllocator(999_999, 6))
+
+    existing = Student.from_dict({"id": "000042", "name": "A",
+                                  "email": "a@university.com",
+                                  "password": "Abcde123"})
+    assert "000042" in utility._STUDENT_IDS
+    assert Student("B", "b@university.com", "Abcde123").id != existing.id
+
+
+def test_subject_ids_unique_within_student(fresh_student):
+    for _ in range(4):
+        fresh_student.enrol()
+    assert len({s.id for s in fresh_student.subjects}) == 4
@@ -0,0 +1,31 @@
+import json
+from utils import metrics
+from controllers.admin_controller import AdminController
+from data.database import save, load
+
+
+def test_database_and_controller_metrics(tmp_path, fresh_student):
+    metrics.reset()
+    save([fresh_student])
+    load()
+    admin = AdminController()
+    admin.refresh()
+
+    snap = metrics.snapshot()
+    c = snap["counters"]
+    assert c["database.saves"] == 1 and c["database.loads"] == 2
+    assert c["database.bytes_written"] > 0 and c["database.bytes_read"] > 0
+    assert c["database.entries_parsed"] == 2
+    assert c["snapshot_cache.hits"] == 1
+    assert snap["latency"]["AdminController.refresh"]["count"] == 2
+    assert "database.load" in metrics.report()
+
+    # dump merges into the file and resets the in-process numbers
+    out = tmp_path / "metrics.json"
+    metrics.dump(out)
+    load()
+    metrics.dump(out)
+    data = json.loads(out.read_text())
+    assert data["counters"]["database.loads"] == 3
+    assert data["latency"]["database.load"]["count"] == 3
+    assert metrics.snapshot()["counters"] == {}
@@ -0,0 +1,50 @@
+from utils import profiling
+
+
+def test_profiling_off_is_a_no_op():
+    def action():
+        return 42
+    assert profiling.profiled("x")(action) is action
+    assert profiling.capture("x") is profiling.capture("y")     # shared null context
+
+
+def test_capture_writes_one_profile_per_action(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, "_profile_dir", None)
+    profiling.enable(tmp_path / "prof")
+
+    with profiling.capture("admin-g"):
+        with profiling.capture("nested"):                        # no nesting error
+            sorted(range(1000), reverse=True)
+
+    files = sorted(p.name for p in (tmp_path / "prof").iterdir())
+    assert len(files) == 2
+    assert files[0].startswith("admin-g-") and files[0].endswith(".prof")
+    assert "peak:" in (tmp_path / "prof" / files[1]).read_text()
+
+
+def test_cli_profiles_exclude_prompts(tmp_path, monkeypatch, fresh_student):
+    import builtins
+    import pstats
+    import cli
+    from data.database import save
+    from controllers.write_behind import WriteBehind
+
+    save([fresh_student])
+    monkeypatch.setattr(profiling, "_profile_dir", None)
+    out = profiling.enable(tmp_path / "prof")
+    answers = iter(["c", "Abcde123", "Xyzab999", "x",                  # subject menu
+                    "s", "r", fresh_student.id, "x"])                # admin menu
+
+    def typed_by_user(prompt=""):
+        return next(answers)
+
+    monkeypatch.setattr(builtins, "input", typed_by_user)
+    cli._subject_loop(fresh_student, WriteBehind(lambda students: None, delay=60))
+    cli.admin_menu()
+
+    profiles = list(out.glob("*.prof"))
+    assert {p.name.rsplit("-", 3)[0] for p in profiles} >= \
+           {"subject-c", "admin-s", "admin-r", "admin-r-remove"}
+    for p in profiles:
+        funcs = {name for _, _, name in pstats.Stats(str(p)).stats}
+        assert "typed_by_user" not in funcs, p.name
@@ -0,0 +1,93 @@
+import pytest
+from data import database
+from data.database import load, save, get, get_by_email, upsert, delete
+from data.record_store import RecordStore, _HEADER, _SLOT
+from models.student import Student
+
+
+@pytest.fixture
+def record_backend(monkeypatch):
+    monkeypatch.setattr(database, "_BACKEND", "records")
+    yield
+    for store in database._stores.values():
+        store.close()
+    database._stores.clear()
+
+
+def test_record_roundtrip_and_record_api(record_backend, fresh_student):
+    other = Student("Ben", "ben@university.com", "Abcde123")
+    for _ in range(3):
+        fresh_student.enrol()
+    save([fresh_student, other])
+
+    assert [s.to_dict() for s in load()] == [fresh_student.to_dict(), other.to_dict()]
+    assert get_by_email("ben@university.com") == other
+    assert [s.id for s in database.iter_students()] == [fresh_student.id, other.id]
+
+    # in-place update: same slot, file size unchanged
+    path = database._record_path()
+    size = path.stat().st_size
+    slot = database._store().slot_of(fresh_student.id)
+    fresh_student.remove_subject(fresh_student.subjects[0].id)
+    assert fresh_student.change_password("Abcde123", "Xyzab999")
+    upsert(fresh_student)
+    assert database._store().slot_of(fresh_student.id) == slot
+    assert path.stat().st_size == size
+    got = get(fresh_student.id)
+    assert got.to_dict() == fresh_student.to_dict()
+
+    # delete frees the slot; the next insert reuses it
+    freed = database._store().slot_of(other.id)
+    delete(other.id)
+    assert get(other.id) is None and get_by_email("ben@university.com") is None
+    cat = Student("Cat", "cat@university.com", "Abcde123")
+    upsert(cat)
+    assert database._store().slot_of(cat.id) == freed
+    assert [s.id for s in load()] == [fresh_student.id, cat.id]
+
+
+def test_record_store_grows_and_is_shared(tmp_path):
+    path = tmp_path / "s.rec"
+    a, b = RecordStore(path), RecordStore(path)          # two "processes"
+    students = [Student(f"G{i}", f"g{i}@university.com", "Abcde123") for i in range(150)]
+    a.upsert_many(students)
+    assert path.stat().st_size == _HEADER.size + 256 * _SLOT
+    assert len(b.load()) == 150                          # b re-maps + re-indexes
+    students[7].enrol()
+    a.upsert(students[7])
+    assert len(b.get(students[7].id).subjects) == 1
+    a.close(), b.close()
+
+
+def test_record_store_rejects_oversized_fields(tmp_path):
+    store = RecordStore(tmp_path / "s.rec")
+    ok = Student("Ok", "ok@university.com", "Abcde123")
+    long = Student("x" * 65, "long@university.com", "Abcde123")
+    with pytest.raises(ValueError):
+        store.apply_changes([ok, long], [])
+    assert store.load() == []                            # nothing half-written
+    store.close()
+
+
+def test_migrate_json_to_records(fresh_student):
+    fresh_student.enrol()
+    save([fresh_student])
+    assert database.migrate("records") == 1
+    database.configure("records")
+    try:
+        assert len(get(fresh_student.id).subjects) == 1
+    finally:
+        database.configure("json")
+        for store in database._stores.values():
+            store.close()
+        database._stores.clear()
+
+
+def test_register_rejects_fields_the_slot_cannot_hold(record_backend):
+    from controllers.student_controller import StudentController
+    ctrl = StudentController()
+    ok, reason = ctrl.register("x" * 65, "long@university.com", "Abcde123")
+    assert not ok and reason.startswith("Name")
+    assert ctrl.find("long@university.com") is None
+    ok, stu = ctrl.register("Short", "long@university.com", "Abcde123")
+    assert ok and get(stu.id) == stu
@@ -0,0 +1,70 @@
+# tests/test_report_export.py
+import csv
+import io
+import json
+
+import pytest
+
+from controllers.admin_controller import AdminController
+from data import database
+from data.database import iter_students, load, save, upsert, delete
+from models.student import Student
+
+
+def _students(n):
+    out = []
+    for i in range(n):
+        s = Student(f"S{i}", f"s{i}@university.com", "Abcde123")
+        for _ in range(i % 5):
+            s.enrol()
+        out.append(s)
+    return out
+
+
+def test_iter_students_streams_snapshot_plus_journal(monkeypatch):
+    monkeypatch.setattr(database, "_STREAM_CHUNK", 128)     # force many refills
+    students = _students(30)
+    save(students)
+    students[3].enrol()
+    upsert(students[3])
+    delete(students[7].id)
+    upsert(Student("Late", "late@university.com", "Abcde123"))
+
+    streamed = [s.to_dict() for s in iter_students()]
+    assert streamed == [s.to_dict() for s in load()]
+
+
+def test_iter_students_on_empty_database():
+    assert list(iter_students()) == []
+
+
+@pytest.mark.parametrize("view", ["students", "group", "partition"])
+def test_csv_export_has_average_and_grade(view):
+    students = _students(12)
+    save(students)
+    out = io.StringIO()
+    assert AdminController.export(view, "csv", out) == 12
+
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert [r["id"] for r in rows] == [s.id for s in students]
+    for row, stu in zip(rows, students):
+        assert float(row["average"]) == round(stu.average_mark, 2)
+        if view == "partition":
+            assert row["result"] == ("PASS" if stu.average_mark >= 50 else "FAIL")
+        assert row["grade"] == stu.overall_grade
+
+
+def test_jsonl_export_and_empty_csv_header():
+    save(_students(3))
+    out = io.StringIO()
+    AdminController.export("group", "jsonl", out)
+    first = json.loads(out.getvalue().splitlines()[0])
+    assert list(first) == ["grade", "id", "name", "email", "average"]
+
+    save([])
+    out = io.StringIO()
+    assert AdminController.export("students", "csv", out) == 0
+    assert out.getvalue() == "id,name,email,subjects,average,grade\n"
+
+    with pytest.raises(ValueError):
+        AdminController.export("nope", "csv", io.StringIO())
@@ -0,0 +1,119 @@
+# tests/test_service.py
+import asyncio
+import json
+import threading
+
+import pytest
+
+from data.database import load
+from service import client
+from service.client import Connection, RemoteAdminController, RemoteStudentController
+from service.daemon import Daemon
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """A daemon on a temp Unix socket, served from a background thread."""
+    sock = tmp_path / "uniapp.sock"
+    d = Daemon(flush_interval=3600, flush_every=1000)
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    stop = asyncio.Event()
+    thread = threading.Thread(
+        target=loop.run_until_complete,
+        args=(d.serve(sock, ready=ready, stop=stop),), daemon=True)
+    thread.start()
+    assert ready.wait(5)
+    yield d, str(sock)
+    loop.call_soon_threadsafe(stop.set)
+    thread.join(5)
+    loop.close()
+
+
+def test_thin_clients_share_one_copy_and_persist_in_batches(daemon):
+    d, sock = daemon
+    a, b = Connection(sock), Connection(sock)
+    students_a, students_b = RemoteStudentController(a), RemoteStudentController(b)
+
+    ok, ann = students_a.register("Ann", "ann@university.com", "Abcde123")
+    assert ok
+    ok, reason = students_b.register("Ann2", "ann@university.com", "Abcde123")
+    assert not ok and "exists" in reason           # b sees a's staged write
+
+    ok, same_ann = students_b.login("ann@university.com", "Abcde123")
+    ok1, sub = ann.enrol()
+    ok2, _ = same_ann.enrol()                      # concurrent clients, no lost update
+    assert ok1 and ok2
+    assert len(students_a.login("ann@university.com", "Abcde123")[1].subjects) == 2
+    assert load() == []                            # nothing written yet (batched)
+
+    admin = RemoteAdminController(b)
+    assert admin.count() == 1 and not admin.is_empty()
+    assert [s.id for s in admin.page()[0]] == [ann.id]
+    assert admin.counts()["total"] == 1
+
+    assert students_a.flush() == 1                 # checkpoint = one batch write
+    assert len(load()[0].subjects) == 2
+    a.close(), b.close()
+
+
+def test_malformed_requests_are_answered_not_fatal(daemon):
+    d, sock = daemon
+    conn = Connection(sock)
+    assert conn.call("frobnicate")["ok"] is False
+    conn._sock.sendall(b"not json\n")
+    assert "unparseable" in json.loads(conn._file.readline())["error"]
+    conn._sock.sendall(b'{"op": ["x"], "req": 0}\n')
+    assert json.loads(conn._file.readline())["ok"] is False
+
+    def broken(op):
+        raise RuntimeError("handler bug")
+    d.batch._handlers["counts"] = broken
+    res = conn.call("counts")
+    assert res["ok"] is False and "handler bug" in res["error"]
+
+    RemoteStudentController(conn).register("Ben", "ben@university.com", "Abcde123")
+    conn.close()
+    d.flush()
+    assert [s.email for s in load()] == ["ben@university.com"]
+
+
+def test_envelope_key_does_not_clash_with_payload_ids(daemon):
+    d, sock = daemon
+    conn = Connection(sock)
+    calls = []
+    real = conn.call
+    conn.call = lambda op, **kw: calls.append(op) or real(op, **kw)
+    ok, stu = RemoteStudentController(conn).register("Cy", "cy@university.com", "Abcde123")
+    assert calls == ["register"]                   # no extra round-trip
+    res = real("login", email="cy@university.com", password="Abcde123")
+    assert res["student"]["id"] == stu.id and len(stu.id) == 6
+    res = real("register", name="Di", email="di@university.com", password="Abcde123")
+    assert res["id"] == res["student"]["id"] and len(res["id"]) == 6   # not the request number
+    assert RemoteAdminController(conn).remove_student(stu.id)
+    assert not RemoteAdminController(conn).remove_student(stu.id)
+    conn.close()
+
+
+def test_factories_fall_back_to_local_controllers(monkeypatch):
+    monkeypatch.setattr(client, "_ADDRESS", None)
+    from controllers.student_controller import StudentController
+    assert isinstance(client.student_controller(), StudentController)
+    client.connect("/nonexistent.sock")
+    try:
+        with pytest.raises(client.ServiceError):
+            client.student_controller()
+    finally:
+        monkeypatch.setattr(client, "_ADDRESS", None)
+        monkeypatch.setattr(client, "_CONN", None)
+
+
+@pytest.mark.parametrize("mode", [["--import", "x.csv"], ["--batch", "-"],
+                                  ["--export", "students"]])
+def test_offline_modes_refuse_a_service_connection(monkeypatch, capsys, mode):
+    import cli
+    monkeypatch.setattr(client, "_ADDRESS", None)
+    monkeypatch.setattr(client, "_CONN", None)
+    with pytest.raises(SystemExit):
+        cli.main(["--connect", "/tmp/nowhere.sock", *mode])
+    assert mode[0] in capsys.readouterr().err
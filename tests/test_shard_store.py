@@ -0,0 +1,87 @@
+import pytest
+from data import database
+from data.database import load, save, get, upsert, delete
+from controllers.admin_controller import AdminController
+from models.student import Student
+
+
+@pytest.fixture
+def sharded(monkeypatch):
+    monkeypatch.setattr(database, "_BACKEND", "sharded")
+    monkeypatch.setattr(database, "_SHARDS", 4)
+    yield
+    database._stores.clear()
+
+
+def _students(n):
+    out = []
+    for i in range(n):
+        s = Student(f"S{i}", f"s{i}@university.com", "Abcde123")
+        s.enrol()
+        out.append(s)
+    return out
+
+
+def test_sharded_roundtrip_and_partial_writes(sharded):
+    students = _students(20)
+    save(students)
+    store = database._store()
+    assert sorted(s.id for s in load()) == sorted(s.id for s in students)
+
+    # one changed student → only its shard is rewritten
+    students[0].enrol()
+    assert store.save(students) == 1
+    assert store.save(students) == 0
+
+    upsert(Student("New", "new@university.com", "Abcde123"))
+    delete(students[1].id)
+    assert get(students[1].id) is None
+    assert len(get(students[0].id).subjects) == 2
+    assert len(load()) == 20
+    assert sorted(s.id for s in database.iter_students()) == sorted(s.id for s in load())
+
+
+def test_admin_summary_map_reduces_over_shards(sharded, monkeypatch):
+    from data import shard_store
+    monkeypatch.setattr(shard_store, "_PARALLEL_MIN_BYTES", 0)   # use the pool
+    students = _students(12)
+    save(students)
+    assert len(load()) == 12
+
+    summary = AdminController().summary()
+    expected = AdminController.summarise(students)
+    assert summary["counts"] == expected["counts"]
+    assert sorted(s.id for s in summary["pass_fail"]["PASS"]) == \
+           sorted(s.id for s in expected["pass_fail"]["PASS"])
+
+
+def test_admin_counts_never_load_the_whole_population(sharded, monkeypatch):
+    from controllers import admin_controller
+    students = _students(12)
+    save(students)
+
+    def no_full_load(*a, **k):
+        raise AssertionError("sharded admin query loaded every student")
+    monkeypatch.setattr(admin_controller, "cached_load", no_full_load)
+    monkeypatch.setattr(database, "load", no_full_load)
+
+    admin = AdminController()
+    admin.refresh()
+    assert admin.counts() == AdminController.summarise(students)["counts"]
+    assert admin.count() == 12 and not admin.is_empty()
+    assert admin.distribution()["histogram"] == \
+           AdminController.distribution_of(students)["histogram"]
+    assert admin.remove_student(students[0].id)
+    assert not admin.remove_student(students[0].id)
+    assert admin.count() == 11
+
+
+def test_migrate_json_to_shards(fresh_student):
+    save([fresh_student])
+    assert database.migrate("sharded") == 1
+    database.configure("sharded", shards=database._SHARDS)
+    try:
+        assert load() == [fresh_student]
+    finally:
+        database.configure("json")
+        database._stores.clear()
@@ -0,0 +1,62 @@
+import pytest
+from data import database
+from data.database import load, save, get, get_by_email, upsert, delete
+from models.student import Student
+
+
+@pytest.fixture
+def sqlite_backend(monkeypatch):
+    monkeypatch.setattr(database, "_BACKEND", "sqlite")
+    yield
+    for store in database._stores.values():
+        store.close()
+    database._stores.clear()
+
+
+def test_sqlite_roundtrip_and_record_api(sqlite_backend, fresh_student):
+    other = Student("Ben", "ben@university.com", "Abcde123")
+    for _ in range(3):
+        fresh_student.enrol()
+    save([fresh_student, other])
+
+    assert [s.id for s in load()] == [fresh_student.id, other.id]
+    got = get(fresh_student.id)
+    assert [s.to_dict() for s in got.subjects] == \
+           [s.to_dict() for s in fresh_student.subjects]
+    assert get_by_email("ben@university.com") == other
+    streamed = list(database._store().iter_students(page=1))
+    assert [s.id for s in streamed] == sorted([fresh_student.id, other.id])
+    assert {s.id: s.to_dict() for s in streamed} == \
+           {s.id: s.to_dict() for s in load()}
+
+    fresh_student.remove_subject(fresh_student.subjects[0].id)
+    upsert(fresh_student)
+    assert len(get(fresh_student.id).subjects) == 2
+
+    delete(other.id)
+    assert get(other.id) is None
+    assert [s.id for s in load()] == [fresh_student.id]
+
+
+def test_migrate_json_to_sqlite(fresh_student):
+    fresh_student.enrol()
+    save([fresh_student])
+    extra = Student("Cat", "cat@university.com", "Abcde123")
+    upsert(extra)                          # lives only in the journal
+
+    assert database.migrate_to_sqlite() == 2
+
+    database.configure("sqlite")
+    try:
+        assert load() == [fresh_student, extra]
+        assert len(get(fresh_student.id).subjects) == 1
+    finally:
+        database.configure("json")
+        for store in database._stores.values():
+            store.close()
+        database._stores.clear()
+
+
+def test_configure_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        database.configure("csv")
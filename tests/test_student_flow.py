@@ -21,6 +21,133 @@ def test_enrol_and_persist(fresh_student):
     assert abs(reloaded.average_mark - fresh_student.average_mark) < 1e-6
 
 
+def test_stats_follow_in_place_subject_edits(fresh_student):
+    fresh_student.enrol()
+    sub = fresh_student.subjects[0]
+    sub.mark = 98
+    sub.recalculate_grade()
+    assert fresh_student.average_mark == 98.0 and fresh_student.overall_grade == "HD"
+    sub.mark = 10
+    sub.recalculate_grade()
+    assert fresh_student.average_mark == 10.0 and fresh_student.overall_grade == "Z"
+
+
+def test_subject_edit_only_invalidates_its_own_student(fresh_student):
+    other = Student("Bea", "bea@university.com", "Abcde123")
+    fresh_student.enrol()
+    other.enrol()
+    cached = fresh_student._stats()
+    other.subjects[0].mark = 60
+    other.subjects[0].recalculate_grade()
+    assert fresh_student._stats() is cached         # untouched student keeps its cache
+    assert other.average_mark == 60.0
+
+
 def test_change_password(fresh_student):
     assert fresh_student.change_password("Abcde123", "Xyzab999")
     assert not fresh_student.change_password("badOld", "Xyzab999")
+
+
+def test_login_and_register_use_email_index(monkeypatch):
+    from controllers import student_controller
+    from controllers.student_controller import StudentController
+
+    ctrl = StudentController()
+    ok, stu = ctrl.register("Ann", "ann@university.com", "Abcde123")
+    assert ok
+    ok, msg = ctrl.register("Ann2", "ann@university.com", "Abcde123")
+    assert not ok and "exists" in msg
+
+    # own write must not force a reload on the next login
+    calls = []
+    monkeypatch.setattr(student_controller, "load",
+                        lambda lazy=False: calls.append(1) or load(lazy))
+    assert ctrl.login("ann@university.com", "Abcde123") == (True, stu)
+    assert not ctrl.login("ann@university.com", "wrong")[0]
+    assert calls == []
+
+    # an external writer changes the files → ONE indexed lookup, no reload
+    other = StudentController()
+    other.register("Ben", "ben@university.com", "Abcde123")
+    calls.clear()
+    assert ctrl.login("ben@university.com", "Abcde123")[0]
+    assert calls == []
+
+    assert ctrl.remove(stu.id)
+    assert not ctrl.login("ann@university.com", "Abcde123")[0]
+    ctrl.clear()
+    assert load() == []
+
+
+def test_login_after_external_writes_reads_only_the_journal_tail():
+    from controllers.student_controller import StudentController
+    from utils import metrics
+
+    ctrl, other = StudentController(), StudentController()
+    for i in range(20):
+        other.register(f"S{i}", f"s{i}@university.com", "Abcde123")
+    assert ctrl.login("s3@university.com", "Abcde123")[0]
+
+    ok, late = other.register("Late", "late@university.com", "Abcde123")
+    before = metrics.snapshot()["counters"]
+    assert ctrl.login("late@university.com", "Abcde123") == (True, late)
+    after = metrics.snapshot()["counters"]
+    assert after["database.journal_entries_replayed"] - \
+           before.get("database.journal_entries_replayed", 0) == 1
+    assert [s.email for s in ctrl.students] == ["s3@university.com", "late@university.com"]
+
+    assert other.remove(late.id)
+    assert not ctrl.login("late@university.com", "Abcde123")[0]
+    assert ctrl.remove(ctrl.find("s3@university.com").id)
+    assert [s.email for s in ctrl.students] == []
+
+
+def test_register_many_streams_chunks(tmp_path, monkeypatch):
+    from controllers import student_controller
+    from controllers.student_controller import StudentController
+    from utils.bulk_import import iter_rows
+
+    src = tmp_path / "cohort.csv"
+    src.write_text(
+        "name,email,password\n"
+        "Ann,ann@university.com,Abcde123\n"
+        "Ben,ben@university.com,Abcde123\n"
+        "Dup,ann@university.com,Abcde123\n"     # duplicate within file
+        "Bad,bad@uni.com,Abcde123\n"            # invalid email
+        "Cat,cat@university.com,weak\n"         # invalid password
+        "Dan,dan@university.com,Abcde123\n"
+    )
+    writes = []
+    real = student_controller.apply_changes
+    monkeypatch.setattr(student_controller, "apply_changes",
+                        lambda ups, dels: writes.append(len(ups)) or real(ups, dels))
+
+    report = StudentController().register_many(iter_rows(src), chunk_size=3)
+
+    assert report["imported"] == 3
+    assert [line for line, _ in report["errors"]] == [4, 5, 6]
+    assert writes == [2, 1]                      # one write per chunk
+    assert sorted(s.email for s in load()) == \
+           ["ann@university.com", "ben@university.com", "dan@university.com"]
+
+
+def test_register_many_reports_malformed_jsonl_lines(tmp_path):
+    from controllers.student_controller import StudentController
+    from utils.bulk_import import iter_rows
+
+    src = tmp_path / "cohort.jsonl"
+    src.write_text(
+        '{"name": "Ann", "email": "ann@university.com", "password": "Abcde123"}\n'
+        '[1, 2]\n'
+        '{"name": "Ben", "email": \n'
+        '{"name": 7, "email": "x@university.com", "password": "Abcde123"}\n'
+        '{"name": "Dan", "email": "dan@university.com", "password": "Abcde123"}\n'
+    )
+    report = StudentController().register_many(iter_rows(src))
+
+    assert report["imported"] == 2
+    errors = dict(report["errors"])
+    assert sorted(errors) == [2, 3, 4]
+    assert "object" in errors[2]
+    assert errors[3].startswith("Invalid JSON")
+    assert "text" in errors[4]
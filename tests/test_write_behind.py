@@ -0,0 +1,47 @@
+# tests/test_write_behind.py
+import threading
+
+import pytest
+
+from controllers.student_controller import StudentController
+from controllers.write_behind import WriteBehind
+from data.database import load
+
+
+def test_bursts_coalesce_into_one_background_write(fresh_student):
+    writes, done = [], threading.Event()
+    wb = WriteBehind(lambda batch: (writes.append([s.id for s in batch]), done.set()),
+                     delay=0.05)
+    for _ in range(3):
+        with wb.lock:
+            fresh_student.enrol()
+        wb.mark(fresh_student)                # returns immediately
+
+    assert done.wait(2)
+    assert writes == [[fresh_student.id]]     # three changes, one write
+    assert not wb.dirty
+    assert wb.close() == 0                    # clean → nothing written on exit
+    assert len(writes) == 1
+
+
+def test_flush_on_logout_persists_and_reports_failures(fresh_student):
+    ctrl = StudentController()
+    ctrl.register(fresh_student.name, "wb@university.com", "Abcde123")
+    ok, stu = ctrl.login("wb@university.com", "Abcde123")
+
+    wb = WriteBehind(ctrl.persist_many, delay=60)    # never fires on its own
+    stu.enrol()
+    wb.mark(stu)
+    assert wb.flush() == 1
+    assert len(next(s for s in load() if s.id == stu.id).subjects) == 1
+    wb.close()
+
+    def broken(batch):
+        raise OSError("disk full")
+    wb = WriteBehind(broken, delay=60)
+    wb.mark(stu)
+    with pytest.raises(OSError):
+        wb.flush()
+    assert wb.dirty                           # still pending for a retry
+    wb._write = lambda batch: None
+    assert wb.close() == 1
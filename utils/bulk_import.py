@@ -0,0 +1,63 @@
+"""
+utils/bulk_import.py
+────────────────────
+Streaming readers for cohort import files.
+
+• `.csv`   → header row with name,email,password
+• `.jsonl` → one {"name", "email", "password"} object per line
+• Rows are yielded one at a time as (line_no, dict) so callers can
+  report errors against the source line without holding the file.
+  A JSONL line that is not a JSON object is yielded as
+  (line_no, BadRow(reason)) instead.
+"""
+
+from __future__ import annotations
+import csv
+import json
+import pathlib
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class BadRow:
+    """Placeholder for a source line that could not be read as a row."""
+
+    __slots__ = ("reason",)
+
+    def __init__(self, reason: str) -> None:
+        self.reason = reason
+
+    def __repr__(self) -> str:
+        return f"BadRow({self.reason!r})"
+
+
+def iter_rows(path: str | pathlib.Path) -> Iterator[Tuple[int, dict | BadRow]]:
+    """Yield (line_no, row) from a CSV or JSONL file."""
+    path = pathlib.Path(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.suffix.lower() == ".csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+        else:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as exc:
+                    yield line_no, BadRow(f"Invalid JSON: {exc}.")
+                    continue
+                if not isinstance(row, dict):
+                    yield line_no, BadRow("Expected a JSON object.")
+                    continue
+                yield line_no, row
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split an iterable into lists of at most *size* items."""
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
@@ -0,0 +1,80 @@
+"""
+utils/id_allocator.py
+─────────────────────
+Collision-free allocation of fixed-width numeric IDs.
+
+• One byte per possible ID (1 MB for the 6-digit student space), so
+  reserve / release / membership are O(1).
+• Allocation draws a few random probes (IDs stay unpredictable while the
+  space is sparse) and then falls back to a C-speed `bytearray.find`
+  scan from a moving cursor, so it stays bounded even near capacity.
+• Raises `IdSpaceExhausted` instead of silently handing out duplicates.
+"""
+
+from __future__ import annotations
+import random
+
+_RANDOM_PROBES = 8
+
+
+class IdSpaceExhausted(RuntimeError):
+    """Every ID in the allocator's range is already taken."""
+
+
+class IdAllocator:
+    """Hands out unique zero-padded IDs in 1 … capacity."""
+
+    def __init__(self, capacity: int, width: int) -> None:
+        self.capacity = capacity
+        self.width = width
+        self._used = bytearray(capacity + 1)
+        self._used[0] = 1                  # 0 is never issued
+        self._free = capacity
+        self._cursor = 1
+
+    # ── bookkeeping ---------------------------------------------
+    def _code(self, sid: str) -> int:
+        return int(sid) if sid.isdigit() and 0 < int(sid) <= self.capacity else 0
+
+    def reserve(self, sid: str) -> None:
+        """Mark an existing ID (e.g. loaded from disk) as taken."""
+        code = self._code(sid)
+        if code and not self._used[code]:
+            self._used[code] = 1
+            self._free -= 1
+
+    def release(self, sid: str) -> None:
+        """Return an ID to the pool (student deleted)."""
+        code = self._code(sid)
+        if code and self._used[code]:
+            self._used[code] = 0
+            self._free += 1
+
+    def __contains__(self, sid: str) -> bool:
+        code = self._code(sid)
+        return bool(code and self._used[code])
+
+    @property
+    def fill_ratio(self) -> float:
+        return 1 - self._free / self.capacity
+
+    # ── allocation ----------------------------------------------
+    def allocate(self) -> str:
+        """Return a fresh ID that is not currently reserved."""
+        if self._free == 0:
+            raise IdSpaceExhausted(f"all {self.capacity} IDs are in use")
+
+        used = self._used
+        for _ in range(_RANDOM_PROBES):
+            code = random.randint(1, self.capacity)
+            if not used[code]:
+                break
+        else:
+            code = used.find(0, self._cursor)
+            if code == -1:
+                code = used.find(0, 1)
+            self._cursor = code + 1
+
+        used[code] = 1
+        self._free -= 1
+        return f"{code:0{self.width}d}"
@@ -0,0 +1,129 @@
+"""
+utils/metrics.py
+────────────────
+In-process operational metrics for the persistence layer and controllers.
+
+• Counters   – loads, saves, bytes read / written, entries parsed …
+• Latencies  – per-operation histograms with power-of-two µs buckets.
+• `dump()` merges this process's numbers into a JSON metrics file
+  (`UNIAPP_METRICS_FILE`, default data/metrics.json), so totals
+  accumulate across sessions.  `cli.py --stats` prints + dumps on exit;
+  setting `UNIAPP_METRICS_FILE` alone dumps on exit as well.
+"""
+
+from __future__ import annotations
+import os
+import json
+import time
+import atexit
+import pathlib
+import functools
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+_BUCKETS = 32                       # bucket k holds latencies < 2**k µs
+
+_counters: Dict[str, int] = defaultdict(int)
+_latency: Dict[str, List[int]] = {}
+_totals: Dict[str, float] = defaultdict(float)
+
+DEFAULT_FILE = pathlib.Path(__file__).resolve().parents[1] / "data" / "metrics.json"
+
+
+# ── recording ─────────────────────────────────────────────────
+def incr(name: str, n: int = 1) -> None:
+    _counters[name] += n
+
+
+def observe(name: str, seconds: float) -> None:
+    """Record one latency sample for *name*."""
+    buckets = _latency.get(name)
+    if buckets is None:
+        buckets = _latency[name] = [0] * _BUCKETS
+    buckets[min(int(seconds * 1e6).bit_length(), _BUCKETS - 1)] += 1
+    _totals[name] += seconds
+
+
+def timed(name: str) -> Callable:
+    """Decorator: record the wall time of every call under *name*."""
+    def wrap(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def run(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                observe(name, time.perf_counter() - start)
+        return run
+    return wrap
+
+
+# ── reporting ─────────────────────────────────────────────────
+def snapshot() -> dict:
+    """Counters + latency histograms recorded by this process."""
+    return {
+        "counters": dict(_counters),
+        "latency": {
+            name: {"count": sum(b), "total_s": _totals[name], "buckets_us": b}
+            for name, b in _latency.items()
+        },
+    }
+
+
+def _merge(old: dict, new: dict) -> dict:
+    merged = {"counters": dict(old.get("counters", {})),
+              "latency": {k: dict(v) for k, v in old.get("latency", {}).items()}}
+    for k, v in new["counters"].items():
+        merged["counters"][k] = merged["counters"].get(k, 0) + v
+    for k, v in new["latency"].items():
+        cur = merged["latency"].setdefault(
+            k, {"count": 0, "total_s": 0.0, "buckets_us": [0] * _BUCKETS})
+        cur["count"] += v["count"]
+        cur["total_s"] += v["total_s"]
+        cur["buckets_us"] = [a + b for a, b in zip(cur["buckets_us"], v["buckets_us"])]
+    return merged
+
+
+def dump(path: Optional[os.PathLike] = None) -> pathlib.Path:
+    """Add this process's metrics to the metrics file, then reset them."""
+    path = pathlib.Path(path or os.environ.get("UNIAPP_METRICS_FILE") or DEFAULT_FILE)
+    old = json.loads(path.read_text()) if path.exists() else {}
+    merged = _merge(old, snapshot())
+    merged["updated"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+    path.write_text(json.dumps(merged, indent=2))
+    reset()
+    return path
+
+
+def reset() -> None:
+    _counters.clear()
+    _latency.clear()
+    _totals.clear()
+
+
+def report() -> str:
+    """Human-readable summary of this process's metrics."""
+    snap = snapshot()
+    lines = ["── counters ──"]
+    lines += [f"{k:<36}{v:>14,}" for k, v in sorted(snap["counters"].items())]
+    lines.append("── latency ──")
+    lines.append(f"{'operation':<36}{'calls':>8}{'avg ms':>10}{'p50 ≤ ms':>10}{'max ≤ ms':>10}")
+    for name, h in sorted(snap["latency"].items()):
+        b = h["buckets_us"]
+        lines.append(f"{name:<36}{h['count']:>8}{h['total_s'] / h['count'] * 1e3:>10.3f}"
+                     f"{_bound_ms(b, 0.5):>10.3f}{_bound_ms(b, 1.0):>10.3f}")
+    return "\n".join(lines)
+
+
+def _bound_ms(buckets: List[int], q: float) -> float:
+    """Upper bucket bound (ms) below which a fraction *q* of samples fall."""
+    target, seen = q * sum(buckets), 0
+    for k, n in enumerate(buckets):
+        seen += n
+        if n and seen >= target:
+            return (2 ** k) / 1e3
+    return 0.0
+
+
+if os.environ.get("UNIAPP_METRICS_FILE"):
+    atexit.register(dump)
@@ -0,0 +1,96 @@
+"""
+utils/profiling.py
+──────────────────
+Opt-in per-action profiling for the CLI and GUI.
+
+• Enabled by `UNIAPP_PROFILE_DIR=<dir>` or `cli.py --profile <dir>`.
+• Each captured action writes `<dir>/<action>-<timestamp>.prof`
+  (cProfile – open with pstats / snakeviz) and a matching `.txt`
+  summary: tracemalloc peak, top allocation sites, top functions.
+• When disabled, `capture()` hands back one shared no-op context and
+  `profiled()` returns the function untouched – no profiler, no
+  tracemalloc, no wrapper.
+"""
+
+from __future__ import annotations
+import os
+import re
+import time
+import pstats
+import cProfile
+import pathlib
+import tracemalloc
+import functools
+import contextlib
+from typing import Callable, Optional
+
+_TOP_ALLOCATIONS = 25
+_UNSAFE = re.compile(r"[^\w-]")      # keep file names portable
+
+_profile_dir: Optional[pathlib.Path] = None
+_active = False                     # cProfile cannot nest; inner captures no-op
+_NULL = contextlib.nullcontext()
+
+
+def enable(directory: str | os.PathLike) -> pathlib.Path:
+    """Turn profiling on for this process; profiles go to *directory*."""
+    global _profile_dir
+    _profile_dir = pathlib.Path(directory)
+    _profile_dir.mkdir(parents=True, exist_ok=True)
+    return _profile_dir
+
+
+def enabled() -> bool:
+    return _profile_dir is not None
+
+
+@contextlib.contextmanager
+def _capture(name: str):
+    global _active
+    _active = True
+    stamp = f"{time.strftime('%Y%m%d-%H%M%S')}-{time.perf_counter_ns() % 10**6:06d}"
+    stem = _profile_dir / f"{_UNSAFE.sub('_', name)}-{stamp}"
+    prof = cProfile.Profile()
+    tracemalloc.start()
+    prof.enable()
+    try:
+        yield
+    finally:
+        prof.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        _active = False
+
+        prof.dump_stats(f"{stem}.prof")
+        with open(f"{stem}.txt", "w") as f:
+            f.write(f"action: {name}\ncurrent: {current} B\npeak: {peak} B\n\n")
+            for stat in snapshot.statistics("lineno")[:_TOP_ALLOCATIONS]:
+                f.write(f"{stat}\n")
+            f.write("\n")
+            pstats.Stats(prof, stream=f).sort_stats("cumulative").print_stats(20)
+
+
+def capture(name: str):
+    """`with capture("admin-g"): ...` – profile the block if profiling is on."""
+    if _profile_dir is None or _active:
+        return _NULL
+    return _capture(name)
+
+
+def profiled(name: str) -> Callable:
+    """Decorator form of `capture()`; decided once, at definition time."""
+    def wrap(fn: Callable) -> Callable:
+        if _profile_dir is None:
+            return fn
+
+        @functools.wraps(fn)
+        def run(*args, **kwargs):
+            with capture(name):
+                return fn(*args, **kwargs)
+        return run
+    return wrap
+
+
+if os.environ.get("UNIAPP_PROFILE_DIR"):
+    enable(os.environ["UNIAPP_PROFILE_DIR"])
@@ -0,0 +1,80 @@
+"""
+utils/report_export.py
+──────────────────────
+Streaming report export (`cli.py --export VIEW`).
+
+• A generator pipeline: students → row dicts → encoded lines → sink.
+  Each stage holds ONE student, so memory is flat for any population.
+• Views: `students` (full listing), `group` (row per student tagged with
+  its overall grade) and `partition` (tagged PASS / FAIL).
+• Formats: `csv` (header + rows) or `jsonl` (one object per line).
+"""
+
+from __future__ import annotations
+import csv
+import io
+import json
+from typing import Dict, Iterable, Iterator, List, TextIO
+
+from models.student import Student
+
+# column order per view
+VIEWS: Dict[str, List[str]] = {
+    "students": ["id", "name", "email", "subjects", "average", "grade"],
+    "group": ["grade", "id", "name", "email", "average"],
+    "partition": ["result", "id", "name", "email", "average", "grade"],
+}
+FORMATS = ("csv", "jsonl")
+
+
+def rows(students: Iterable[Student], view: str) -> Iterator[dict]:
+    """One flat row dict per student for the given view."""
+    fields = VIEWS[view]
+    for stu in students:
+        avg = stu.average_mark
+        row = {"id": stu.id, "name": stu.name, "email": stu.email,
+               "subjects": len(stu.marks), "average": round(avg, 2),
+               "grade": stu.overall_grade,
+               "result": "PASS" if avg >= 50 else "FAIL"}
+        yield {k: row[k] for k in fields}
+
+
+def csv_lines(records: Iterable[dict], fields: List[str]) -> Iterator[str]:
+    """Header, then one CSV-encoded line per row."""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=fields, lineterminator="\n")
+    writer.writeheader()
+    for record in records:
+        writer.writerow(record)
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+    if buf.tell():                       # header of an empty export
+        yield buf.getvalue()
+
+
+def jsonl_lines(records: Iterable[dict]) -> Iterator[str]:
+    for record in records:
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def export(students: Iterable[Student], view: str, fmt: str, out: TextIO) -> int:
+    """Stream `students` as `view` rows in `fmt` to `out`; returns #rows."""
+    if view not in VIEWS:
+        raise ValueError(f"Unknown view {view!r}; expected one of {tuple(VIEWS)}")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}; expected one of {FORMATS}")
+
+    count = 0
+
+    def counted(it: Iterator[dict]) -> Iterator[dict]:
+        nonlocal count
+        for record in it:
+            count += 1
+            yield record
+
+    records = counted(rows(students, view))
+    lines = csv_lines(records, VIEWS[view]) if fmt == "csv" else jsonl_lines(records)
+    for line in lines:
+        out.write(line)
+    return count
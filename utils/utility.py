@@ -7,6 +7,8 @@ Keeps regex logic in ONE place so controllers & models stay clean.
 
 import re
 import random
+from typing import Iterable
+from utils.id_allocator import IdAllocator
 
 # ── Regular-expression patterns ──────────────────────────────
 _EMAIL_RE = re.compile(r"^[\w\.]+@university\.com$")
@@ -29,10 +31,26 @@ def validate_password(pwd: str) -> bool:
     )
 
 # ── ID generators ────────────────────────────────────────────
+# Every student ID seen by this process (loaded or issued) is reserved
+# here, so new IDs never collide with existing records.
+_STUDENT_IDS = IdAllocator(999_999, 6)
+
 def generate_student_id() -> str:
-    """Six-digit zero-padded student ID (000001-999999)."""
-    return f"{random.randint(1, 999_999):06d}"
+    """Six-digit zero-padded student ID (000001-999999), unique in this process."""
+    return _STUDENT_IDS.allocate()
+
+def reserve_student_id(sid: str) -> None:
+    """Record an ID that already exists (called while loading the database)."""
+    _STUDENT_IDS.reserve(sid)
+
+def release_student_id(sid: str) -> None:
+    """Make a deleted student's ID available again."""
+    _STUDENT_IDS.release(sid)
 
-def generate_subject_id() -> str:
-    """Three-digit zero-padded subject ID (001-999)."""
-    return f"{random.randint(1, 999):03d}"
+def generate_subject_id(taken: Iterable[str] = ()) -> str:
+    """Three-digit zero-padded subject ID (001-999) not already in *taken*."""
+    taken = set(taken)
+    while True:
+        sid = f"{random.randint(1, 999):03d}"
+        if sid not in taken:
+            return sid